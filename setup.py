@@ -4,7 +4,7 @@ Setup configuration for forest-change-framework.
 This file configures the package for distribution and installation.
 """
 
-from setuptools import setup, find_packages
+from setuptools import Extension, setup, find_packages
 
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
@@ -20,6 +20,21 @@ setup(
     url="https://github.com/bitwiseops/forest-change-framework",
     packages=find_packages(where="src"),
     package_dir={"": "src"},
+    ext_modules=[
+        # Optional accelerator; helpers.deep_merge falls back to Python if the
+        # build fails or no compiler is available
+        Extension(
+            "forest_change_framework.utils._deepops",
+            ["src/forest_change_framework/utils/_deepops.c"],
+            optional=True,
+        ),
+        # Optional accelerator; the AOI sampler statistics fall back to NumPy
+        Extension(
+            "forest_change_framework.components.analysis.aoi_sampler._maskcount",
+            ["src/forest_change_framework/components/analysis/aoi_sampler/_maskcount.c"],
+            optional=True,
+        ),
+    ],
     classifiers=[
         "Programming Language :: Python :: 3",
         "Programming Language :: Python :: 3.8",
@@ -44,6 +59,7 @@ setup(
         "dev": [
             "pytest>=7.0",
             "pytest-cov>=4.0",
+            "pytest-xdist>=3.0",
             "black>=23.0",
             "mypy>=1.0",
             "flake8>=6.0",
@@ -0,0 +1,239 @@
+/*
+ * C implementation of the AOI sampler's datamask/lossyear pixel counts.
+ *
+ * Counts are taken straight from the uint8 band buffers in one pass, without
+ * the boolean temporaries the NumPy fallback allocates. A pixel is valid when
+ * its datamask byte is exactly 1 (Hansen marks water as 2), and a loss pixel
+ * is a valid pixel whose lossyear byte is non-zero. The count loops are plain
+ * byte compares that the compiler vectorises; blocks of 255 pixels are summed
+ * into 8-bit lanes before being widened, so no lane can overflow. The per-year
+ * loss histogram is built in a single pass as well.
+ */
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <stdint.h>
+
+/* Largest block whose per-lane byte sums cannot exceed 255 */
+#define BLOCK 255
+
+static int
+get_byte_buffer(PyObject *obj, Py_buffer *view, const char *name)
+{
+    if (PyObject_GetBuffer(obj, view, PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) < 0) {
+        return -1;
+    }
+    if (view->itemsize != 1 || (view->format != NULL && strcmp(view->format, "B") != 0)) {
+        PyErr_Format(PyExc_TypeError, "%s must be a contiguous uint8 buffer", name);
+        PyBuffer_Release(view);
+        return -1;
+    }
+    return 0;
+}
+
+static Py_ssize_t
+count_valid(const uint8_t *mask, Py_ssize_t n)
+{
+    Py_ssize_t total = 0, i = 0;
+
+    while (i < n) {
+        Py_ssize_t end = n - i < BLOCK ? n : i + BLOCK;
+        uint8_t block = 0;
+        for (; i < end; i++) {
+            block += mask[i] == 1;
+        }
+        total += block;
+    }
+    return total;
+}
+
+static void
+count_valid_and_loss(const uint8_t *loss, const uint8_t *mask, Py_ssize_t n,
+                     Py_ssize_t *valid, Py_ssize_t *lost)
+{
+    Py_ssize_t valid_total = 0, loss_total = 0, i = 0;
+
+    while (i < n) {
+        Py_ssize_t end = n - i < BLOCK ? n : i + BLOCK;
+        uint8_t valid_block = 0, loss_block = 0;
+        for (; i < end; i++) {
+            uint8_t is_valid = mask[i] == 1;
+            valid_block += is_valid;
+            loss_block += is_valid & (loss[i] != 0);
+        }
+        valid_total += valid_block;
+        loss_total += loss_block;
+    }
+    *valid = valid_total;
+    *lost = loss_total;
+}
+
+/*
+ * Histogram of lossyear values over valid pixels. Invalid pixels are routed
+ * to the upper half of each table by setting bit 8 of the bin index, so the
+ * loop has no data-dependent branches, and four interleaved tables keep
+ * consecutive equal values from stalling on one counter.
+ */
+#define BIN(k) (loss[k] | (unsigned int)(mask[k] != 1) << 8)
+
+static void
+count_loss_years(const uint8_t *loss, const uint8_t *mask, Py_ssize_t n,
+                 Py_ssize_t *counts)
+{
+    Py_ssize_t tables[4][512];
+    Py_ssize_t i;
+    int value;
+
+    memset(tables, 0, sizeof(tables));
+    for (i = 0; i + 4 <= n; i += 4) {
+        tables[0][BIN(i)]++;
+        tables[1][BIN(i + 1)]++;
+        tables[2][BIN(i + 2)]++;
+        tables[3][BIN(i + 3)]++;
+    }
+    for (; i < n; i++) {
+        tables[0][BIN(i)]++;
+    }
+    for (value = 0; value < 256; value++) {
+        counts[value] = tables[0][value] + tables[1][value] + tables[2][value]
+                        + tables[3][value];
+    }
+}
+
+#undef BIN
+
+static int
+get_band_pair(PyObject *const *args, Py_buffer *loss_view, Py_buffer *mask_view)
+{
+    if (get_byte_buffer(args[0], loss_view, "lossyear") < 0) {
+        return -1;
+    }
+    if (get_byte_buffer(args[1], mask_view, "datamask") < 0) {
+        PyBuffer_Release(loss_view);
+        return -1;
+    }
+    if (loss_view->len != mask_view->len) {
+        PyErr_SetString(PyExc_ValueError, "lossyear and datamask must have the same size");
+        PyBuffer_Release(loss_view);
+        PyBuffer_Release(mask_view);
+        return -1;
+    }
+    return 0;
+}
+
+static PyObject *
+maskcount_count_valid(PyObject *module, PyObject *datamask)
+{
+    Py_buffer view;
+    Py_ssize_t valid;
+
+    if (get_byte_buffer(datamask, &view, "datamask") < 0) {
+        return NULL;
+    }
+    Py_BEGIN_ALLOW_THREADS
+    valid = count_valid(view.buf, view.len);
+    Py_END_ALLOW_THREADS
+    PyBuffer_Release(&view);
+    return PyLong_FromSsize_t(valid);
+}
+
+static PyObject *
+maskcount_count_valid_and_loss(PyObject *module, PyObject *const *args, Py_ssize_t nargs)
+{
+    Py_buffer loss_view, mask_view;
+    Py_ssize_t valid, lost;
+
+    if (nargs != 2) {
+        PyErr_Format(PyExc_TypeError, "count_valid_and_loss expected 2 arguments, got %zd",
+                     nargs);
+        return NULL;
+    }
+    if (get_band_pair(args, &loss_view, &mask_view) < 0) {
+        return NULL;
+    }
+
+    Py_BEGIN_ALLOW_THREADS
+    count_valid_and_loss(loss_view.buf, mask_view.buf, mask_view.len, &valid, &lost);
+    Py_END_ALLOW_THREADS
+    PyBuffer_Release(&loss_view);
+    PyBuffer_Release(&mask_view);
+    return Py_BuildValue("(nn)", valid, lost);
+}
+
+static PyObject *
+maskcount_count_loss_years(PyObject *module, PyObject *const *args, Py_ssize_t nargs)
+{
+    Py_buffer loss_view, mask_view;
+    Py_ssize_t counts[256], valid = 0, max_value, value;
+    PyObject *result;
+
+    if (nargs != 3) {
+        PyErr_Format(PyExc_TypeError, "count_loss_years expected 3 arguments, got %zd",
+                     nargs);
+        return NULL;
+    }
+    max_value = PyLong_AsSsize_t(args[2]);
+    if (max_value == -1 && PyErr_Occurred()) {
+        return NULL;
+    }
+    if (max_value < 0 || max_value > 255) {
+        PyErr_SetString(PyExc_ValueError, "max_value must be between 0 and 255");
+        return NULL;
+    }
+    if (get_band_pair(args, &loss_view, &mask_view) < 0) {
+        return NULL;
+    }
+
+    Py_BEGIN_ALLOW_THREADS
+    count_loss_years(loss_view.buf, mask_view.buf, mask_view.len, counts);
+    Py_END_ALLOW_THREADS
+    PyBuffer_Release(&loss_view);
+    PyBuffer_Release(&mask_view);
+
+    result = PyList_New(max_value + 1);
+    if (result == NULL) {
+        return NULL;
+    }
+    for (value = 0; value < 256; value++) {
+        valid += counts[value];
+    }
+    for (value = 0; value <= max_value; value++) {
+        PyObject *count = PyLong_FromSsize_t(counts[value]);
+        if (count == NULL) {
+            Py_DECREF(result);
+            return NULL;
+        }
+        PyList_SET_ITEM(result, value, count);
+    }
+    return Py_BuildValue("(nN)", valid, result);
+}
+
+static PyMethodDef maskcount_methods[] = {
+    {"count_valid", maskcount_count_valid, METH_O,
+     "count_valid(datamask)\n--\n\n"
+     "Return the number of datamask bytes equal to 1."},
+    {"count_valid_and_loss", (PyCFunction)(void (*)(void))maskcount_count_valid_and_loss,
+     METH_FASTCALL,
+     "count_valid_and_loss(lossyear, datamask)\n--\n\n"
+     "Return (valid_count, loss_count) for two equally sized uint8 buffers."},
+    {"count_loss_years", (PyCFunction)(void (*)(void))maskcount_count_loss_years,
+     METH_FASTCALL,
+     "count_loss_years(lossyear, datamask, max_value)\n--\n\n"
+     "Return (valid_count, counts) where counts[v] is the number of valid\n"
+     "pixels with lossyear value v, for v from 0 to max_value."},
+    {NULL, NULL, 0, NULL},
+};
+
+static struct PyModuleDef maskcount_module = {
+    PyModuleDef_HEAD_INIT,
+    "_maskcount",
+    "C accelerated Hansen mask counting.",
+    -1,
+    maskcount_methods,
+};
+
+PyMODINIT_FUNC
+PyInit__maskcount(void)
+{
+    return PyModule_Create(&maskcount_module);
+}
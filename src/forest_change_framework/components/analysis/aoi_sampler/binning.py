@@ -1,8 +1,12 @@
 """Binning and filtering logic for AOIs based on loss statistics."""
 
 import logging
+import numbers
+from collections import Counter
 from typing import List, Dict, Tuple, Optional, Any
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
@@ -87,6 +91,58 @@ def get_bin_for_value(value: float, bins: List[Dict[str, Any]]) -> Optional[str]
     return None
 
 
+def _column(aois: List[Dict[str, Any]], key: str) -> np.ndarray:
+    """
+    Gather one numeric field of every AOI into a float array (missing = 0).
+
+    Raises:
+        TypeError: If a value is not a real number (e.g. None or a string),
+            which the value comparisons in get_bin_for_value reject too
+    """
+    values = [aoi.get(key, 0) for aoi in aois]
+    column = np.array(values)
+
+    # Plain numbers give a bool, int or float array; anything else needs a closer look
+    if column.dtype.kind not in "biuf":
+        for value in values:
+            if not isinstance(value, numbers.Real):
+                raise TypeError(
+                    f"AOI '{key}' must be a number, got {type(value).__name__}: {value!r}"
+                )
+
+    return column.astype(float)
+
+
+def _bin_labels(loss_values: np.ndarray, bins: List[Dict[str, Any]]) -> List[str]:
+    """
+    Return the bin_category of each loss value, as get_bin_for_value assigns it.
+
+    Each bin is matched against all values at once. Bins are applied last to
+    first, so where bins overlap the first matching one wins.
+    """
+    labels = [bin_def["name"] or "unclassified" for bin_def in bins]
+    labels.append("unclassified")
+
+    # -1 selects the trailing "unclassified" label
+    indices = np.full(loss_values.shape, -1, dtype=np.intp)
+    for index in range(len(bins) - 1, -1, -1):
+        min_val, max_val = bins[index]["min"], bins[index]["max"]
+
+        # For the last bin, include the max boundary
+        if max_val == 100:
+            in_bin = (loss_values >= min_val) & (loss_values <= max_val)
+        else:
+            in_bin = (loss_values >= min_val) & (loss_values < max_val)
+        indices[in_bin] = index
+
+    return [labels[index] for index in indices.tolist()]
+
+
+def _threshold_pct(validity_threshold: float) -> float:
+    """Convert a validity threshold given as a fraction (0-1) to a percentage."""
+    return validity_threshold * 100 if validity_threshold <= 1.0 else validity_threshold
+
+
 def bin_aois(
     aois: List[Dict[str, Any]],
     bins: List[Dict[str, Any]],
@@ -103,18 +159,9 @@ def bin_aois(
     Returns:
         List of AOIs with added 'bin_category' field
     """
-    binned_aois = []
-
-    for aoi in aois:
-        loss_value = aoi.get(loss_key, 0)
-        bin_name = get_bin_for_value(loss_value, bins)
-
-        aoi_copy = aoi.copy()
-        aoi_copy["bin_category"] = bin_name or "unclassified"
+    bin_names = _bin_labels(_column(aois, loss_key), bins)
 
-        binned_aois.append(aoi_copy)
-
-    return binned_aois
+    return [{**aoi, "bin_category": bin_name} for aoi, bin_name in zip(aois, bin_names)]
 
 
 def filter_by_validity(
@@ -137,24 +184,18 @@ def filter_by_validity(
         - valid_aois: List of AOIs passing validity threshold
         - invalid_aois: Empty list or list of excluded AOIs (if keep_invalid=True)
     """
-    valid_aois = []
-    invalid_aois = []
-
-    for aoi in aois:
-        validity_pct = aoi.get(validity_key, 0)
+    passed = (_column(aois, validity_key) >= _threshold_pct(validity_threshold)).tolist()
 
-        # Convert threshold (0-1) to percentage (0-100)
-        threshold_pct = validity_threshold * 100 if validity_threshold <= 1.0 else validity_threshold
-
-        if validity_pct >= threshold_pct:
-            aoi_copy = aoi.copy()
-            aoi_copy["validity_status"] = "valid"
-            valid_aois.append(aoi_copy)
-        else:
-            if keep_invalid:
-                aoi_copy = aoi.copy()
-                aoi_copy["validity_status"] = "invalid"
-                invalid_aois.append(aoi_copy)
+    valid_aois = [
+        {**aoi, "validity_status": "valid"} for aoi, is_valid in zip(aois, passed) if is_valid
+    ]
+    invalid_aois = []
+    if keep_invalid:
+        invalid_aois = [
+            {**aoi, "validity_status": "invalid"}
+            for aoi, is_valid in zip(aois, passed)
+            if not is_valid
+        ]
 
     return valid_aois, invalid_aois
 
@@ -169,13 +210,7 @@ def get_bin_summary(binned_aois: List[Dict[str, Any]]) -> Dict[str, int]:
     Returns:
         Dictionary mapping bin_name -> count
     """
-    summary = {}
-
-    for aoi in binned_aois:
-        bin_cat = aoi.get("bin_category", "unclassified")
-        summary[bin_cat] = summary.get(bin_cat, 0) + 1
-
-    return summary
+    return dict(Counter(aoi.get("bin_category", "unclassified") for aoi in binned_aois))
 
 
 def apply_binning_and_filtering(
@@ -203,15 +238,18 @@ def apply_binning_and_filtering(
     if not is_valid:
         raise ValueError(f"Invalid bins configuration: {error_msg}")
 
-    # Bin the AOIs
-    binned_aois = bin_aois(aois, bins)
+    # Bin and filter on whole columns, then copy each kept AOI only once,
+    # with the same fields bin_aois and filter_by_validity would add
+    bin_names = _bin_labels(_column(aois, "loss_percentage"), bins)
+    passed = (_column(aois, "data_validity") >= _threshold_pct(validity_threshold)).tolist()
 
-    # Filter by validity
-    valid_aois, invalid_aois = filter_by_validity(
-        binned_aois,
-        validity_threshold=validity_threshold,
-        keep_invalid=keep_invalid_aois,
-    )
+    valid_aois = []
+    invalid_aois = []
+    for aoi, bin_name, is_valid in zip(aois, bin_names, passed):
+        if is_valid:
+            valid_aois.append({**aoi, "bin_category": bin_name, "validity_status": "valid"})
+        elif keep_invalid_aois:
+            invalid_aois.append({**aoi, "bin_category": bin_name, "validity_status": "invalid"})
 
     # Get bin summary only from VALID AOIs
     bin_summary = get_bin_summary(valid_aois)
@@ -3,6 +3,8 @@
 import logging
 from typing import List, Dict, Tuple, Any
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 # Earth's mean radius in km
@@ -52,6 +54,23 @@ def km_to_degrees(km: float, latitude: float) -> float:
     return km / km_per_degree_lon
 
 
+def _cell_edges(start: float, stop: float, step: float) -> Tuple[List[float], List[float]]:
+    """
+    Return the (starts, ends) of the cells covering [start, stop) along one axis.
+
+    Edges are a running sum of step, exactly as if stepped one cell at a
+    time, so they do not drift from the values a loop would produce. The
+    last cell is clipped to stop.
+    """
+    steps = np.full(int((stop - start) / step) + 2, step)
+    edges = np.add.accumulate(np.concatenate(([start], steps)))
+
+    starts = edges[edges < stop]
+    ends = np.minimum(starts + step, stop)
+
+    return starts.tolist(), ends.tolist()
+
+
 def create_grid_cells(
     bbox: Dict[str, float], cell_size_km: float = 1.0
 ) -> Tuple[List[Dict[str, float]], int]:
@@ -94,38 +113,25 @@ def create_grid_cells(
         f"cell_size_lat={cell_size_lat:.6f}°, cell_size_lon={cell_size_lon:.6f}°"
     )
 
-    # Create grid cells
-    cells = []
-    cell_id = 0
-
-    # Iterate through latitude (rows)
-    current_y = miny
-    row = 0
-    while current_y < maxy:
-        cell_maxy = min(current_y + cell_size_lat, maxy)
-
-        # Iterate through longitude (columns)
-        current_x = minx
-        col = 0
-        while current_x < maxx:
-            cell_maxx = min(current_x + cell_size_lon, maxx)
-
-            cell = {
-                "minx": current_x,
-                "miny": current_y,
-                "maxx": cell_maxx,
-                "maxy": cell_maxy,
-                "cell_id": cell_id,
-                "row": row,
-                "col": col,
-            }
-            cells.append(cell)
-            cell_id += 1
-            col += 1
-            current_x = cell_maxx
-
-        row += 1
-        current_y = cell_maxy
+    # Cell edges per axis, then one cell per (row, col) pair in row-major order
+    col_starts, col_ends = _cell_edges(minx, maxx, cell_size_lon)
+    row_starts, row_ends = _cell_edges(miny, maxy, cell_size_lat)
+    n_cols = len(col_starts)
+    col_bounds = list(enumerate(zip(col_starts, col_ends)))
+
+    cells = [
+        {
+            "minx": cell_minx,
+            "miny": cell_miny,
+            "maxx": cell_maxx,
+            "maxy": cell_maxy,
+            "cell_id": row * n_cols + col,
+            "row": row,
+            "col": col,
+        }
+        for row, (cell_miny, cell_maxy) in enumerate(zip(row_starts, row_ends))
+        for col, (cell_minx, cell_maxx) in col_bounds
+    ]
 
     logger.info(
         f"Created grid with {len(cells)} cells covering bbox "
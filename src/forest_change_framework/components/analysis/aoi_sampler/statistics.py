@@ -1,7 +1,7 @@
 """Statistics calculation functions for forest loss and data validity metrics."""
 
 import logging
-from typing import Dict, Tuple, Any
+from typing import Any, Dict, List, Sequence, Tuple
 import numpy as np
 
 logger = logging.getLogger(__name__)
@@ -10,6 +10,116 @@ logger = logging.getLogger(__name__)
 HANSEN_BASE_YEAR = 2000
 HANSEN_MAX_LOSS_YEAR = 21
 
+# Tree cover statistics calculate_treecover_stats can compute, and the ones it
+# computes by default (the median needs a sort, so it is opt-in)
+_TREECOVER_REDUCERS = {
+    "mean": np.mean,
+    "median": np.median,
+    "std": np.std,
+    "min": np.min,
+    "max": np.max,
+}
+DEFAULT_TREECOVER_STATS = ("mean", "std", "min", "max")
+
+# Optional C implementation of the mask counts, built from _maskcount.c when
+# a compiler is available at install time
+try:
+    from . import _maskcount
+except ImportError:
+    _maskcount = None
+
+
+def _is_byte_buffer(array: np.ndarray) -> bool:
+    """Return True if the C counters can read the array's buffer directly."""
+    return array.dtype == np.uint8 and array.flags.c_contiguous
+
+
+def _count_valid(datamask_array: np.ndarray) -> int:
+    """Count pixels whose datamask value is 1."""
+    if _maskcount is not None and _is_byte_buffer(datamask_array):
+        return _maskcount.count_valid(datamask_array)
+    return int(np.count_nonzero(datamask_array == 1))
+
+
+def _count_valid_and_loss(
+    lossyear_array: np.ndarray, datamask_array: np.ndarray
+) -> Tuple[int, int]:
+    """
+    Count valid pixels and valid pixels with forest loss in one go.
+
+    Both counts come from the same validity mask, and the loss mask is built
+    in the buffer of the lossyear comparison, so the bands are each scanned
+    once and only two boolean temporaries are allocated. With the C
+    extension, uint8 bands are counted in a single pass with no temporaries.
+
+    Args:
+        lossyear_array: 2D numpy array from Hansen lossyear band
+        datamask_array: 2D numpy array from Hansen datamask band
+
+    Returns:
+        Tuple of (valid_count, loss_count)
+    """
+    if (
+        _maskcount is not None
+        and lossyear_array.shape == datamask_array.shape
+        and _is_byte_buffer(lossyear_array)
+        and _is_byte_buffer(datamask_array)
+    ):
+        return _maskcount.count_valid_and_loss(lossyear_array, datamask_array)
+
+    valid_mask = datamask_array == 1
+    valid_count = np.count_nonzero(valid_mask)
+
+    if valid_count == 0:
+        return 0, 0
+
+    loss_mask = lossyear_array > 0
+    np.logical_and(loss_mask, valid_mask, out=loss_mask)
+
+    return valid_count, np.count_nonzero(loss_mask)
+
+
+def _count_loss_years(
+    lossyear_array: np.ndarray, datamask_array: np.ndarray
+) -> Tuple[int, List[int]]:
+    """
+    Histogram the lossyear values of valid pixels.
+
+    uint8 bands are histogrammed in a single pass; any other dtype is counted with one
+    comparison per year value, so negative and fractional values are simply
+    left out of every bin.
+
+    Args:
+        lossyear_array: 2D numpy array from Hansen lossyear band
+        datamask_array: 2D numpy array from Hansen datamask band
+
+    Returns:
+        Tuple of (valid_count, counts), where counts[k] is the number of valid
+        pixels with lossyear value k, for k from 0 to HANSEN_MAX_LOSS_YEAR
+    """
+    if (
+        _maskcount is not None
+        and lossyear_array.shape == datamask_array.shape
+        and _is_byte_buffer(lossyear_array)
+        and _is_byte_buffer(datamask_array)
+    ):
+        return _maskcount.count_loss_years(lossyear_array, datamask_array, HANSEN_MAX_LOSS_YEAR)
+
+    valid_mask = datamask_array == 1
+
+    if lossyear_array.dtype == np.uint8:
+        valid_years = lossyear_array[valid_mask]
+        counts = np.bincount(valid_years, minlength=HANSEN_MAX_LOSS_YEAR + 1)
+        return valid_years.size, counts[: HANSEN_MAX_LOSS_YEAR + 1].tolist()
+
+    # Other bands may hold negative or fractional values, which bincount
+    # cannot take: compare against each year value instead
+    counts = [
+        np.count_nonzero((lossyear_array == year_offset) & valid_mask)
+        for year_offset in range(HANSEN_MAX_LOSS_YEAR + 1)
+    ]
+    return np.count_nonzero(valid_mask), counts
+
 
 def calculate_validity(datamask_array: np.ndarray) -> float:
     """
@@ -26,7 +136,7 @@ def calculate_validity(datamask_array: np.ndarray) -> float:
     if datamask_array.size == 0:
         return 0.0
 
-    valid_count = np.sum(datamask_array == 1)
+    valid_count = _count_valid(datamask_array)
     validity_pct = (valid_count / datamask_array.size) * 100
 
     return float(validity_pct)
@@ -47,17 +157,12 @@ def calculate_loss_percentage(
     Returns:
         Loss percentage (0-100) relative to valid pixels
     """
-    # Count valid pixels
-    valid_mask = datamask_array == 1
-    valid_count = np.sum(valid_mask)
+    # Count valid pixels and loss pixels (lossyear > 0) among them
+    valid_count, loss_count = _count_valid_and_loss(lossyear_array, datamask_array)
 
     if valid_count == 0:
         return 0.0
 
-    # Count loss pixels (lossyear > 0) among valid pixels
-    loss_mask = (lossyear_array > 0) & valid_mask
-    loss_count = np.sum(loss_mask)
-
     loss_pct = (loss_count / valid_count) * 100
 
     return float(loss_pct)
@@ -79,10 +184,14 @@ def calculate_loss_by_year(
         Dictionary mapping year -> loss_percentage
         Example: {2000: 0.5, 2001: 1.2, ...}
     """
-    # Count valid pixels
-    valid_mask = datamask_array == 1
-    valid_count = np.sum(valid_mask)
+    # One histogram over the valid pixels gives every year's count
+    valid_count, year_counts = _count_loss_years(lossyear_array, datamask_array)
 
+    return _loss_by_year_from_counts(valid_count, year_counts)
+
+
+def _loss_by_year_from_counts(valid_count: int, year_counts: List[int]) -> Dict[int, float]:
+    """Turn a lossyear histogram of valid pixels into year -> loss_percentage."""
     if valid_count == 0:
         return {}
 
@@ -90,47 +199,50 @@ def calculate_loss_by_year(
 
     # For each possible loss year value (1-21)
     for year_offset in range(1, HANSEN_MAX_LOSS_YEAR + 1):
-        year = HANSEN_BASE_YEAR + year_offset
-
-        # Count pixels with this loss year
-        year_loss_mask = (lossyear_array == year_offset) & valid_mask
-        year_loss_count = np.sum(year_loss_mask)
+        year_loss_count = year_counts[year_offset]
 
         if year_loss_count > 0:
             year_loss_pct = (year_loss_count / valid_count) * 100
-            loss_by_year[year] = float(year_loss_pct)
+            loss_by_year[HANSEN_BASE_YEAR + year_offset] = float(year_loss_pct)
 
     return loss_by_year
 
 
 def calculate_treecover_stats(
-    treecover_array: np.ndarray, datamask_array: np.ndarray
+    treecover_array: np.ndarray,
+    datamask_array: np.ndarray,
+    stats: Sequence[str] = DEFAULT_TREECOVER_STATS,
 ) -> Dict[str, float]:
     """
-    Calculate tree cover statistics (mean, median, std).
+    Calculate tree cover statistics over the valid pixels.
+
+    Only the requested statistics are computed. The median sorts a copy of
+    the valid pixels, so it is left out unless asked for.
 
     Args:
         treecover_array: 2D numpy array from Hansen treecover2000 band (0-100)
         datamask_array: 2D numpy array from Hansen datamask band
+        stats: Names of the statistics to compute, from mean, median, std,
+            min and max
 
     Returns:
-        Dictionary with keys: mean, median, std, min, max
+        Dictionary mapping each requested statistic to its value
         Returns empty dict if no valid pixels
+
+    Raises:
+        ValueError: If stats names an unknown statistic
     """
+    unknown = [name for name in stats if name not in _TREECOVER_REDUCERS]
+    if unknown:
+        raise ValueError(f"Unknown tree cover statistics: {', '.join(unknown)}")
+
     # Mask valid pixels
-    valid_mask = datamask_array == 1
-    valid_treecover = treecover_array[valid_mask]
+    valid_treecover = treecover_array[datamask_array == 1]
 
-    if len(valid_treecover) == 0:
+    if valid_treecover.size == 0:
         return {}
 
-    return {
-        "mean": float(np.mean(valid_treecover)),
-        "median": float(np.median(valid_treecover)),
-        "std": float(np.std(valid_treecover)),
-        "min": float(np.min(valid_treecover)),
-        "max": float(np.max(valid_treecover)),
-    }
+    return {name: float(_TREECOVER_REDUCERS[name](valid_treecover)) for name in stats}
 
 
 def calculate_cell_statistics(
@@ -147,18 +259,32 @@ def calculate_cell_statistics(
         treecover_data: 2D array from treecover2000 band
         lossyear_data: 2D array from lossyear band
         datamask_data: 2D array from datamask band
-        include_treecover_stats: Whether to include tree cover mean/median/std
+        include_treecover_stats: Whether to include tree cover mean/std/min/max
         include_loss_by_year: Whether to include loss breakdown by year
 
     Returns:
         Dictionary with calculated statistics
     """
+    # For uint8 bands, validity, loss and (when wanted) the per-year breakdown
+    # all come from a single pass over the lossyear and datamask bands: every
+    # valid pixel outside the histogram's zero bin has lossyear > 0. Other
+    # dtypes may hold values (negative, fractional) that no bin counts.
+    year_counts = None
+    if include_loss_by_year and lossyear_data.dtype == np.uint8:
+        valid_count, year_counts = _count_loss_years(lossyear_data, datamask_data)
+        loss_count = valid_count - year_counts[0]
+    else:
+        valid_count, loss_count = _count_valid_and_loss(lossyear_data, datamask_data)
+    total_count = datamask_data.size
+
     stats = {
-        "loss_percentage": calculate_loss_percentage(lossyear_data, datamask_data),
-        "data_validity": calculate_validity(datamask_data),
+        "loss_percentage": float(loss_count / valid_count * 100) if valid_count else 0.0,
+        "data_validity": float(valid_count / total_count * 100) if total_count else 0.0,
     }
 
-    if include_loss_by_year:
+    if year_counts is not None:
+        stats["loss_by_year"] = _loss_by_year_from_counts(valid_count, year_counts)
+    elif include_loss_by_year:
         stats["loss_by_year"] = calculate_loss_by_year(lossyear_data, datamask_data)
 
     if include_treecover_stats:
@@ -753,7 +753,9 @@ class HansenForestChangeComponent(BaseComponent):
                     # Write stacked tile to file on disk
                     temp_tile_path = self._data_folder / f"stacked_{tile_id}.tif"
 
-                    # Update metadata for 3 bands
+                    # Update metadata for 3 bands; the stacked tile is always
+                    # a GeoTIFF, whatever format the layer files were in
+                    metadata["driver"] = "GTiff"
                     metadata["count"] = 3
                     metadata["dtype"] = stacked_array.dtype
 
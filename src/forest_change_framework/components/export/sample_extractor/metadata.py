@@ -1,16 +1,27 @@
 """Metadata management for sample extraction - export and validation."""
 
+import csv
 import json
 import logging
+import os
 from pathlib import Path
 from typing import Any, Dict, List
 
 logger = logging.getLogger(__name__)
 
-try:
-    import pandas as pd
-except ImportError:
-    pd = None
+# Columns of the CSV metadata export, in order
+_CSV_COLUMNS = [
+    "sample_id",
+    "aoi_id",
+    "year",
+    "loss_bin",
+    "minx",
+    "miny",
+    "maxx",
+    "maxy",
+    "loss_percentage",
+    "tiff_path",
+]
 
 
 def create_metadata_dict(manifest_list: List[Dict[str, Any]], patches_dir: str) -> Dict[str, Any]:
@@ -69,39 +80,34 @@ def write_metadata_csv(manifest_list: List[Dict[str, Any]], output_path: str) ->
         output_path: Path where CSV will be written
 
     Raises:
-        ImportError: If pandas is not installed
         IOError: If file cannot be written
 
     Example:
         >>> manifest = [...]
         >>> write_metadata_csv(manifest, "samples_metadata.csv")
     """
-    if pd is None:
-        raise ImportError("pandas required for CSV export. Install with: pip install pandas")
-
-    # Convert manifest to DataFrame
-    data = []
-    for sample in manifest_list:
-        row = {
-            "sample_id": sample.get("sample_id"),
-            "aoi_id": sample.get("aoi_id"),
-            "year": sample.get("year"),
-            "loss_bin": sample.get("loss_bin"),
-            "minx": sample.get("minx"),
-            "miny": sample.get("miny"),
-            "maxx": sample.get("maxx"),
-            "maxy": sample.get("maxy"),
-            "loss_percentage": sample.get("loss_percentage"),
-            "tiff_path": f"patches/{sample.get('sample_id')}.tif",
-        }
-        data.append(row)
-
-    df = pd.DataFrame(data)
-
-    # Write CSV
     output_file = Path(output_path)
     output_file.parent.mkdir(parents=True, exist_ok=True)
-    df.to_csv(output_file, index=False)
+
+    # Rows are flat records, so they stream straight to disk
+    with open(output_file, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=_CSV_COLUMNS)
+        writer.writeheader()
+        writer.writerows(
+            {
+                "sample_id": sample.get("sample_id"),
+                "aoi_id": sample.get("aoi_id"),
+                "year": sample.get("year"),
+                "loss_bin": sample.get("loss_bin"),
+                "minx": sample.get("minx"),
+                "miny": sample.get("miny"),
+                "maxx": sample.get("maxx"),
+                "maxy": sample.get("maxy"),
+                "loss_percentage": sample.get("loss_percentage"),
+                "tiff_path": f"patches/{sample.get('sample_id')}.tif",
+            }
+            for sample in manifest_list
+        )
 
     logger.info(f"Wrote {len(manifest_list)} samples to CSV: {output_path}")
 
@@ -260,6 +266,13 @@ def validate_metadata(
     patches_path = Path(patches_dir)
     seen_ids = set()
 
+    # List the patches directory once rather than stat'ing every sample's file
+    try:
+        with os.scandir(patches_path) as entries:
+            existing_files = {entry.name for entry in entries if entry.is_file()}
+    except (FileNotFoundError, NotADirectoryError):
+        existing_files = set()
+
     for sample in manifest_list:
         sample_id = sample.get("sample_id")
 
@@ -271,8 +284,9 @@ def validate_metadata(
         seen_ids.add(sample_id)
 
         # Check if TIFF file exists
-        tiff_path = patches_path / f"{sample_id}.tif"
-        if not tiff_path.exists():
+        tiff_name = f"{sample_id}.tif"
+        if tiff_name not in existing_files:
+            tiff_path = patches_path / tiff_name
             report["missing_files"].append(str(tiff_path))
             report["errors"].append(f"Missing TIFF file: {tiff_path}")
             report["valid"] = False
@@ -300,7 +300,8 @@ class ConfigManager:
         """
         Validate the configuration against a schema.
 
-        Basic validation that checks for required keys and types.
+        Basic validation that checks for required keys and types. Keys ending
+        in "?" are optional and only type checked when present.
 
         Args:
             schema: Validation schema dictionary with required keys and types.
@@ -318,8 +319,15 @@ class ConfigManager:
             True
         """
         for key, expected_type in schema.items():
+            # A single trailing "?" marks the key as optional
+            is_optional = key.endswith("?")
+            if is_optional:
+                key = key[:-1]
+
             value = self.get(key)
             if value is None:
+                if is_optional:
+                    continue
                 raise ConfigError(f"Required configuration key missing: {key}")
             if not isinstance(value, expected_type):
                 raise ConfigError(
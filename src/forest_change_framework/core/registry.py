@@ -159,9 +159,8 @@ class ComponentRegistry:
             >>> data_comps = registry.list_components("data_ingestion")
         """
         if category:
-            if category not in self._components:
-                return {category: []}
-            return {category: list(self._components[category].keys())}
+            # Single dict lookup; other categories are never visited
+            return {category: list(self._components.get(category, ()))}
 
         return {
             cat: list(comps.keys()) for cat, comps in self._components.items()
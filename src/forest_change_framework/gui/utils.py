@@ -1,5 +1,6 @@
 """Utility functions for GUI."""
 
+import functools
 import logging
 from pathlib import Path
 from typing import Optional
@@ -9,6 +10,23 @@ from PyQt6.QtWidgets import QMessageBox, QApplication, QStyle
 
 logger = logging.getLogger(__name__)
 
+_ELLIPSIS = "..."
+_DEFAULT_TRUNCATE_LENGTH = 50
+
+
+# Map icon names to standard application icons
+_ICON_MAP = {
+    "new": QStyle.StandardPixmap.SP_FileDialogDetailedView,
+    "open": QStyle.StandardPixmap.SP_DialogOpenButton,
+    "save": QStyle.StandardPixmap.SP_DialogSaveButton,
+    "play": QStyle.StandardPixmap.SP_MediaPlay,
+    "stop": QStyle.StandardPixmap.SP_MediaStop,
+    "delete": QStyle.StandardPixmap.SP_TrashIcon,
+    "refresh": QStyle.StandardPixmap.SP_BrowserReload,
+    "config": QStyle.StandardPixmap.SP_FileDialogDetailedView,
+    "settings": QStyle.StandardPixmap.SP_FileDialogDetailedView,
+}
+
 
 def create_icon(name: str, size: int = 24, color: Optional[QColor] = None) -> QIcon:
     """Create an icon from resources or standard application icons.
@@ -26,25 +44,9 @@ def create_icon(name: str, size: int = 24, color: Optional[QColor] = None) -> QI
     if icon_path.exists():
         return QIcon(str(icon_path))
 
-    # Map icon names to standard application icons
-    icon_map = {
-        "new": QStyle.StandardPixmap.SP_FileDialogDetailedView,
-        "open": QStyle.StandardPixmap.SP_DialogOpenButton,
-        "save": QStyle.StandardPixmap.SP_DialogSaveButton,
-        "play": QStyle.StandardPixmap.SP_MediaPlay,
-        "stop": QStyle.StandardPixmap.SP_MediaStop,
-        "delete": QStyle.StandardPixmap.SP_TrashIcon,
-        "refresh": QStyle.StandardPixmap.SP_BrowserReload,
-        "config": QStyle.StandardPixmap.SP_FileDialogDetailedView,
-        "settings": QStyle.StandardPixmap.SP_FileDialogDetailedView,
-    }
-
     # Use standard application icon if available
-    if name in icon_map and QApplication.instance():
-        try:
-            return QApplication.style().standardIcon(icon_map[name])
-        except Exception:
-            pass
+    if name in _ICON_MAP and QApplication.instance() is not None:
+        return QApplication.style().standardIcon(_ICON_MAP[name])
 
     # Fallback: Return placeholder icon
     pixmap = QPixmap(size, size)
@@ -138,9 +140,26 @@ def format_number(num: float, decimals: int = 2) -> str:
     return f"{num:,.{decimals}f}"
 
 
-def truncate_string(text: str, length: int = 50) -> str:
+def _truncate(text: str, length: int) -> str:
+    """Truncate text to length characters, ending in an ellipsis if cut."""
+    if len(text) <= length:
+        return text
+    return f"{text[:length-3]}{_ELLIPSIS}"
+
+
+@functools.lru_cache(maxsize=1024)
+def _truncate_default(text: str) -> str:
+    """Truncate text to the default length, memoized."""
+    return _truncate(text, _DEFAULT_TRUNCATE_LENGTH)
+
+
+def truncate_string(text: str, length: int = _DEFAULT_TRUNCATE_LENGTH) -> str:
     """Truncate string to specified length.
 
+    Results for the default length are memoized since table and list views
+    truncate the same cell values repeatedly; other lengths are not cached,
+    so they cannot evict those entries.
+
     Args:
         text: Text to truncate
         length: Maximum length
@@ -148,14 +167,18 @@ def truncate_string(text: str, length: int = 50) -> str:
     Returns:
         Truncated text
     """
-    if len(text) > length:
-        return text[:length-3] + "..."
-    return text
+    if length == _DEFAULT_TRUNCATE_LENGTH:
+        return _truncate_default(text)
+    return _truncate(text, length)
 
 
+@functools.lru_cache(maxsize=None)
 def get_app_data_dir() -> Path:
     """Get application data directory.
 
+    The directory is created on the first successful call and the resolved
+    path is reused afterwards, so widgets can call this freely.
+
     Returns:
         Path to app data directory (~/.forest_change_framework)
     """
@@ -164,6 +187,7 @@ def get_app_data_dir() -> Path:
     return app_dir
 
 
+@functools.lru_cache(maxsize=None)
 def get_project_root() -> Path:
     """Get project root directory.
 
@@ -0,0 +1,150 @@
+/*
+ * C implementation of forest_change_framework.utils.helpers.deep_merge.
+ *
+ * Mirrors the pure-Python fallback exactly: the result starts as a shallow
+ * copy of the first dict, and only values whose type is exactly dict on both
+ * sides are merged recursively (subclasses replace the base value). Nested
+ * levels are walked with an explicit stack, so deeply nested input needs no
+ * C recursion and no Python frames.
+ */
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+typedef struct {
+    PyObject *dst; /* owned reference */
+    PyObject *src; /* owned reference */
+} merge_frame;
+
+typedef struct {
+    merge_frame *items;
+    Py_ssize_t size;
+    Py_ssize_t capacity;
+} merge_stack;
+
+static int
+stack_push(merge_stack *stack, PyObject *dst, PyObject *src)
+{
+    if (stack->size == stack->capacity) {
+        Py_ssize_t capacity = stack->capacity ? stack->capacity * 2 : 16;
+        merge_frame *items = PyMem_Realloc(stack->items, capacity * sizeof(merge_frame));
+        if (items == NULL) {
+            PyErr_NoMemory();
+            return -1;
+        }
+        stack->items = items;
+        stack->capacity = capacity;
+    }
+    Py_INCREF(dst);
+    Py_INCREF(src);
+    stack->items[stack->size].dst = dst;
+    stack->items[stack->size].src = src;
+    stack->size++;
+    return 0;
+}
+
+static void
+stack_clear(merge_stack *stack)
+{
+    while (stack->size > 0) {
+        stack->size--;
+        Py_DECREF(stack->items[stack->size].dst);
+        Py_DECREF(stack->items[stack->size].src);
+    }
+    PyMem_Free(stack->items);
+    stack->items = NULL;
+    stack->capacity = 0;
+}
+
+static int
+merge_level(merge_stack *stack, PyObject *dst, PyObject *src)
+{
+    Py_ssize_t pos = 0;
+    PyObject *key, *value;
+
+    while (PyDict_Next(src, &pos, &key, &value)) {
+        PyObject *current = PyDict_GetItemWithError(dst, key);
+        if (current == NULL && PyErr_Occurred()) {
+            return -1;
+        }
+        if (current != NULL && Py_TYPE(current) == &PyDict_Type
+                && Py_TYPE(value) == &PyDict_Type) {
+            PyObject *merged = PyDict_Copy(current);
+            if (merged == NULL) {
+                return -1;
+            }
+            if (PyDict_SetItem(dst, key, merged) < 0 || stack_push(stack, merged, value) < 0) {
+                Py_DECREF(merged);
+                return -1;
+            }
+            Py_DECREF(merged);
+        }
+        else if (PyDict_SetItem(dst, key, value) < 0) {
+            return -1;
+        }
+    }
+    return 0;
+}
+
+static PyObject *
+deepops_deep_merge(PyObject *module, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *base, *overlay, *result;
+    merge_stack stack = {NULL, 0, 0};
+
+    if (nargs != 2) {
+        PyErr_Format(PyExc_TypeError, "deep_merge expected 2 arguments, got %zd", nargs);
+        return NULL;
+    }
+    base = args[0];
+    overlay = args[1];
+    if (!PyDict_CheckExact(base) || !PyDict_CheckExact(overlay)) {
+        PyErr_SetString(PyExc_TypeError, "deep_merge arguments must be dicts");
+        return NULL;
+    }
+
+    result = PyDict_Copy(base);
+    if (result == NULL) {
+        return NULL;
+    }
+    if (stack_push(&stack, result, overlay) < 0) {
+        goto error;
+    }
+    while (stack.size > 0) {
+        merge_frame frame = stack.items[--stack.size];
+        int status = merge_level(&stack, frame.dst, frame.src);
+        Py_DECREF(frame.dst);
+        Py_DECREF(frame.src);
+        if (status < 0) {
+            goto error;
+        }
+    }
+    stack_clear(&stack);
+    return result;
+
+error:
+    stack_clear(&stack);
+    Py_DECREF(result);
+    return NULL;
+}
+
+static PyMethodDef deepops_methods[] = {
+    {"deep_merge", (PyCFunction)(void (*)(void))deepops_deep_merge, METH_FASTCALL,
+     "deep_merge(dict1, dict2)\n--\n\n"
+     "Return a new dict with dict2 deep-merged over dict1."},
+    {NULL, NULL, 0, NULL},
+};
+
+static struct PyModuleDef deepops_module = {
+    PyModuleDef_HEAD_INIT,
+    "_deepops",
+    "C accelerated dictionary helpers.",
+    -1,
+    deepops_methods,
+};
+
+PyMODINIT_FUNC
+PyInit__deepops(void)
+{
+    return PyModule_Create(&deepops_module);
+}
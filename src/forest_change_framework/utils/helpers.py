@@ -6,25 +6,44 @@ for common operations like configuration merging, dictionary manipulation, and
 file operations.
 """
 
+import copy
+import functools
 import json
 import os
-from typing import Any, Dict
+from typing import Any, Dict, Set
 from pathlib import Path
 
+# Resolve the YAML loader once at import so load_yaml does no per-call lookups
 try:
-    import yaml
+    from yaml import load as _yaml_load
+
+    # Prefer the libyaml-backed loader, which is several times faster
+    try:
+        from yaml import CSafeLoader as _SafeLoader
+    except ImportError:
+        from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
 
     HAS_YAML = True
 except ImportError:
     HAS_YAML = False
 
+# Optional C implementation of deep_merge, built from _deepops.c when a
+# compiler is available at install time
+try:
+    from ._deepops import deep_merge as _c_deep_merge
+except ImportError:
+    _c_deep_merge = None
+
+# Absolute paths of directories already created by ensure_directory
+_ENSURED_DIRS: Set[str] = set()
+
 
 def deep_merge(dict1: Dict[str, Any], dict2: Dict[str, Any]) -> Dict[str, Any]:
     """
     Deep merge two dictionaries, with dict2 values overriding dict1.
 
     Recursively merges nested dictionaries. For non-dict values, dict2 values
-    override dict1 values.
+    override dict1 values. Neither input is modified.
 
     Args:
         dict1: Base dictionary.
@@ -39,15 +58,37 @@ def deep_merge(dict1: Dict[str, Any], dict2: Dict[str, Any]) -> Dict[str, Any]:
         >>> deep_merge(base, override)
         {'db': {'host': 'localhost', 'port': 3306}}
     """
+    if _c_deep_merge is not None and dict1.__class__ is dict and dict2.__class__ is dict:
+        return _c_deep_merge(dict1, dict2)
+
     result = dict1.copy()
-    for key, value in dict2.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = deep_merge(result[key], value)
-        else:
-            result[key] = value
+    if dict2:
+        _deep_merge_inplace(result, dict2)
     return result
 
 
+def _deep_merge_inplace(base: Dict[str, Any], overlay: Dict[str, Any]) -> None:
+    """
+    Merge overlay into base in place.
+
+    Nested levels are walked with an explicit stack rather than recursion.
+    Nested dicts taken from base are copied before being merged into, so
+    dictionaries shared with the caller's input are never mutated. Only plain
+    dicts are merged recursively; any other value replaces the base value.
+    """
+    stack = [(base, overlay)]
+    while stack:
+        dst, src = stack.pop()
+        for key, value in src.items():
+            current = dst.get(key)
+            if current.__class__ is dict and value.__class__ is dict:
+                merged = current.copy()
+                dst[key] = merged
+                stack.append((merged, value))
+            else:
+                dst[key] = value
+
+
 def flatten_dict(
     nested_dict: Dict[str, Any], parent_key: str = "", sep: str = "."
 ) -> Dict[str, Any]:
@@ -58,7 +99,7 @@ def flatten_dict(
 
     Args:
         nested_dict: Nested dictionary to flatten.
-        parent_key: Parent key prefix (used in recursion).
+        parent_key: Prefix prepended to every key.
         sep: Separator for nested keys (default: ".").
 
     Returns:
@@ -69,25 +110,34 @@ def flatten_dict(
         >>> flatten_dict(nested)
         {'db.host': 'localhost', 'db.port': 5432, 'debug': True}
     """
-    items: list = []
-    for k, v in nested_dict.items():
-        new_key = f"{parent_key}{sep}{k}" if parent_key else k
-        if isinstance(v, dict):
-            items.extend(flatten_dict(v, new_key, sep=sep).items())
+    flat: Dict[str, Any] = {}
+    # Stack of (prefix, items iterator) pairs; resuming the parent iterator
+    # after a nested dict is exhausted keeps keys in depth-first order.
+    stack = [(parent_key, iter(nested_dict.items()))]
+    while stack:
+        prefix, items = stack[-1]
+        for k, v in items:
+            new_key = f"{prefix}{sep}{k}" if prefix else k
+            if v.__class__ is dict:
+                stack.append((new_key, iter(v.items())))
+                break
+            flat[new_key] = v
         else:
-            items.append((new_key, v))
-    return dict(items)
+            stack.pop()
+    return flat
 
 
-def sanitize_path(path: str) -> str:
+def sanitize_path(path: str, strict: bool = False) -> str:
     """
     Sanitize a file path to prevent directory traversal attacks.
 
-    Converts the path to absolute and ensures it doesn't escape the intended
-    directory using parent references.
+    Converts the path to absolute and collapses any parent references. By
+    default this is pure string normalization and never touches the
+    filesystem; pass strict=True to also resolve symlinks.
 
     Args:
         path: Path to sanitize.
+        strict: If True, resolve symlinks via the filesystem.
 
     Returns:
         Sanitized absolute path.
@@ -96,9 +146,10 @@ def sanitize_path(path: str) -> str:
         >>> sanitize_path("/var/data/../log/app.log")
         '/var/log/app.log'
     """
-    # Resolve to absolute path and handle any .. references
-    resolved = Path(path).resolve()
-    return str(resolved)
+    expanded = os.path.expanduser(path)
+    if strict:
+        return str(Path(expanded).resolve())
+    return os.path.normpath(os.path.abspath(expanded))
 
 
 def load_json(filepath: str) -> Dict[str, Any]:
@@ -120,19 +171,31 @@ def load_json(filepath: str) -> Dict[str, Any]:
         >>> config["debug"]
         True
     """
-    if not os.path.exists(filepath):
-        raise FileNotFoundError(f"File not found: {filepath}")
+    try:
+        with open(filepath, "rb") as f:
+            content = f.read()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {filepath}") from None
 
-    with open(filepath, "r") as f:
-        return json.load(f)
+    return json.loads(content)
 
 
-def load_yaml(filepath: str) -> Dict[str, Any]:
+def load_yaml(filepath: str, json_sidecar: bool = False) -> Dict[str, Any]:
     """
     Load a YAML configuration file.
 
+    Parsed content is cached per file and invalidated when the file's
+    modification time or size changes. Each call returns an independent copy.
+
+    With json_sidecar enabled, the parsed content is also written next to the
+    YAML file as ``<file>.json`` and read from there (via the much faster JSON
+    parser) as long as it is not older than the YAML file. Content that does
+    not survive a JSON round trip (dates, non-string keys) is never cached
+    this way, and failures to write the sidecar are ignored.
+
     Args:
         filepath: Path to the YAML file.
+        json_sidecar: Read and maintain a JSON sidecar cache of the file.
 
     Returns:
         Parsed YAML content as dictionary.
@@ -152,18 +215,71 @@ def load_yaml(filepath: str) -> Dict[str, Any]:
             "PyYAML is required to load YAML files. Install with: pip install pyyaml"
         )
 
-    if not os.path.exists(filepath):
-        raise FileNotFoundError(f"File not found: {filepath}")
+    try:
+        st = os.stat(filepath)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {filepath}") from None
+
+    data = _parse_yaml(os.path.abspath(filepath), st.st_mtime_ns, st.st_size, json_sidecar)
+    return copy.deepcopy(data) if data else {}
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_yaml(filepath: str, mtime_ns: int, size: int, json_sidecar: bool) -> Any:
+    """
+    Parse a YAML file, memoized on its path, modification time and size.
+
+    Callers must not mutate the returned object; load_yaml hands out copies.
+    """
+    if not json_sidecar:
+        with open(filepath, "rb") as f:
+            return _yaml_load(f.read(), Loader=_SafeLoader)
 
-    with open(filepath, "r") as f:
-        data = yaml.safe_load(f)
-        return data if data else {}
+    sidecar_path = filepath + ".json"
+    try:
+        if os.stat(sidecar_path).st_mtime_ns >= mtime_ns:
+            with open(sidecar_path, "rb") as f:
+                return json.loads(f.read())
+    except (OSError, ValueError):
+        pass
+
+    with open(filepath, "rb") as f:
+        data = _yaml_load(f.read(), Loader=_SafeLoader)
+    _write_json_sidecar(sidecar_path, data)
+    return data
+
+
+def _write_json_sidecar(sidecar_path: str, data: Any) -> None:
+    """
+    Atomically write data as JSON, skipping data that JSON can't represent.
+    """
+    try:
+        encoded = json.dumps(data)
+    except (TypeError, ValueError):
+        return
+    if json.loads(encoded) != data:
+        return
+
+    tmp_path = f"{sidecar_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "w") as f:
+            f.write(encoded)
+        os.replace(tmp_path, sidecar_path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
 
 
 def ensure_directory(path: str) -> str:
     """
     Ensure a directory exists, creating it if necessary.
 
+    Directories ensured once are remembered for the life of the process, so
+    repeated calls for the same path skip the filesystem entirely. A directory
+    removed after it was ensured is not recreated.
+
     Args:
         path: Directory path.
 
@@ -174,7 +290,10 @@ def ensure_directory(path: str) -> str:
         >>> ensure_directory("/var/log/app")
         '/var/log/app'
     """
-    os.makedirs(path, exist_ok=True)
+    abs_path = os.path.abspath(path)
+    if abs_path not in _ENSURED_DIRS:
+        os.makedirs(path, exist_ok=True)
+        _ENSURED_DIRS.add(abs_path)
     return path
 
 
@@ -194,4 +313,10 @@ def get_file_extension(filepath: str) -> str:
         >>> get_file_extension("README")
         ''
     """
-    return Path(filepath).suffix
+    # Same rule as PurePath.suffix, without building a Path object. Trailing
+    # separators are dropped first, as pathlib does, so "dir.d/" gives ".d"
+    name = os.path.basename(filepath.rstrip(os.sep + (os.altsep or "")))
+    dot = name.rfind(".")
+    if 0 < dot < len(name) - 1:
+        return name[dot:]
+    return ""
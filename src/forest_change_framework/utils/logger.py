@@ -5,11 +5,15 @@ This module provides centralized logging setup with support for both console
 and file output, with configurable verbosity and formatting.
 """
 
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
 from typing import Optional
 
+from .helpers import ensure_directory
+
 
 def setup_logging(
     name: str = "forest_change_framework",
@@ -21,7 +25,8 @@ def setup_logging(
     Configure structured logging for the framework.
 
     Sets up logging with a consistent format for both console and optional
-    file output.
+    file output. File output is written by a background thread fed through a
+    queue; the thread is stopped and flushed at interpreter exit.
 
     Args:
         name: Logger name (typically __name__).
@@ -61,7 +66,7 @@ def setup_logging(
     # File handler (if requested)
     if log_file:
         # Create directory if needed
-        os.makedirs(os.path.dirname(os.path.abspath(log_file)), exist_ok=True)
+        ensure_directory(os.path.dirname(os.path.abspath(log_file)))
 
         file_handler = logging.handlers.RotatingFileHandler(
             log_file,
@@ -70,11 +75,51 @@ def setup_logging(
         )
         file_handler.setLevel(level)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+
+        # Hand records to a background thread so logging calls never block
+        # on disk writes or rollover
+        log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(
+            log_queue, file_handler, respect_handler_level=True
+        )
+        listener.start()
+
+        queue_handler = ListenerQueueHandler(log_queue, listener)
+        queue_handler.setLevel(level)
+        atexit.register(queue_handler.stop)
+        logger.addHandler(queue_handler)
 
     return logger
 
 
+class ListenerQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler that owns the listener writing its records.
+
+    Call stop() to write out every queued record, e.g. before reading the
+    log file; closing the handler stops the listener as well.
+    """
+
+    def __init__(
+        self,
+        log_queue: "queue.SimpleQueue[logging.LogRecord]",
+        listener: logging.handlers.QueueListener,
+    ) -> None:
+        super().__init__(log_queue)
+        self.listener = listener
+
+    def stop(self) -> None:
+        """Flush the queued records and stop the listener, if still running."""
+        # QueueListener.stop() fails if called twice, so check its worker thread
+        if getattr(self.listener, "_thread", None) is not None:
+            self.listener.stop()
+
+    def close(self) -> None:
+        """Stop the listener, then close the handler."""
+        self.stop()
+        super().close()
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance by name.
@@ -97,9 +142,16 @@ class LoggerMixin:
     Mixin that provides logging capability to classes.
 
     Provides a logger property that returns a logger with the class name.
+    The logger is looked up once per class and cached on it.
     """
 
     @property
     def logger(self) -> logging.Logger:
         """Get a logger for this class."""
-        return get_logger(self.__class__.__module__ + "." + self.__class__.__name__)
+        cls = type(self)
+        # Look in the class's own __dict__ so subclasses get their own logger
+        cached = cls.__dict__.get("_cached_logger")
+        if cached is None:
+            cached = get_logger(cls.__module__ + "." + cls.__name__)
+            cls._cached_logger = cached
+        return cached
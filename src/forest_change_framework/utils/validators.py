@@ -6,12 +6,28 @@ file paths, configuration schemas, and component interfaces.
 """
 
 import os
-from typing import Any, Callable, Dict, Optional
+import stat
+import weakref
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import re
 
 from ..core.exceptions import ValidationError
 from ..interfaces.component import BaseComponent
 
+# Normalized schemas keyed by id(schema). Each entry keeps a snapshot of the
+# schema items so a mutated (or recycled) schema dict is re-normalized.
+_SCHEMA_CACHE: Dict[int, Tuple[tuple, List[Tuple[str, Any, bool]]]] = {}
+_SCHEMA_CACHE_MAX = 256
+
+# Attributes every component class must provide
+_REQUIRED_COMPONENT_ATTRS = ("initialize", "execute", "cleanup", "name", "version")
+
+# Component classes that already passed validate_component_interface
+_VALIDATED_COMPONENTS: "weakref.WeakSet[type]" = weakref.WeakSet()
+
+# \Z rather than $ so a trailing newline can't slip through
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\Z")
+
 
 def validate_path(
     path: str, must_exist: bool = False, is_file: bool = False, is_dir: bool = False
@@ -35,20 +51,24 @@ def validate_path(
         >>> validate_path("/var/data/file.csv", must_exist=True, is_file=True)
         '/var/data/file.csv'
     """
-    # Expand user home directory
-    expanded_path = os.path.expanduser(path)
+    # Expand user home directory and normalize once; the result is both
+    # checked and returned
+    expanded_path = os.path.normpath(os.path.expanduser(path))
 
     if must_exist:
-        if not os.path.exists(expanded_path):
-            raise ValidationError(f"Path does not exist: {path}")
+        # A single stat serves the existence, file and directory checks
+        try:
+            mode = os.stat(expanded_path).st_mode
+        except (OSError, ValueError):
+            raise ValidationError(f"Path does not exist: {path}") from None
 
-        if is_file and not os.path.isfile(expanded_path):
+        if is_file and not stat.S_ISREG(mode):
             raise ValidationError(f"Path is not a file: {path}")
 
-        if is_dir and not os.path.isdir(expanded_path):
+        if is_dir and not stat.S_ISDIR(mode):
             raise ValidationError(f"Path is not a directory: {path}")
 
-    return os.path.normpath(expanded_path)
+    return expanded_path
 
 
 def validate_config(config: Dict[str, Any], schema: Dict[str, Any]) -> bool:
@@ -78,10 +98,7 @@ def validate_config(config: Dict[str, Any], schema: Dict[str, Any]) -> bool:
         >>> validate_config(config, schema)
         True
     """
-    for key, expected_type in schema.items():
-        is_optional = key.endswith("?")
-        clean_key = key.rstrip("?")
-
+    for clean_key, expected_type, is_optional in _normalize_schema(schema):
         if clean_key not in config:
             if not is_optional:
                 raise ValidationError(f"Required configuration key missing: {clean_key}")
@@ -97,10 +114,36 @@ def validate_config(config: Dict[str, Any], schema: Dict[str, Any]) -> bool:
     return True
 
 
+def _normalize_schema(schema: Dict[str, Any]) -> List[Tuple[str, Any, bool]]:
+    """
+    Split schema keys into (clean_key, expected_type, is_optional) tuples.
+
+    Results are cached per schema object, so validating many configs against
+    the same schema only parses its keys once.
+    """
+    items = tuple(schema.items())
+    cached = _SCHEMA_CACHE.get(id(schema))
+    if cached is not None and cached[0] == items:
+        return cached[1]
+
+    normalized = [
+        (key[:-1], expected_type, True) if key.endswith("?") else (key, expected_type, False)
+        for key, expected_type in items
+    ]
+    if len(_SCHEMA_CACHE) >= _SCHEMA_CACHE_MAX:
+        _SCHEMA_CACHE.clear()
+    _SCHEMA_CACHE[id(schema)] = (items, normalized)
+    return normalized
+
+
 def validate_component_interface(component: Any) -> bool:
     """
     Validate that an object implements the BaseComponent interface.
 
+    Required methods and properties are checked on the component's class, and
+    the result is remembered so later instances of the same class pass with a
+    single set lookup.
+
     Args:
         component: Object to validate.
 
@@ -120,17 +163,17 @@ def validate_component_interface(component: Any) -> bool:
             f"Component must inherit from BaseComponent, got {type(component).__name__}"
         )
 
-    required_methods = ["initialize", "execute", "cleanup"]
-    required_properties = ["name", "version"]
+    cls = type(component)
+    if cls in _VALIDATED_COMPONENTS:
+        return True
 
-    for method in required_methods:
-        if not hasattr(component, method):
-            raise ValidationError(f"Component missing required method: {method}")
-
-    for prop in required_properties:
-        if not hasattr(component, prop):
-            raise ValidationError(f"Component missing required property: {prop}")
+    missing = [attr for attr in _REQUIRED_COMPONENT_ATTRS if not hasattr(cls, attr)]
+    if missing:
+        raise ValidationError(
+            f"Component missing required attributes: {', '.join(missing)}"
+        )
 
+    _VALIDATED_COMPONENTS.add(cls)
     return True
 
 
@@ -151,8 +194,7 @@ def validate_email(email: str) -> bool:
         >>> validate_email("user@example.com")
         True
     """
-    pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-    if not re.match(pattern, email):
+    if _EMAIL_RE.match(email) is None:
         raise ValidationError(f"Invalid email format: {email}")
     return True
 
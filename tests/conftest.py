@@ -7,6 +7,7 @@ This module provides reusable fixtures for testing framework components.
 import pytest
 import tempfile
 import json
+from collections import defaultdict
 from pathlib import Path
 from typing import Any, Dict, Optional
 
@@ -32,11 +33,11 @@ def clean_registry():
     from forest_change_framework.core import get_registry
 
     registry = get_registry()
-    original_components = {}
 
-    # Save original components
-    for category, comps in registry._components.items():
-        original_components[category] = comps.copy()
+    # Snapshot original components as flat, immutable tuples
+    original_components = {
+        category: tuple(comps.items()) for category, comps in registry._components.items()
+    }
 
     # Clear for test
     registry.clear()
@@ -45,15 +46,29 @@ def clean_registry():
 
     # Restore original components
     registry.clear()
-    registry._components.update(original_components)
+    registry._components.update(
+        {category: dict(items) for category, items in original_components.items()}
+    )
 
 
-@pytest.fixture
-def framework():
-    """Provide a fresh BaseFramework instance for testing."""
+@pytest.fixture(scope="session")
+def _session_framework():
+    """Build the BaseFramework once; loading the config folder is not free."""
     return BaseFramework()
 
 
+@pytest.fixture
+def framework(_session_framework):
+    """
+    Provide the shared BaseFramework instance for testing.
+
+    The framework only holds per-test state in its event bus, which is
+    cleared after each test so subscriptions never leak between tests.
+    """
+    yield _session_framework
+    _session_framework.event_bus.clear()
+
+
 @pytest.fixture
 def event_bus():
     """Provide a fresh EventBus instance for testing."""
@@ -220,6 +235,16 @@ def event_tracking_component_class():
     return EventTrackingComponent
 
 
+@pytest.fixture(scope="session")
+def dataset_organizer_class():
+    """Provide the registered dataset organizer component class."""
+    # Importing the package registers the component
+    import forest_change_framework.components.export.dataset_organizer  # noqa: F401
+    from forest_change_framework.core import get_registry
+
+    return get_registry().get("export", "dataset_organizer")
+
+
 # ========== DATA FIXTURES ==========
 
 @pytest.fixture
@@ -267,29 +292,45 @@ def event_collector():
     class EventCollector:
         def __init__(self):
             self.events = []
+            self.by_name = defaultdict(list)
 
         def collect(self, event_name, event_data):
             self.events.append({
                 "name": event_name,
                 "data": event_data,
             })
+            self.by_name[event_name].append(event_data)
 
         def get_events(self, event_name=None):
             if event_name:
-                return [e for e in self.events if e["name"] == event_name]
+                return [
+                    {"name": event_name, "data": data}
+                    for data in self.by_name.get(event_name, ())
+                ]
             return self.events
 
         def clear(self):
             self.events.clear()
+            self.by_name.clear()
 
         def has_event(self, event_name):
-            return any(e["name"] == event_name for e in self.events)
+            return event_name in self.by_name
 
     return EventCollector()
 
 
 # ========== MARKERS ==========
 
+def pytest_addoption(parser):
+    """Add command line options for the test suite."""
+    parser.addoption(
+        "--run-slow",
+        action="store_true",
+        default=False,
+        help="Run tests marked as slow (skipped by default)",
+    )
+
+
 def pytest_configure(config):
     """Register custom pytest markers."""
     config.addinivalue_line(
@@ -301,3 +342,14 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "slow: Slow tests"
     )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip tests marked as slow unless --run-slow is given."""
+    if config.getoption("--run-slow"):
+        return
+
+    skip_slow = pytest.mark.skip(reason="slow test, use --run-slow to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
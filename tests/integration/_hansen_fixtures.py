@@ -0,0 +1,233 @@
+"""
+Mock Hansen tile writers shared by the Hansen integration tests.
+
+Every tile is TILE_PX square and holds the three Hansen layers
+(treecover2000, lossyear, datamask) as one single-band file each, named and
+laid out the way the Hansen component expects in its data folder.
+
+Set FAST_MOCK_TILES=1 to write the mock layers as raw ENVI rasters rather
+than GeoTIFFs, which skips libtiff encoding entirely.
+"""
+
+import functools
+import os
+import zlib
+
+import numpy as np
+from rasterio.io import MemoryFile
+from rasterio.transform import Affine
+
+# Mock tile size in pixels. The tests check band order, CRS and shapes,
+# none of which need a large grid.
+TILE_PX = 16
+
+LAYERS = ("treecover2000", "lossyear", "datamask")
+
+# Creation options shared by every mock layer file; only the transform
+# differs per tile. Plain strips: tiling buys nothing at this size, and
+# compression is chosen per layer in write_layer. The files are tiny, so
+# classic 32-bit offsets always suffice, and all-zero strips (if a layer
+# ever has them) need not be written at all.
+LAYER_PROFILE = {
+    'driver': 'GTiff',
+    'height': TILE_PX,
+    'width': TILE_PX,
+    'count': 1,
+    'dtype': 'uint8',
+    'crs': 'EPSG:4326',
+    'tiled': False,
+    'BIGTIFF': 'NO',
+    'SPARSE_OK': 'YES',
+}
+
+# Opt-in: write mock layers as raw ENVI rasters (data plus a text header)
+# instead of encoding GeoTIFFs. The file names keep their .tif extension.
+FAST_MOCK_TILES = bool(os.environ.get("FAST_MOCK_TILES"))
+
+# Per-tile layer file that is really a VRT onto a window of one band of the
+# shared strip. GDAL recognises VRT XML by content, so the component's .tif
+# names still work.
+TILE_VRT = """<VRTDataset rasterXSize="{tile_px}" rasterYSize="{tile_px}">
+  <SRS>EPSG:4326</SRS>
+  <GeoTransform>{minx}, {pixel_size}, 0, {maxy}, 0, -{pixel_size}</GeoTransform>
+  <VRTRasterBand dataType="Byte" band="1">
+    <SimpleSource>
+      <SourceFilename relativeToVRT="1">../{source}</SourceFilename>
+      <SourceBand>{band}</SourceBand>
+      <SrcRect xOff="{x_off}" yOff="0" xSize="{tile_px}" ySize="{tile_px}"/>
+      <DstRect xOff="0" yOff="0" xSize="{tile_px}" ySize="{tile_px}"/>
+    </SimpleSource>
+  </VRTRasterBand>
+</VRTDataset>
+"""
+
+
+def layer_filename(layer, tile_id):
+    """Return the file name the component looks for for a tile layer."""
+    return f"Hansen_GFC-2024-v1.12_{layer}_{tile_id}.tif"
+
+
+@functools.lru_cache(maxsize=None)
+def tile_bounds(tile_id):
+    """
+    Return (minx, miny, maxx, maxy) of a 10x10 degree tile from its ID.
+
+    Format: 00N_000E = latitude 0, longitude 0.
+    """
+    lat_str, lon_str = tile_id.split("_", 1)  # e.g., "00N", "010W"
+    lat_deg = int(lat_str[:2])
+    lon_deg = int(lon_str[:3])
+
+    if lat_str[2] == 'N':
+        miny, maxy = lat_deg, lat_deg + 10
+    else:
+        miny, maxy = -(lat_deg + 10), -lat_deg
+
+    if lon_str[3] == 'E':
+        minx, maxx = lon_deg, lon_deg + 10
+    else:
+        minx, maxx = -(lon_deg + 10), -lon_deg
+
+    return minx, miny, maxx, maxy
+
+
+def tile_transform(tile_id):
+    """Return the geotransform of a TILE_PX square tile (10 degrees across)."""
+    minx, miny, maxx, maxy = tile_bounds(tile_id)
+    pixel_size = (maxx - minx) / TILE_PX
+    return Affine.translation(minx, maxy) * Affine.scale(pixel_size, -pixel_size)
+
+
+@functools.lru_cache(maxsize=None)
+def random_layers(tile_id):
+    """
+    Return deterministic (treecover2000, lossyear, datamask) arrays for a tile.
+
+    Seeded per tile so the data does not depend on call order. The arrays
+    are cached and shared, so they are returned read-only.
+    """
+    rng = np.random.default_rng([42, zlib.crc32(tile_id.encode())])
+    arrays = (
+        rng.integers(0, 100, (TILE_PX, TILE_PX), dtype=np.uint8),
+        rng.integers(0, 22, (TILE_PX, TILE_PX), dtype=np.uint8),
+        # Constant layer: a zero-copy view of one value, read-only by design
+        np.broadcast_to(np.uint8(1), (TILE_PX, TILE_PX)),
+    )
+    for array in arrays[:2]:
+        array.setflags(write=False)
+    return arrays
+
+
+def constant_layers(*values):
+    """
+    Return one constant TILE_PX square layer per value.
+
+    The layers are broadcast views, so no per-layer buffers are allocated.
+    """
+    return tuple(np.broadcast_to(np.uint8(value), (TILE_PX, TILE_PX)) for value in values)
+
+
+def _write_envi(filepath, data, transform):
+    """
+    Write a (bands, height, width) uint8 array as raw BSQ ENVI data plus a .hdr.
+
+    GDAL finds the header next to the data file, so rasterio opens the
+    result through the ENVI driver whatever the data file is called.
+    """
+    count, height, width = data.shape
+    filepath.write_bytes(np.ascontiguousarray(data).tobytes())
+    filepath.with_suffix(".hdr").write_text(
+        "ENVI\n"
+        f"samples = {width}\n"
+        f"lines = {height}\n"
+        f"bands = {count}\n"
+        "header offset = 0\n"
+        "data type = 1\n"
+        "interleave = bsq\n"
+        "byte order = 0\n"
+        f"map info = {{Geographic Lat/Lon, 1, 1, {transform.c}, {transform.f}, "
+        f"{transform.a}, {-transform.e}, WGS-84}}\n"
+    )
+
+
+def write_layer(filepath, data, transform):
+    """
+    Write a GeoTIFF with the shared layer profile.
+
+    A 2-D array becomes a single-band file; a (bands, height, width) array
+    is written as all its bands in one call.
+    """
+    if data.ndim == 2:
+        data = data[np.newaxis]
+
+    if FAST_MOCK_TILES:
+        _write_envi(filepath, data, transform)
+        return
+
+    count, height, width = data.shape
+    profile = dict(LAYER_PROFILE, count=count, height=height, width=width, transform=transform)
+    # Random layers do not compress, so encoding them would be wasted work;
+    # constant layers shrink to almost nothing under LZW
+    if data.min() == data.max():
+        profile['compress'] = 'LZW'
+
+    # Encode in memory, then put the finished GeoTIFF on disk in one write
+    with MemoryFile() as memfile:
+        with memfile.open(**profile) as dst:
+            dst.write(data)
+        filepath.write_bytes(memfile.read())
+
+
+def make_tile(data_folder, tile_id, layers):
+    """
+    Write one file per layer for a tile, georeferenced from its tile ID.
+
+    Args:
+        data_folder: Component data folder; the tile gets its own subfolder
+        tile_id: Hansen tile ID, e.g. "00N_000E"
+        layers: One array per entry of LAYERS, in that order
+    """
+    tile_dir = data_folder / tile_id
+    tile_dir.mkdir()
+
+    transform = tile_transform(tile_id)
+    for layer, data in zip(LAYERS, layers):
+        write_layer(tile_dir / layer_filename(layer, tile_id), data, transform)
+
+
+def make_strip_tiles(data_folder, tile_ids, layers_for=random_layers):
+    """
+    Write several tiles while encoding only one raster in total.
+
+    All tiles are written side by side as one strip with a band per layer,
+    and every tile layer file is a small VRT onto that tile's window of its
+    layer's band.
+
+    Args:
+        data_folder: Component data folder
+        tile_ids: Hansen tile IDs, one subfolder each
+        layers_for: Returns the layer arrays for a tile ID
+    """
+    tile_arrays = [layers_for(tile_id) for tile_id in tile_ids]
+
+    # (layers, TILE_PX, tiles * TILE_PX); the strip's own georeferencing
+    # is never used
+    strip = np.concatenate([np.stack(arrays) for arrays in tile_arrays], axis=2)
+    write_layer(data_folder / "shared.tif", strip, Affine.scale(10 / TILE_PX, -10 / TILE_PX))
+
+    for position, tile_id in enumerate(tile_ids):
+        tile_dir = data_folder / tile_id
+        tile_dir.mkdir()
+
+        minx, miny, maxx, maxy = tile_bounds(tile_id)
+        for band, layer in enumerate(LAYERS, start=1):
+            vrt = TILE_VRT.format(
+                minx=minx,
+                maxy=maxy,
+                tile_px=TILE_PX,
+                pixel_size=(maxx - minx) / TILE_PX,
+                source="shared.tif",
+                band=band,
+                x_off=position * TILE_PX,
+            )
+            (tile_dir / layer_filename(layer, tile_id)).write_text(vrt)
@@ -0,0 +1,75 @@
+"""
+Mock imagery sample writers shared by the dataset organizer integration tests.
+
+Every sample is a directory holding metadata.json plus pre.png and
+post.png, laid out the way the imagery downloader writes them.
+"""
+
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Iterable, Tuple
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Smallest valid PNG (1x1 transparent RGBA). The organizer only copies the
+# imagery files, so every sample shares these bytes.
+MIN_PNG = bytes.fromhex(
+    "89504e470d0a1a0a0000000d49484452000000010000000108060000001f15c489"
+    "0000000b4944415478da636000020000050001e9fadcd80000000049454e44ae426082"
+)
+
+
+def json_bytes(data: Any) -> bytes:
+    """
+    Serialize data as compact JSON bytes (msgspec, then orjson, then json).
+
+    data may be a dict, or a msgspec Struct when msgspec is installed.
+    """
+    if msgspec is not None:
+        return msgspec.json.encode(data)
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode()
+
+
+def write_json(path: Path, data: Any) -> None:
+    """Write data as compact JSON with a single write call."""
+    path.write_bytes(json_bytes(data))
+
+
+def build_sample(sample_dir: Path, metadata_bytes: bytes, png_bytes: bytes = MIN_PNG) -> None:
+    """
+    Create one mock imagery sample directory from pre-serialized metadata.
+
+    The imagery root must already exist; samples are never nested deeper.
+    """
+    sample_dir.mkdir(exist_ok=True)
+    (sample_dir / "metadata.json").write_bytes(metadata_bytes)
+    (sample_dir / "pre.png").write_bytes(png_bytes)
+    (sample_dir / "post.png").write_bytes(png_bytes)
+
+
+def build_samples(samples: Iterable[Tuple[Path, Any]], png_bytes: bytes = MIN_PNG) -> None:
+    """
+    Create mock sample directories concurrently; the work is all file I/O.
+
+    Args:
+        samples: (sample_dir, metadata) pairs
+        png_bytes: Contents of every pre.png and post.png
+    """
+    # Serialize every payload up front so the workers only write files
+    payloads = [(sample_dir, json_bytes(metadata)) for sample_dir, metadata in samples]
+
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+        # list() surfaces any exception raised in a worker
+        list(executor.map(lambda item: build_sample(*item, png_bytes), payloads))
@@ -5,208 +5,291 @@ Tests the complete component lifecycle from registration through execution.
 """
 
 import pytest
-from forest_change_framework import BaseFramework, register_component
+from forest_change_framework import BaseFramework
+from forest_change_framework.core import get_registry
 from forest_change_framework.interfaces import BaseComponent
 
 
-@pytest.mark.integration
-class TestComponentLifecycle:
-    """Test component lifecycle management."""
+# ========== TEST COMPONENTS ==========
+# Defined once at import time and registered by the lifecycle_components
+# fixture. Tests reset the class-level call lists before executing.
 
-    def test_component_initialization_sequence(self, framework, clean_registry):
-        """Test component initialization sequence."""
-        init_calls = []
+class SequenceTestComponent(BaseComponent):
+    init_calls = []
 
-        @register_component("test", "seq_test")
-        class SequenceTestComponent(BaseComponent):
-            @property
-            def name(self):
-                return "seq_test"
+    @property
+    def name(self):
+        return "seq_test"
 
-            @property
-            def version(self):
-                return "1.0.0"
+    @property
+    def version(self):
+        return "1.0.0"
 
-            def initialize(self, config):
-                init_calls.append(("initialize", config))
+    def initialize(self, config):
+        self.init_calls.append(("initialize", config))
 
-            def execute(self, *args, **kwargs):
-                init_calls.append(("execute", args, kwargs))
+    def execute(self, *args, **kwargs):
+        self.init_calls.append(("execute", args, kwargs))
 
-            def cleanup(self):
-                init_calls.append(("cleanup",))
+    def cleanup(self):
+        self.init_calls.append(("cleanup",))
 
-        result = framework.execute_component(
-            "test",
-            "seq_test",
-            {"test": "config"}
-        )
 
-        # Verify sequence
-        assert len(init_calls) == 3
-        assert init_calls[0][0] == "initialize"
-        assert init_calls[1][0] == "execute"
-        assert init_calls[2][0] == "cleanup"
+class ErrorTestComponent(BaseComponent):
+    cleanup_called = []
 
-    def test_component_cleanup_on_error(self, framework, clean_registry):
-        """Test cleanup is called even on error."""
-        cleanup_called = []
+    @property
+    def name(self):
+        return "error_test"
 
-        @register_component("test", "error_test")
-        class ErrorTestComponent(BaseComponent):
-            @property
-            def name(self):
-                return "error_test"
+    @property
+    def version(self):
+        return "1.0.0"
 
-            @property
-            def version(self):
-                return "1.0.0"
+    def initialize(self, config):
+        pass
 
-            def initialize(self, config):
-                pass
+    def execute(self, *args, **kwargs):
+        raise RuntimeError("Intentional error")
 
-            def execute(self, *args, **kwargs):
-                raise RuntimeError("Intentional error")
+    def cleanup(self):
+        self.cleanup_called.append(True)
 
-            def cleanup(self):
-                cleanup_called.append(True)
 
-        with pytest.raises(RuntimeError):
-            framework.execute_component("test", "error_test")
+class ProducerComponent(BaseComponent):
+    execution_order = []
 
-        # Cleanup should still be called
-        assert len(cleanup_called) == 1
+    @property
+    def name(self):
+        return "producer"
 
-    def test_event_driven_component_chain(self, framework, clean_registry, event_collector):
-        """Test event-driven communication between components."""
-        execution_order = []
+    @property
+    def version(self):
+        return "1.0.0"
 
-        @register_component("stage1", "producer")
-        class ProducerComponent(BaseComponent):
-            @property
-            def name(self):
-                return "producer"
+    def initialize(self, config):
+        pass
 
-            @property
-            def version(self):
-                return "1.0.0"
+    def execute(self, *args, **kwargs):
+        self.execution_order.append("producer")
+        self.publish_event("data.ready", {"data": "test_data"})
+        return "produced_data"
 
-            def initialize(self, config):
-                pass
+    def cleanup(self):
+        pass
 
-            def execute(self, *args, **kwargs):
-                execution_order.append("producer")
-                self.publish_event("data.ready", {"data": "test_data"})
-                return "produced_data"
 
-            def cleanup(self):
-                pass
+class ConsumerComponent(BaseComponent):
+    execution_order = ProducerComponent.execution_order
 
-        @register_component("stage2", "consumer")
-        class ConsumerComponent(BaseComponent):
-            def __init__(self, event_bus, config=None):
-                super().__init__(event_bus, config)
-                self.received_data = None
+    def __init__(self, event_bus, config=None):
+        super().__init__(event_bus, config)
+        self.received_data = None
 
-            @property
-            def name(self):
-                return "consumer"
+    @property
+    def name(self):
+        return "consumer"
 
-            @property
-            def version(self):
-                return "1.0.0"
+    @property
+    def version(self):
+        return "1.0.0"
 
-            def initialize(self, config):
-                # Subscribe to producer event
-                self.subscribe_event("data.ready", self.on_data_ready)
+    def initialize(self, config):
+        # Subscribe to producer event
+        self.subscribe_event("data.ready", self.on_data_ready)
 
-            def execute(self, *args, **kwargs):
-                execution_order.append("consumer")
-                return self.received_data
+    def execute(self, *args, **kwargs):
+        self.execution_order.append("consumer")
+        return self.received_data
 
-            def cleanup(self):
-                pass
+    def cleanup(self):
+        pass
 
-            def on_data_ready(self, event_name, data):
-                self.received_data = data.get("data")
+    def on_data_ready(self, event_name, data):
+        self.received_data = data.get("data")
 
-        # Setup event collector
-        framework.subscribe_event("data.ready", event_collector.collect)
 
-        # Execute producer
-        result = framework.execute_component("stage1", "producer")
+class Component1(BaseComponent):
+    @property
+    def name(self):
+        return "comp1"
 
-        assert "producer" in execution_order
-        assert event_collector.has_event("data.ready")
+    @property
+    def version(self):
+        return "1.0.0"
 
-    def test_multiple_components_same_category(self, framework, clean_registry):
-        """Test multiple components in same category."""
-        @register_component("process", "comp1")
-        class Component1(BaseComponent):
-            @property
-            def name(self):
-                return "comp1"
+    def initialize(self, config):
+        pass
 
-            @property
-            def version(self):
-                return "1.0.0"
+    def execute(self, *args, **kwargs):
+        return "result1"
 
-            def initialize(self, config):
-                pass
+    def cleanup(self):
+        pass
 
-            def execute(self, *args, **kwargs):
-                return "result1"
 
-            def cleanup(self):
-                pass
+class Component2(BaseComponent):
+    @property
+    def name(self):
+        return "comp2"
 
-        @register_component("process", "comp2")
-        class Component2(BaseComponent):
-            @property
-            def name(self):
-                return "comp2"
+    @property
+    def version(self):
+        return "1.0.0"
 
-            @property
-            def version(self):
-                return "1.0.0"
+    def initialize(self, config):
+        pass
 
-            def initialize(self, config):
-                pass
+    def execute(self, *args, **kwargs):
+        return "result2"
 
-            def execute(self, *args, **kwargs):
-                return "result2"
+    def cleanup(self):
+        pass
 
-            def cleanup(self):
-                pass
 
-        result1 = framework.execute_component("process", "comp1")
-        result2 = framework.execute_component("process", "comp2")
+class ConfigTestComponent(BaseComponent):
+    received_config = []
 
-        assert result1 == "result1"
-        assert result2 == "result2"
+    @property
+    def name(self):
+        return "test"
 
-    def test_component_configuration_inheritance(self, framework, clean_registry):
-        """Test component configuration is properly passed."""
-        received_config = []
+    @property
+    def version(self):
+        return "1.0.0"
+
+    def initialize(self, config):
+        self.received_config.append(config)
+
+    def execute(self, *args, **kwargs):
+        return self.get_config("key1")
+
+    def cleanup(self):
+        pass
+
+
+class DetectorComponent(BaseComponent):
+    @property
+    def name(self):
+        return "detector"
+
+    @property
+    def version(self):
+        return "1.0.0"
+
+    def initialize(self, config):
+        pass
+
+    def execute(self, *args, **kwargs):
+        return "detected"
 
-        @register_component("config", "test")
-        class ConfigTestComponent(BaseComponent):
-            @property
-            def name(self):
-                return "test"
+    def cleanup(self):
+        pass
 
-            @property
-            def version(self):
-                return "1.0.0"
 
-            def initialize(self, config):
-                received_config.append(config)
+class FaultyComponent(BaseComponent):
+    @property
+    def name(self):
+        return "faulty"
 
-            def execute(self, *args, **kwargs):
-                return self.get_config("key1")
+    @property
+    def version(self):
+        return "1.0.0"
 
-            def cleanup(self):
-                pass
+    def initialize(self, config):
+        pass
+
+    def execute(self, *args, **kwargs):
+        raise ValueError("Component failed")
+
+    def cleanup(self):
+        pass
+
+
+# (class, category, name)
+_LIFECYCLE_COMPONENTS = [
+    (SequenceTestComponent, "test", "seq_test"),
+    (ErrorTestComponent, "test", "error_test"),
+    (ProducerComponent, "stage1", "producer"),
+    (ConsumerComponent, "stage2", "consumer"),
+    (Component1, "process", "comp1"),
+    (Component2, "process", "comp2"),
+    (ConfigTestComponent, "config", "test"),
+    (DetectorComponent, "analyze", "detector"),
+    (FaultyComponent, "error", "faulty"),
+]
+
+
+@pytest.fixture(scope="module")
+def lifecycle_components():
+    """Register the test components once for this module."""
+    registry = get_registry()
+    for component_class, category, name in _LIFECYCLE_COMPONENTS:
+        registry.register(component_class, name, category, version="1.0.0")
+
+    yield registry
+
+    for _, category, name in _LIFECYCLE_COMPONENTS:
+        registry.unregister(category, name)
+
+
+@pytest.mark.integration
+class TestComponentLifecycle:
+    """Test component lifecycle management."""
+
+    def test_component_initialization_sequence(self, framework, lifecycle_components):
+        """Test component initialization sequence."""
+        SequenceTestComponent.init_calls = init_calls = []
+
+        result = framework.execute_component(
+            "test",
+            "seq_test",
+            {"test": "config"}
+        )
+
+        # Verify sequence
+        assert len(init_calls) == 3
+        assert init_calls[0][0] == "initialize"
+        assert init_calls[1][0] == "execute"
+        assert init_calls[2][0] == "cleanup"
+
+    def test_component_cleanup_on_error(self, framework, lifecycle_components):
+        """Test cleanup is called even on error."""
+        ErrorTestComponent.cleanup_called = cleanup_called = []
+
+        with pytest.raises(RuntimeError):
+            framework.execute_component("test", "error_test")
+
+        # Cleanup should still be called
+        assert len(cleanup_called) == 1
+
+    def test_event_driven_component_chain(
+        self, framework, lifecycle_components, event_collector
+    ):
+        """Test event-driven communication between components."""
+        ProducerComponent.execution_order = execution_order = []
+        ConsumerComponent.execution_order = execution_order
+
+        # Setup event collector
+        framework.subscribe_event("data.ready", event_collector.collect)
+
+        # Execute producer
+        result = framework.execute_component("stage1", "producer")
+
+        assert "producer" in execution_order
+        assert event_collector.has_event("data.ready")
+
+    def test_multiple_components_same_category(self, framework, lifecycle_components):
+        """Test multiple components in same category."""
+        result1 = framework.execute_component("process", "comp1")
+        result2 = framework.execute_component("process", "comp2")
+
+        assert result1 == "result1"
+        assert result2 == "result2"
+
+    def test_component_configuration_inheritance(self, framework, lifecycle_components):
+        """Test component configuration is properly passed."""
+        ConfigTestComponent.received_config = received_config = []
 
         result = framework.execute_component(
             "config",
@@ -231,7 +314,7 @@ class TestEventDrivenCommunication:
         framework.publish_event("test.event", {"key": "value"})
 
         assert event_collector.has_event("test.event")
-        assert event_collector.events[0]["data"]["key"] == "value"
+        assert event_collector.by_name["test.event"][0]["key"] == "value"
 
     def test_multiple_event_subscriptions(self, framework):
         """Test multiple subscriptions to different events."""
@@ -273,27 +356,8 @@ class TestEventDrivenCommunication:
 class TestFrameworkIntegration:
     """Test framework integration with components."""
 
-    def test_list_and_get_components(self, framework, clean_registry):
+    def test_list_and_get_components(self, framework, lifecycle_components):
         """Test listing and retrieving components."""
-        @register_component("analyze", "detector")
-        class DetectorComponent(BaseComponent):
-            @property
-            def name(self):
-                return "detector"
-
-            @property
-            def version(self):
-                return "1.0.0"
-
-            def initialize(self, config):
-                pass
-
-            def execute(self, *args, **kwargs):
-                return "detected"
-
-            def cleanup(self):
-                pass
-
         components = framework.list_components("analyze")
         assert "analyze" in components
         assert "detector" in components["analyze"]
@@ -302,27 +366,8 @@ class TestFrameworkIntegration:
         assert info["name"] == "detector"
         assert info["version"] == "1.0.0"
 
-    def test_error_handling_in_framework(self, framework, clean_registry):
+    def test_error_handling_in_framework(self, framework, lifecycle_components):
         """Test framework error handling."""
-        @register_component("error", "faulty")
-        class FaultyComponent(BaseComponent):
-            @property
-            def name(self):
-                return "faulty"
-
-            @property
-            def version(self):
-                return "1.0.0"
-
-            def initialize(self, config):
-                pass
-
-            def execute(self, *args, **kwargs):
-                raise ValueError("Component failed")
-
-            def cleanup(self):
-                pass
-
         with pytest.raises(ValueError):
             framework.execute_component("error", "faulty")
 
@@ -1,27 +1,26 @@
 """Integration tests for dataset organizer component."""
 
-import json
 import shutil
 import tempfile
 from pathlib import Path
 from typing import Dict, Any
 
 import pytest
-import numpy as np
-try:
-    from PIL import Image
-except ImportError:
-    Image = None
 
-from forest_change_framework import BaseFramework
+from forest_change_framework import BaseFramework, EventBus
 from forest_change_framework.components.export.dataset_organizer import DatasetOrganizerComponent
 
+from . import _organizer_fixtures as mock_samples
 
-@pytest.fixture
-def sample_imagery_directory(tmp_path):
+
+@pytest.fixture(scope="session")
+def sample_imagery_directory(tmp_path_factory):
     """
     Create a mock imagery_downloader output directory with sample metadata and dummy imagery.
 
+    Built once per session: the organizer only reads (copies) from it, and
+    each test writes its output under its own tmp_path.
+
     Structure:
         imagery_output/
         ├── 000001/
@@ -34,15 +33,12 @@ def sample_imagery_directory(tmp_path):
         │   └── post.png
         ...
     """
-    imagery_dir = tmp_path / "imagery_output"
+    imagery_dir = tmp_path_factory.mktemp("imagery") / "imagery_output"
     imagery_dir.mkdir(parents=True, exist_ok=True)
 
     # Create 10 sample imagery directories with metadata
+    samples = []
     for sample_id in range(1, 11):
-        sample_dir = imagery_dir / f"{sample_id:06d}"
-        sample_dir.mkdir(parents=True, exist_ok=True)
-
-        # Create metadata.json
         metadata = {
             "sample_id": f"{sample_id:06d}",
             "bbox": [
@@ -55,25 +51,14 @@ def sample_imagery_directory(tmp_path):
             "cloud_cover": 5 + (sample_id % 10),
             "source": "sentinel-2",
         }
+        samples.append((imagery_dir / f"{sample_id:06d}", metadata))
 
-        with open(sample_dir / "metadata.json", "w") as f:
-            json.dump(metadata, f)
-
-        # Create dummy PNG imagery (8x8 small image)
-        if Image:
-            img_array = np.random.randint(0, 256, (8, 8, 3), dtype=np.uint8)
-            img = Image.fromarray(img_array)
-            img.save(sample_dir / "pre.png")
-            img.save(sample_dir / "post.png")
-        else:
-            # Fallback: create minimal PNG files
-            (sample_dir / "pre.png").write_bytes(b"PNG_DATA")
-            (sample_dir / "post.png").write_bytes(b"PNG_DATA")
+    mock_samples.build_samples(samples)
 
     return str(imagery_dir)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_patches_directory():
     """Use actual sample patches from the project data folder."""
     patches_dir = Path("/home/bitwise/Projects/forest-change-framework/data/sample_extractor_output/patches")
@@ -84,9 +69,9 @@ def sample_patches_directory():
     return str(patches_dir)
 
 
-@pytest.fixture
-def dataset_organizer_config(sample_imagery_directory, sample_patches_directory, tmp_path):
-    """Create configuration for dataset organizer."""
+@pytest.fixture(scope="session")
+def dataset_organizer_config(sample_imagery_directory, sample_patches_directory):
+    """Create configuration for dataset organizer; tests must copy before mutating."""
     return {
         "imagery_directory": sample_imagery_directory,
         "sample_patches_directory": sample_patches_directory,
@@ -99,35 +84,66 @@ def dataset_organizer_config(sample_imagery_directory, sample_patches_directory,
     }
 
 
+@pytest.fixture
+def minimal_config(tmp_path):
+    """
+    Create a config-only setup for tests that never execute the component.
+
+    Points both directories at one empty folder, so no imagery is built.
+    """
+    imagery = tmp_path / "empty_imagery"
+    imagery.mkdir()
+    return {
+        "imagery_directory": str(imagery),
+        "sample_patches_directory": str(imagery),
+        "train_percentage": 70.0,
+        "val_percentage": 15.0,
+        "test_percentage": 15.0,
+    }
+
+
+@pytest.fixture(scope="module")
+def executed_organizer(dataset_organizer_config, dataset_organizer_class, tmp_path_factory):
+    """
+    Run the organizer once with the default config and return its result.
+
+    Shared by the tests that only inspect the output of a standard run.
+    """
+    config = {
+        **dataset_organizer_config,
+        "output_base_dir": str(tmp_path_factory.mktemp("organized")),
+        "create_metadata_csv": True,
+    }
+    component = dataset_organizer_class(EventBus(), config)
+    component.initialize(config)
+    return component.execute()
+
+
 class TestDatasetOrganizerComponentIntegration:
     """Integration tests for DatasetOrganizerComponent."""
 
-    def test_component_initialization(self, framework, dataset_organizer_config):
+    def test_component_initialization(self, framework, dataset_organizer_class, minimal_config):
         """Test component can be initialized with valid config."""
-        from forest_change_framework.core import get_registry
-
-        registry = get_registry()
-        component_class = registry.get("export", "dataset_organizer")
-
         # Create instance
-        component = component_class(framework.event_bus, dataset_organizer_config)
-        component.initialize(dataset_organizer_config)
+        component = dataset_organizer_class(framework.event_bus, minimal_config)
+        component.initialize(minimal_config)
 
         assert component.name == "dataset_organizer"
         assert component.version == "1.0.0"
 
-    def test_component_execution(self, framework, dataset_organizer_config, tmp_path):
+    def test_component_execution(
+        self,
+        framework,
+        dataset_organizer_class,
+        dataset_organizer_config,
+        tmp_path,
+    ):
         """Test component can execute with sample data."""
-        from forest_change_framework.core import get_registry
-
-        registry = get_registry()
-        component_class = registry.get("export", "dataset_organizer")
-
         # Create component with temp output directory
         config = dataset_organizer_config.copy()
         config["output_base_dir"] = str(tmp_path)
 
-        component = component_class(framework.event_bus, config)
+        component = dataset_organizer_class(framework.event_bus, config)
         component.initialize(config)
 
         # Execute
@@ -138,43 +154,18 @@ class TestDatasetOrganizerComponentIntegration:
         assert "output_directory" in result
         assert result["samples_organized"] >= 0
 
-    def test_output_directory_structure(self, framework, dataset_organizer_config, tmp_path):
+    def test_output_directory_structure(self, executed_organizer):
         """Test that output directory has correct structure."""
-        from forest_change_framework.core import get_registry
-
-        registry = get_registry()
-        component_class = registry.get("export", "dataset_organizer")
-
-        config = dataset_organizer_config.copy()
-        config["output_base_dir"] = str(tmp_path)
-
-        component = component_class(framework.event_bus, config)
-        component.initialize(config)
-        result = component.execute()
-
-        output_dir = Path(result["output_directory"])
+        output_dir = Path(executed_organizer["output_directory"])
 
         # Check split directories exist
         assert (output_dir / "train").exists()
         assert (output_dir / "val").exists()
         assert (output_dir / "test").exists()
 
-    def test_metadata_csv_generation(self, framework, dataset_organizer_config, tmp_path):
+    def test_metadata_csv_generation(self, executed_organizer):
         """Test that metadata CSV is generated."""
-        from forest_change_framework.core import get_registry
-
-        registry = get_registry()
-        component_class = registry.get("export", "dataset_organizer")
-
-        config = dataset_organizer_config.copy()
-        config["output_base_dir"] = str(tmp_path)
-        config["create_metadata_csv"] = True
-
-        component = component_class(framework.event_bus, config)
-        component.initialize(config)
-        result = component.execute()
-
-        output_dir = Path(result["output_directory"])
+        output_dir = Path(executed_organizer["output_directory"])
         metadata_csv = output_dir / "metadata.csv"
 
         # Check metadata CSV exists
@@ -185,32 +176,24 @@ class TestDatasetOrganizerComponentIntegration:
             lines = f.readlines()
             assert len(lines) > 1  # Header + at least one sample
 
-    def test_validation_report(self, framework, dataset_organizer_config, tmp_path):
+    def test_validation_report(self, executed_organizer):
         """Test that validation report is generated."""
-        from forest_change_framework.core import get_registry
-
-        registry = get_registry()
-        component_class = registry.get("export", "dataset_organizer")
-
-        config = dataset_organizer_config.copy()
-        config["output_base_dir"] = str(tmp_path)
-
-        component = component_class(framework.event_bus, config)
-        component.initialize(config)
-        result = component.execute()
+        result = executed_organizer
 
         assert "validation" in result
         assert "status" in result["validation"]
         assert "total_triplets" in result["validation"]
         assert "complete_triplets" in result["validation"]
 
-    def test_event_publishing(self, framework, dataset_organizer_config, tmp_path, event_collector):
+    def test_event_publishing(
+        self,
+        framework,
+        dataset_organizer_class,
+        dataset_organizer_config,
+        tmp_path,
+        event_collector,
+    ):
         """Test that component publishes correct events."""
-        from forest_change_framework.core import get_registry
-
-        registry = get_registry()
-        component_class = registry.get("export", "dataset_organizer")
-
         # Subscribe to events
         framework.subscribe_event("dataset_organizer.start", event_collector.collect)
         framework.subscribe_event("dataset_organizer.progress", event_collector.collect)
@@ -219,7 +202,7 @@ class TestDatasetOrganizerComponentIntegration:
         config = dataset_organizer_config.copy()
         config["output_base_dir"] = str(tmp_path)
 
-        component = component_class(framework.event_bus, config)
+        component = dataset_organizer_class(framework.event_bus, config)
         component.initialize(config)
         result = component.execute()
 
@@ -227,13 +210,14 @@ class TestDatasetOrganizerComponentIntegration:
         assert event_collector.has_event("dataset_organizer.start")
         assert event_collector.has_event("dataset_organizer.complete")
 
-    def test_configuration_validation_missing_imagery_dir(self, framework, sample_patches_directory, tmp_path):
+    def test_configuration_validation_missing_imagery_dir(
+        self,
+        framework,
+        dataset_organizer_class,
+        sample_patches_directory,
+        tmp_path,
+    ):
         """Test configuration validation rejects missing imagery directory."""
-        from forest_change_framework.core import get_registry
-
-        registry = get_registry()
-        component_class = registry.get("export", "dataset_organizer")
-
         config = {
             "imagery_directory": "/nonexistent/path",
             "sample_patches_directory": sample_patches_directory,
@@ -242,70 +226,58 @@ class TestDatasetOrganizerComponentIntegration:
             "test_percentage": 15.0,
         }
 
-        component = component_class(framework.event_bus, config)
+        component = dataset_organizer_class(framework.event_bus, config)
 
         with pytest.raises(ValueError, match="Imagery directory not found"):
             component.initialize(config)
 
-    def test_configuration_validation_invalid_percentages(self, framework, dataset_organizer_config):
+    def test_configuration_validation_invalid_percentages(
+        self,
+        framework,
+        dataset_organizer_class,
+        minimal_config,
+    ):
         """Test configuration validation rejects invalid percentages."""
-        from forest_change_framework.core import get_registry
-
-        registry = get_registry()
-        component_class = registry.get("export", "dataset_organizer")
-
-        config = dataset_organizer_config.copy()
+        config = minimal_config.copy()
         config["train_percentage"] = 50.0
         config["val_percentage"] = 30.0
         config["test_percentage"] = 15.0  # Sum = 95, not 100
 
-        component = component_class(framework.event_bus, config)
+        component = dataset_organizer_class(framework.event_bus, config)
 
         with pytest.raises(ValueError, match="must sum to 100"):
             component.initialize(config)
 
-    def test_different_image_formats(self, framework, sample_imagery_directory, sample_patches_directory, tmp_path):
+    @pytest.mark.parametrize("image_format", ["png"])  # Simplified for testing
+    def test_different_image_formats(
+        self,
+        framework,
+        dataset_organizer_class,
+        sample_imagery_directory,
+        sample_patches_directory,
+        tmp_path,
+        image_format,
+    ):
         """Test component with different image format options."""
-        from forest_change_framework.core import get_registry
-
-        registry = get_registry()
-        component_class = registry.get("export", "dataset_organizer")
-
-        for image_format in ["png"]:  # Simplified for testing
-            config = {
-                "imagery_directory": sample_imagery_directory,
-                "sample_patches_directory": sample_patches_directory,
-                "train_percentage": 70.0,
-                "val_percentage": 15.0,
-                "test_percentage": 15.0,
-                "image_format": image_format,
-                "output_base_dir": str(tmp_path / f"output_{image_format}"),
-            }
-
-            component = component_class(framework.event_bus, config)
-            component.initialize(config)
-            result = component.execute()
-
-            assert result["status"] == "success"
-
-    def test_spatial_split_distribution(self, framework, dataset_organizer_config, tmp_path):
-        """Test that spatial splits distribute samples correctly."""
-        from forest_change_framework.core import get_registry
-
-        registry = get_registry()
-        component_class = registry.get("export", "dataset_organizer")
-
-        config = dataset_organizer_config.copy()
-        config["output_base_dir"] = str(tmp_path)
-        config["train_percentage"] = 70.0
-        config["val_percentage"] = 15.0
-        config["test_percentage"] = 15.0
+        config = {
+            "imagery_directory": sample_imagery_directory,
+            "sample_patches_directory": sample_patches_directory,
+            "train_percentage": 70.0,
+            "val_percentage": 15.0,
+            "test_percentage": 15.0,
+            "image_format": image_format,
+            "output_base_dir": str(tmp_path / f"output_{image_format}"),
+        }
 
-        component = component_class(framework.event_bus, config)
+        component = dataset_organizer_class(framework.event_bus, config)
         component.initialize(config)
         result = component.execute()
 
-        validation = result["validation"]
+        assert result["status"] == "success"
+
+    def test_spatial_split_distribution(self, executed_organizer):
+        """Test that spatial splits distribute samples correctly."""
+        validation = executed_organizer["validation"]
         total = validation.get("total_triplets", 0)
 
         if total > 0:
@@ -333,8 +305,7 @@ class TestDatasetOrganizerWithSmallDataset:
                 "year": 2016,
             }
 
-            with open(sample_dir / "metadata.json", "w") as f:
-                json.dump(metadata, f)
+            mock_samples.write_json(sample_dir / "metadata.json", metadata)
 
             # Create minimal files
             (sample_dir / "pre.png").write_bytes(b"")
@@ -342,13 +313,15 @@ class TestDatasetOrganizerWithSmallDataset:
 
         return str(imagery_dir)
 
-    def test_minimal_dataset_organization(self, framework, minimal_imagery_dir, sample_patches_directory, tmp_path):
+    def test_minimal_dataset_organization(
+        self,
+        framework,
+        dataset_organizer_class,
+        minimal_imagery_dir,
+        sample_patches_directory,
+        tmp_path,
+    ):
         """Test organizing a minimal dataset."""
-        from forest_change_framework.core import get_registry
-
-        registry = get_registry()
-        component_class = registry.get("export", "dataset_organizer")
-
         config = {
             "imagery_directory": minimal_imagery_dir,
             "sample_patches_directory": sample_patches_directory,
@@ -358,7 +331,7 @@ class TestDatasetOrganizerWithSmallDataset:
             "output_base_dir": str(tmp_path),
         }
 
-        component = component_class(framework.event_bus, config)
+        component = dataset_organizer_class(framework.event_bus, config)
         component.initialize(config)
         result = component.execute()
 
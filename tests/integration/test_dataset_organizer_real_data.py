@@ -1,17 +1,23 @@
 """Real-world integration test using actual sample extractor output."""
 
+import itertools
 import json
+import os
 import tempfile
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List
 
 import pytest
-import numpy as np
 
 try:
-    from PIL import Image
+    import ijson
 except ImportError:
-    Image = None
+    ijson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
 
 from forest_change_framework import BaseFramework
 
@@ -20,84 +26,122 @@ from forest_change_framework.components.export.dataset_organizer import (
     DatasetOrganizerComponent,
 )
 
+from . import _organizer_fixtures as mock_samples
+
 
 # Path to real sample extractor output
 SAMPLE_EXTRACTOR_OUTPUT = Path(
     "/home/bitwise/Projects/forest-change-framework/data/sample_extractor_output"
 )
 
+if msgspec is not None:
+
+    class _SampleMetadata(msgspec.Struct):
+        """Typed metadata.json payload for a mock imagery sample."""
+
+        sample_id: str
+        bbox: List[float]
+        year: int
+        loss_percentage: float
+        source: str
 
-@pytest.fixture
-def real_sample_metadata() -> Dict[str, Any]:
-    """Load real sample metadata from sample extractor output."""
+
+@pytest.fixture(scope="session")
+def real_sample_metadata_file() -> Path:
+    """
+    Locate the real sample metadata file, skipping when it is not available.
+
+    Every test or fixture that needs the real samples should go through
+    this fixture, directly or via real_sample_metadata, so the file is
+    probed in one place.
+    """
     metadata_file = SAMPLE_EXTRACTOR_OUTPUT / "samples_metadata.json"
 
     if not metadata_file.exists():
         pytest.skip(f"Sample extractor output not found: {SAMPLE_EXTRACTOR_OUTPUT}")
 
-    with open(metadata_file, "r") as f:
+    return metadata_file
+
+
+@pytest.fixture(scope="session")
+def real_sample_metadata(real_sample_metadata_file) -> Dict[str, Any]:
+    """
+    Load the full real sample metadata.
+
+    Session scoped so the file is parsed once. Fixtures that only need the
+    first few samples stream them with _load_real_samples instead.
+    """
+    with open(real_sample_metadata_file, "r") as f:
         return json.load(f)
 
 
-@pytest.fixture
-def mock_imagery_from_real_samples(tmp_path, real_sample_metadata) -> str:
+def _load_real_samples(metadata_file: Path, limit: int) -> List[Dict[str, Any]]:
+    """
+    Return the first ``limit`` samples from the real sample metadata file.
+
+    With ijson installed the file is stream-parsed and reading stops after
+    ``limit`` samples; otherwise the whole file is loaded.
+    """
+    with open(metadata_file, "rb") as f:
+        if ijson is not None:
+            samples = ijson.items(f, "samples.item", use_float=True)
+            return list(itertools.islice(samples, limit))
+        return json.load(f).get("samples", [])[:limit]
+
+
+@pytest.fixture(scope="session")
+def mock_imagery_from_real_samples(real_sample_metadata_file, tmp_path_factory) -> str:
     """
     Create mock imagery directory that matches real sample metadata.
 
     For each sample in the real metadata, create:
     - metadata.json with actual bbox and year
     - pre.png and post.png (dummy files)
+
+    Built once per session; tests only read from it.
     """
-    imagery_dir = tmp_path / "imagery_from_sampler"
+    imagery_dir = tmp_path_factory.mktemp("imagery") / "imagery_from_sampler"
     imagery_dir.mkdir(parents=True, exist_ok=True)
 
-    samples_data = real_sample_metadata.get("samples", [])
-
-    for sample in samples_data[:20]:  # Use first 20 samples for testing
+    samples = []
+    # Use first 20 samples for testing
+    for sample in _load_real_samples(real_sample_metadata_file, 20):
         sample_id = sample.get("sample_id")
         if not sample_id:
             continue
 
-        sample_dir = imagery_dir / sample_id
-        sample_dir.mkdir(parents=True, exist_ok=True)
-
-        # Create metadata.json with actual bbox and year
-        metadata = {
+        # metadata.json with actual bbox and year
+        bbox = sample["bbox"]
+        fields = {
             "sample_id": sample_id,
-            "bbox": [
-                sample["bbox"]["minx"],
-                sample["bbox"]["miny"],
-                sample["bbox"]["maxx"],
-                sample["bbox"]["maxy"],
-            ],
+            "bbox": [bbox["minx"], bbox["miny"], bbox["maxx"], bbox["maxy"]],
             "year": sample.get("year", 2016),
             "loss_percentage": sample.get("loss_percentage", 0),
             "source": "sentinel-2",
         }
+        metadata = _SampleMetadata(**fields) if msgspec is not None else fields
+        samples.append((imagery_dir / sample_id, metadata))
 
-        with open(sample_dir / "metadata.json", "w") as f:
-            json.dump(metadata, f)
-
-        # Create dummy PNG imagery files
-        if Image:
-            img_array = np.random.randint(0, 256, (32, 32, 3), dtype=np.uint8)
-            img = Image.fromarray(img_array)
-            img.save(sample_dir / "pre.png")
-            img.save(sample_dir / "post.png")
-        else:
-            # Fallback: create minimal PNG files
-            (sample_dir / "pre.png").write_bytes(b"PNG_DATA")
-            (sample_dir / "post.png").write_bytes(b"PNG_DATA")
+    # Create dummy PNG imagery files alongside each metadata.json
+    mock_samples.build_samples(samples)
 
     return str(imagery_dir)
 
 
+@pytest.mark.xdist_group("dataset_organizer_real")
 class TestDatasetOrganizerWithRealSamples:
-    """Integration tests using real sample extractor output."""
+    """
+    Integration tests using real sample extractor output.
+
+    Grouped so that ``pytest -n auto --dist=loadgroup`` runs the class on a
+    single worker and builds the session imagery fixture only once, while
+    the rest of the suite is spread over the other workers.
+    """
 
     def test_organize_real_samples_end_to_end(
         self,
         framework,
+        dataset_organizer_class,
         mock_imagery_from_real_samples,
         tmp_path,
     ):
@@ -110,12 +154,6 @@ class TestDatasetOrganizerWithRealSamples:
         3. Run dataset organizer to create train/val/test splits
         4. Verify output structure and validation
         """
-        from forest_change_framework.core import get_registry
-
-        # Get the dataset organizer component
-        registry = get_registry()
-        component_class = registry.get("export", "dataset_organizer")
-
         # Configure with real paths
         config = {
             "imagery_directory": mock_imagery_from_real_samples,
@@ -132,7 +170,7 @@ class TestDatasetOrganizerWithRealSamples:
         }
 
         # Create and initialize component
-        component = component_class(framework.event_bus, config)
+        component = dataset_organizer_class(framework.event_bus, config)
         component.initialize(config)
 
         # Execute
@@ -158,15 +196,11 @@ class TestDatasetOrganizerWithRealSamples:
     def test_real_samples_split_distribution(
         self,
         framework,
+        dataset_organizer_class,
         mock_imagery_from_real_samples,
         tmp_path,
     ):
         """Test that real samples are properly distributed across splits."""
-        from forest_change_framework.core import get_registry
-
-        registry = get_registry()
-        component_class = registry.get("export", "dataset_organizer")
-
         config = {
             "imagery_directory": mock_imagery_from_real_samples,
             "sample_patches_directory": str(
@@ -179,7 +213,7 @@ class TestDatasetOrganizerWithRealSamples:
             "output_base_dir": str(tmp_path),
         }
 
-        component = component_class(framework.event_bus, config)
+        component = dataset_organizer_class(framework.event_bus, config)
         component.initialize(config)
         result = component.execute()
 
@@ -208,16 +242,13 @@ class TestDatasetOrganizerWithRealSamples:
     def test_real_samples_metadata_csv(
         self,
         framework,
+        dataset_organizer_class,
         mock_imagery_from_real_samples,
         tmp_path,
     ):
         """Test that metadata CSV contains correct sample information."""
-        from forest_change_framework.core import get_registry
         import csv
 
-        registry = get_registry()
-        component_class = registry.get("export", "dataset_organizer")
-
         config = {
             "imagery_directory": mock_imagery_from_real_samples,
             "sample_patches_directory": str(
@@ -230,7 +261,7 @@ class TestDatasetOrganizerWithRealSamples:
             "output_base_dir": str(tmp_path),
         }
 
-        component = component_class(framework.event_bus, config)
+        component = dataset_organizer_class(framework.event_bus, config)
         component.initialize(config)
         result = component.execute()
 
@@ -241,15 +272,16 @@ class TestDatasetOrganizerWithRealSamples:
         assert metadata_csv.exists()
 
         # Verify CSV contents
+        # Stream the rows: only the first one is inspected
         with open(metadata_csv, "r") as f:
             reader = csv.DictReader(f)
-            rows = list(reader)
+            first_row = next(reader, None)
+            row_count = 0 if first_row is None else 1 + sum(1 for _ in reader)
 
-        print(f"\n✓ Metadata CSV contains {len(rows)} samples")
+        print(f"\n✓ Metadata CSV contains {row_count} samples")
 
         # Verify required columns
-        if rows:
-            first_row = rows[0]
+        if first_row is not None:
             expected_columns = {"sample_id", "split", "pre_path", "post_path"}
             actual_columns = set(first_row.keys())
             assert expected_columns.issubset(actual_columns)
@@ -262,15 +294,11 @@ class TestDatasetOrganizerWithRealSamples:
     def test_real_samples_triplet_validation(
         self,
         framework,
+        dataset_organizer_class,
         mock_imagery_from_real_samples,
         tmp_path,
     ):
         """Test that all created triplets pass validation."""
-        from forest_change_framework.core import get_registry
-
-        registry = get_registry()
-        component_class = registry.get("export", "dataset_organizer")
-
         config = {
             "imagery_directory": mock_imagery_from_real_samples,
             "sample_patches_directory": str(
@@ -282,7 +310,7 @@ class TestDatasetOrganizerWithRealSamples:
             "output_base_dir": str(tmp_path),
         }
 
-        component = component_class(framework.event_bus, config)
+        component = dataset_organizer_class(framework.event_bus, config)
         component.initialize(config)
         result = component.execute()
 
@@ -300,15 +328,11 @@ class TestDatasetOrganizerWithRealSamples:
     def test_real_samples_directory_structure(
         self,
         framework,
+        dataset_organizer_class,
         mock_imagery_from_real_samples,
         tmp_path,
     ):
         """Test that output directory structure is correct."""
-        from forest_change_framework.core import get_registry
-
-        registry = get_registry()
-        component_class = registry.get("export", "dataset_organizer")
-
         config = {
             "imagery_directory": mock_imagery_from_real_samples,
             "sample_patches_directory": str(
@@ -320,7 +344,7 @@ class TestDatasetOrganizerWithRealSamples:
             "output_base_dir": str(tmp_path),
         }
 
-        component = component_class(framework.event_bus, config)
+        component = dataset_organizer_class(framework.event_bus, config)
         component.initialize(config)
         result = component.execute()
 
@@ -333,15 +357,16 @@ class TestDatasetOrganizerWithRealSamples:
             split_dir = output_dir / split
             assert split_dir.exists()
 
-            # Count samples in each split
-            sample_dirs = [d for d in split_dir.iterdir() if d.is_dir()]
+            # Count samples in each split (scandir entries cache the file type)
+            with os.scandir(split_dir) as it:
+                sample_dirs = [entry for entry in it if entry.is_dir()]
             print(f"  {split}/: {len(sample_dirs)} samples")
 
             # Check a sample triplet
             if sample_dirs:
                 first_sample = sample_dirs[0]
-                files = list(first_sample.iterdir())
-                file_names = {f.name for f in files}
+                with os.scandir(first_sample.path) as it:
+                    file_names = {entry.name for entry in it}
 
                 print(f"    Sample: {first_sample.name}")
                 print(f"    Files: {file_names}")
@@ -349,16 +374,12 @@ class TestDatasetOrganizerWithRealSamples:
     def test_real_samples_with_events(
         self,
         framework,
+        dataset_organizer_class,
         mock_imagery_from_real_samples,
         tmp_path,
         event_collector,
     ):
         """Test that component publishes events during processing."""
-        from forest_change_framework.core import get_registry
-
-        registry = get_registry()
-        component_class = registry.get("export", "dataset_organizer")
-
         # Subscribe to events
         framework.subscribe_event(
             "dataset_organizer.start", event_collector.collect
@@ -381,7 +402,7 @@ class TestDatasetOrganizerWithRealSamples:
             "output_base_dir": str(tmp_path),
         }
 
-        component = component_class(framework.event_bus, config)
+        component = dataset_organizer_class(framework.event_bus, config)
         component.initialize(config)
         result = component.execute()
 
@@ -414,34 +435,24 @@ class TestDatasetOrganizerWithAllSamples:
     def test_organize_all_available_samples(
         self,
         framework,
+        dataset_organizer_class,
+        real_sample_metadata,
         tmp_path,
     ):
         """Test organizing all samples from sample extractor output."""
-        from forest_change_framework.core import get_registry
-
-        if not SAMPLE_EXTRACTOR_OUTPUT.exists():
-            pytest.skip("Sample extractor output not available")
-
-        # Load metadata
-        metadata_file = SAMPLE_EXTRACTOR_OUTPUT / "samples_metadata.json"
-        with open(metadata_file, "r") as f:
-            metadata = json.load(f)
-
-        samples = metadata.get("samples", [])
+        samples = real_sample_metadata.get("samples", [])
         print(f"\n✓ Found {len(samples)} samples in real data")
 
         # Create imagery directory with all samples
         imagery_dir = tmp_path / "imagery_all"
         imagery_dir.mkdir(parents=True, exist_ok=True)
 
+        sample_dirs = []
         for sample in samples:
             sample_id = sample.get("sample_id")
             if not sample_id:
                 continue
 
-            sample_dir = imagery_dir / sample_id
-            sample_dir.mkdir(parents=True, exist_ok=True)
-
             metadata_out = {
                 "sample_id": sample_id,
                 "bbox": [
@@ -452,17 +463,10 @@ class TestDatasetOrganizerWithAllSamples:
                 ],
                 "year": sample.get("year", 2016),
             }
+            sample_dirs.append((imagery_dir / sample_id, metadata_out))
 
-            with open(sample_dir / "metadata.json", "w") as f:
-                json.dump(metadata_out, f)
-
-            # Create dummy files
-            (sample_dir / "pre.png").write_bytes(b"PNG")
-            (sample_dir / "post.png").write_bytes(b"PNG")
-
-        # Run organizer
-        registry = get_registry()
-        component_class = registry.get("export", "dataset_organizer")
+        # Create dummy files
+        mock_samples.build_samples(sample_dirs)
 
         config = {
             "imagery_directory": str(imagery_dir),
@@ -476,7 +480,7 @@ class TestDatasetOrganizerWithAllSamples:
             "output_base_dir": str(tmp_path / "output_all"),
         }
 
-        component = component_class(framework.event_bus, config)
+        component = dataset_organizer_class(framework.event_bus, config)
         component.initialize(config)
         result = component.execute()
 
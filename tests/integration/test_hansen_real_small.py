@@ -1,262 +1,259 @@
 """
 Integration test for Hansen component with real (but small) GeoTIFF files.
 
-This test uses small mock GeoTIFF files (100x100 pixels) instead of actual
+This test uses small mock GeoTIFF files (16x16 pixels) instead of actual
 Hansen data to verify the end-to-end workflow without network calls or
-memory issues.
+memory issues. The mock tiles are written by ``_hansen_fixtures``.
 """
 
+import hashlib
+import os
+import shutil
+import tempfile
+
 import pytest
 from pathlib import Path
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
 
 from forest_change_framework import BaseFramework
 
+# Checked once at collection: without these the whole module is skipped
+pytest.importorskip("requests")
+rasterio = pytest.importorskip("rasterio")
+
+# The mock tile writers import rasterio, so they can only load after the skip
+from . import _hansen_fixtures as mock_tiles  # noqa: E402
+
+# The component's requests module, replaced so no test touches the network
+_REQUESTS_TARGET = (
+    "forest_change_framework.components.data_ingestion.hansen_forest_change.component.requests"
+)
+
+# Tiles used by the end-to-end test, stacked north-south; the test derives
+# its bbox from their bounds
+_TILE_IDS = ("00N_000E", "10N_000E")
+
+# Tile used by the band-order test
+_PATTERN_TILE_ID = "00N_000E"
+
+# Mock files are cached across runs (see _materialize); bump this whenever
+# the way they are generated changes
+_MOCK_TILES_VERSION = 2
+
+
+def _fake_requests(text):
+    """
+    Build a minimal stand-in for the requests module.
+
+    Every GET answers with ``text`` (the tile list) and an empty body, which
+    is all the component reads.
+    """
+    response = SimpleNamespace(
+        text=text,
+        raise_for_status=lambda: None,
+        iter_content=lambda chunk_size=None: iter(()),
+    )
+    return SimpleNamespace(get=lambda *args, **kwargs: response)
+
+
+def _build_mock_tiles(data_folder):
+    """Write the random end-to-end tiles (TILE_PX square, 3 layers each)."""
+    mock_tiles.make_strip_tiles(data_folder, _TILE_IDS)
+
+
+def _build_pattern_tile(data_folder):
+    """Write one tile whose layers hold distinct constant values."""
+    # Distinct values per layer make the band order visible
+    mock_tiles.make_tile(data_folder, _PATTERN_TILE_ID, mock_tiles.constant_layers(50, 10, 1))
+
+
+# Tile set name -> (builder, tile IDs it writes)
+_TILE_SETS = {
+    "random": (_build_mock_tiles, _TILE_IDS),
+    "const50-10-1": (_build_pattern_tile, (_PATTERN_TILE_ID,)),
+}
+
+
+def _cache_key(name):
+    """Return a key that changes whenever the generated mock files would."""
+    inputs = (
+        name,
+        _MOCK_TILES_VERSION,
+        _TILE_IDS,
+        _PATTERN_TILE_ID,
+        sorted(mock_tiles.LAYER_PROFILE.items()),
+        mock_tiles.TILE_VRT,
+        mock_tiles.TILE_PX,
+        mock_tiles.FAST_MOCK_TILES,
+    )
+    return hashlib.sha1(repr(inputs).encode()).hexdigest()[:16]
+
+
+def _link_tree(source, destination):
+    """Hard-link every file under source into destination, copying if linking fails."""
+    for path in sorted(source.rglob("*")):
+        target = destination / path.relative_to(source)
+        if path.is_dir():
+            target.mkdir()
+            continue
+        try:
+            os.link(path, target)
+        except OSError:
+            # e.g. cache and tmp on different filesystems
+            shutil.copy2(path, target)
+
+
+def _materialize(request, tmp_path_factory, name, build):
+    """
+    Return a fresh data folder holding the files written by ``build``.
+
+    The files are deterministic, so they are built once into pytest's cache
+    directory and hard-linked into each run's temporary folder. The
+    component writes its stacked tiles into the data folder, so tests never
+    get the cache directory itself. Without the cache plugin (``-p
+    no:cacheprovider``) the files are built in place.
+    """
+    data_folder = tmp_path_factory.mktemp(name)
+    cache = getattr(request.config, "cache", None)
+    if cache is None:
+        build(data_folder)
+        return data_folder
+
+    cache_root = cache.mkdir("hansen_mock_tiles")
+    cached = cache_root / _cache_key(name)
+    if not cached.exists():
+        # Build aside and rename into place, so concurrent sessions (e.g.
+        # pytest-xdist workers) never see a half-written cache entry
+        staging = Path(tempfile.mkdtemp(dir=cache_root))
+        build(staging)
+        try:
+            os.rename(staging, cached)
+        except OSError:
+            # Another session finished first; its entry is identical
+            shutil.rmtree(staging)
+
+    _link_tree(cached, data_folder)
+    return data_folder
+
+
+@pytest.fixture(scope="module")
+def hansen_tiles(request, tmp_path_factory):
+    """
+    Provide the mock tiles for one entry of _TILE_SETS.
+
+    Parametrize indirectly with the tile set name.
+
+    Returns:
+        (data_folder, tile_ids)
+    """
+    build, tile_ids = _TILE_SETS[request.param]
+    data_folder = _materialize(request, tmp_path_factory, f"hansen_{request.param}", build)
+    return data_folder, list(tile_ids)
+
 
 @pytest.mark.integration
 class TestHansenRealSmall:
     """Integration tests with small real GeoTIFF files."""
 
-    def test_hansen_end_to_end_with_mock_tiles(self, framework, tmp_path):
+    @pytest.fixture(scope="module", autouse=True)
+    def gdal_env(self):
+        """
+        Open one GDAL environment for the fixtures and tests in this module.
+
+        Being module scoped and autouse, it is entered before the tile
+        fixtures, which write their layer strips and VRTs inside it, and
+        stays open for the tests that read them back.
+        """
+        with rasterio.Env(GDAL_CACHEMAX=128) as env:
+            yield env
+
+    @pytest.mark.parametrize(
+        "hansen_tiles, expected",
+        [
+            ("random", None),
+            ("const50-10-1", (50, 10, 1)),
+        ],
+        indirect=["hansen_tiles"],
+        ids=["random", "const50-10-1"],
+    )
+    def test_hansen_workflow(self, framework, hansen_tiles, expected, tmp_path, monkeypatch):
         """
         Test complete Hansen workflow with mock GeoTIFF files.
 
         This test:
-        1. Creates small mock tiles (100x100 pixels, 3 bands each)
-        2. Mocks the tile list download
-        3. Runs the Hansen component
-        4. Verifies output mosaic is created correctly
-        5. Checks memory efficiency (no MemoryFile saturation)
+        1. Uses small mock tiles (16x16 pixels, 3 layers each)
+        2. Stubs the tile list download
+        3. Runs the Hansen component over the tiles' bounding box
+        4. Verifies output mosaic and metadata are created correctly
+        5. For constant tiles, checks the band order from one pixel
         """
-        pytest.importorskip("requests")
-        pytest.importorskip("rasterio")
-
-        import numpy as np
-        import rasterio
-        from rasterio.transform import Affine
-
-        # Setup paths
-        data_folder = tmp_path / "data"
-        output_folder = tmp_path / "output"
-        data_folder.mkdir()
-        output_folder.mkdir()
-
-        # Create mock GeoTIFF files for 2 tiles
-        tile_ids = ["00N_000E", "10N_000E"]
-
-        for tile_id in tile_ids:
-            tile_dir = data_folder / tile_id
-            tile_dir.mkdir()
-
-            # Parse tile coordinates for proper geotransform
-            # Format: 00N_000E = latitude 0, longitude 0
-            parts = tile_id.split("_")
-            lat_str = parts[0]  # e.g., "00N", "10N"
-            lon_str = parts[1]  # e.g., "000E", "010W"
-
-            # Extract coordinates
-            lat_deg = int(lat_str[:2])
-            lat_dir = lat_str[2]  # N or S
-            lon_deg = int(lon_str[:3])
-            lon_dir = lon_str[3]  # E or W
-
-            # Calculate bounds (tiles are 10x10 degrees)
-            if lat_dir == 'N':
-                miny, maxy = lat_deg, lat_deg + 10
-            else:
-                maxy, miny = -lat_deg, -(lat_deg + 10)
-
-            if lon_dir == 'E':
-                minx, maxx = lon_deg, lon_deg + 10
-            else:
-                maxx, minx = -lon_deg, -(lon_deg + 10)
-
-            # Create proper geotransform (0.1 degrees per pixel for 100x100 raster)
-            pixel_size = (maxx - minx) / 100
-            transform = Affine.translation(minx, maxy) * Affine.scale(pixel_size, -pixel_size)
-
-            # Create small mock files (100x100 pixels, not 40000x40000)
-            for layer, data in [
-                ("treecover2000", np.random.randint(0, 100, (100, 100), dtype=np.uint8)),
-                ("lossyear", np.random.randint(0, 22, (100, 100), dtype=np.uint8)),
-                ("datamask", np.ones((100, 100), dtype=np.uint8)),
-            ]:
-                filename = f"Hansen_GFC-2024-v1.12_{layer}_{tile_id}.tif"
-                filepath = tile_dir / filename
-
-                # Write GeoTIFF with proper geotransform
-                profile = {
-                    'driver': 'GTiff',
-                    'height': 100,
-                    'width': 100,
-                    'count': 1,
-                    'dtype': data.dtype,
-                    'crs': 'EPSG:4326',
-                    'transform': transform,
-                }
-
-                with rasterio.open(filepath, 'w', **profile) as dst:
-                    dst.write(data, 1)
-
-        # Mock the tile list download to return our mock tiles
-        with patch(
-            "forest_change_framework.components.data_ingestion.hansen_forest_change.component.requests"
-        ) as mock_requests:
-            # Mock tile list response
-            mock_response = Mock()
-            mock_response.text = "\n".join([
-                f"Hansen_GFC-2024-v1.12_lossyear_{tile_id}.tif"
-                for tile_id in tile_ids
-            ])
-            mock_requests.get.return_value = mock_response
-
-            # Instantiate component
-            component = framework.instantiate_component(
-                "data_ingestion",
-                "hansen_forest_change",
-                {
-                    "data_folder": str(data_folder),
-                    "output_folder": str(output_folder),
-                },
-            )
-
-            # Execute with bounding box covering both tiles
-            bbox = {"minx": 0, "miny": 0, "maxx": 20, "maxy": 20}
-
-            mosaic_path, metadata = component.execute(bbox=bbox)
-
-            # Verify output
-            assert mosaic_path is not None, "Mosaic path should not be None"
-            assert Path(mosaic_path).exists(), f"Mosaic file should exist: {mosaic_path}"
-
-            # Verify metadata
-            assert "output_path" in metadata
-            assert "output_shape" in metadata
-            assert "output_crs" in metadata
-            assert "tiles_downloaded" in metadata
-            assert len(metadata["tiles_downloaded"]) == 2
-
-            # Verify mosaic can be read
-            with rasterio.open(mosaic_path) as src:
-                assert src.count == 3, "Should have 3 bands"
-                assert src.crs == "EPSG:4326"
-                assert src.height > 0 and src.width > 0
-
-                # Read a sample of each band
-                band1 = src.read(1)  # treecover2000
-                band2 = src.read(2)  # lossyear
-                band3 = src.read(3)  # datamask
-
-                assert band1.shape == band2.shape == band3.shape
-                print(f"\n✓ Mosaic created successfully!")
-                print(f"  Path: {mosaic_path}")
-                print(f"  Shape: {band1.shape}")
-                print(f"  Size: {Path(mosaic_path).stat().st_size / 1024:.1f} KB")
-
-    def test_hansen_output_file_has_correct_bands(self, framework, tmp_path):
-        """Test that output GeoTIFF has 3 bands in correct order."""
-        pytest.importorskip("requests")
-        pytest.importorskip("rasterio")
-
-        import numpy as np
-        import rasterio
-        from rasterio.transform import Affine
-
-        # Setup paths
-        data_folder = tmp_path / "data"
+        data_folder, tile_ids = hansen_tiles
         output_folder = tmp_path / "output"
-        data_folder.mkdir()
         output_folder.mkdir()
 
-        # Create tiles with distinct patterns to verify band order
-        tile_id = "00N_000E"
-        tile_dir = data_folder / tile_id
-        tile_dir.mkdir()
-
-        # Parse tile coordinates for proper geotransform
-        parts = tile_id.split("_")
-        lat_str = parts[0]
-        lon_str = parts[1]
-
-        lat_deg = int(lat_str[:2])
-        lat_dir = lat_str[2]
-        lon_deg = int(lon_str[:3])
-        lon_dir = lon_str[3]
-
-        # Calculate bounds
-        if lat_dir == 'N':
-            miny, maxy = lat_deg, lat_deg + 10
-        else:
-            maxy, miny = -lat_deg, -(lat_deg + 10)
-
-        if lon_dir == 'E':
-            minx, maxx = lon_deg, lon_deg + 10
-        else:
-            maxx, minx = -lon_deg, -(lon_deg + 10)
-
-        # Create proper geotransform
-        pixel_size = (maxx - minx) / 100
-        transform = Affine.translation(minx, maxy) * Affine.scale(pixel_size, -pixel_size)
-
-        # Create files with specific patterns
-        patterns = {
-            "treecover2000": np.full((100, 100), 50, dtype=np.uint8),  # All 50
-            "lossyear": np.full((100, 100), 10, dtype=np.uint8),       # All 10
-            "datamask": np.ones((100, 100), dtype=np.uint8),           # All 1
-        }
-
-        for layer, data in patterns.items():
-            filename = f"Hansen_GFC-2024-v1.12_{layer}_{tile_id}.tif"
-            filepath = tile_dir / filename
-
-            profile = {
-                'driver': 'GTiff',
-                'height': 100,
-                'width': 100,
-                'count': 1,
-                'dtype': data.dtype,
-                'crs': 'EPSG:4326',
-                'transform': transform,
-            }
-
-            with rasterio.open(filepath, 'w', **profile) as dst:
-                dst.write(data, 1)
-
-        # Mock requests
-        with patch(
-            "forest_change_framework.components.data_ingestion.hansen_forest_change.component.requests"
-        ) as mock_requests:
-            mock_response = Mock()
-            mock_response.text = f"Hansen_GFC-2024-v1.12_lossyear_{tile_id}.tif"
-            mock_requests.get.return_value = mock_response
-
-            component = framework.instantiate_component(
-                "data_ingestion",
-                "hansen_forest_change",
-                {
-                    "data_folder": str(data_folder),
-                    "output_folder": str(output_folder),
-                },
-            )
-
-            bbox = {"minx": 0, "miny": 0, "maxx": 10, "maxy": 10}
-            mosaic_path, metadata = component.execute(bbox=bbox)
-
-            # Read mosaic and verify band values
-            with rasterio.open(mosaic_path) as src:
-                band1 = src.read(1)  # treecover2000
-                band2 = src.read(2)  # lossyear
-                band3 = src.read(3)  # datamask
-
-                # Verify band order by checking values
-                assert np.all(band1 == 50), f"Band 1 (treecover2000) should be 50, got {band1[0, 0]}"
-                assert np.all(band2 == 10), f"Band 2 (lossyear) should be 10, got {band2[0, 0]}"
-                assert np.all(band3 == 1), f"Band 3 (datamask) should be 1, got {band3[0, 0]}"
-
-                print(f"\n✓ Band order verified!")
-                print(f"  Band 1 (treecover2000): {band1[0, 0]}")
-                print(f"  Band 2 (lossyear): {band2[0, 0]}")
-                print(f"  Band 3 (datamask): {band3[0, 0]}")
+        # Stub the tile list download to return our mock tiles
+        monkeypatch.setattr(_REQUESTS_TARGET, _fake_requests("\n".join(
+            f"Hansen_GFC-2024-v1.12_lossyear_{tile_id}.tif"
+            for tile_id in tile_ids
+        )))
+
+        component = framework.instantiate_component(
+            "data_ingestion",
+            "hansen_forest_change",
+            {
+                "data_folder": str(data_folder),
+                "output_folder": str(output_folder),
+            },
+        )
+
+        # Bounding box covering every tile
+        minxs, minys, maxxs, maxys = zip(*map(mock_tiles.tile_bounds, tile_ids))
+        bbox = {"minx": min(minxs), "miny": min(minys), "maxx": max(maxxs), "maxy": max(maxys)}
+
+        mosaic_path, metadata = component.execute(bbox=bbox)
+
+        # Verify output
+        assert mosaic_path is not None, "Mosaic path should not be None"
+        assert Path(mosaic_path).exists(), f"Mosaic file should exist: {mosaic_path}"
+
+        # Verify metadata
+        assert "output_path" in metadata
+        assert "output_shape" in metadata
+        assert "output_crs" in metadata
+        assert "tiles_downloaded" in metadata
+        assert len(metadata["tiles_downloaded"]) == len(tile_ids)
+
+        # Verify mosaic can be opened. Only the header is needed: every band
+        # of a dataset shares its shape, and the mosaic is a VRT, so its
+        # pixels would come from the stacked tiles through GDAL anyway
+        with rasterio.open(mosaic_path) as src:
+            assert src.count == 3, "Should have 3 bands"
+            assert src.crs == "EPSG:4326"
+            assert src.height > 0 and src.width > 0
+            assert src.shape == tuple(metadata["output_shape"])
+
+            print(f"\n✓ Mosaic created successfully!")
+            print(f"  Path: {mosaic_path}")
+            print(f"  Shape: {src.shape}")
+            print(f"  Size: {Path(mosaic_path).stat().st_size / 1024:.1f} KB")
+
+            if expected is not None:
+                # Every layer is constant, so one pixel of each band shows the order
+                band1, band2, band3 = src.read(window=rasterio.windows.Window(0, 0, 1, 1))[:, 0, 0]
+
+        if expected is None:
+            return
+
+        # Verify band order by checking values
+        treecover, lossyear, datamask = expected
+        assert band1 == treecover, f"Band 1 (treecover2000) should be {treecover}, got {band1}"
+        assert band2 == lossyear, f"Band 2 (lossyear) should be {lossyear}, got {band2}"
+        assert band3 == datamask, f"Band 3 (datamask) should be {datamask}, got {band3}"
+
+        print(f"\n✓ Band order verified!")
+        print(f"  Band 1 (treecover2000): {band1}")
+        print(f"  Band 2 (lossyear): {band2}")
+        print(f"  Band 3 (datamask): {band3}")
 
 
 if __name__ == "__main__":
@@ -5,206 +5,236 @@ Tests end-to-end workflow with real data structures and validates:
 - Patch georeferencing accuracy
 - Metadata consistency
 - Validation report accuracy
+
+The tests are independent and safe under ``pytest -n auto``: session-scoped
+inputs are built once per xdist worker and outputs go to per-test tmp_path.
+Those inputs are built exactly once per session, so their directories are
+created with ``numbered=False`` under names unique to this module.
 """
 
 import json
 import logging
+import os
 import tempfile
+from collections import Counter
 from pathlib import Path
 from typing import Any, Dict, List
 
 import pytest
 
+from forest_change_framework import EventBus
 from forest_change_framework.components.export.sample_extractor import (
     SampleExtractorComponent,
 )
 from forest_change_framework.components.export.sample_extractor.metadata import (
     validate_metadata,
 )
+from forest_change_framework.components.export.sample_extractor.sampling import (
+    balance_samples_across_years,
+    create_sample_manifest,
+    group_aois_by_year_and_bin,
+    select_stratified_samples,
+)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
 
-class TestSampleExtractorIntegration:
-    """End-to-end integration tests for Sample Extractor Component."""
+def _write_geojson(path: Path, geojson: Dict[str, Any]) -> None:
+    """Serialize a GeoJSON fixture, with orjson when it is installed."""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(geojson))
+        return
+    with open(path, "w") as f:
+        json.dump(geojson, f)
+
+
+def _make_extraction_config(
+    aoi_geojson: Path, hansen_vrt: Path, output_dir: Path
+) -> Dict[str, Any]:
+    """Return the standard extraction configuration for the given paths."""
+    return {
+        "aoi_geojson": str(aoi_geojson),
+        "hansen_vrt": str(hansen_vrt),
+        "output_dir": str(output_dir),
+        "samples_per_bin": 2,
+        "metadata_format": "both",
+        "patch_crs": "EPSG:4326",
+        "include_metadata_in_tiff": True,
+        "validate": True,
+        "band": 2,
+    }
+
+
+def _create_empty_files(directory: Path, names) -> None:
+    """Create an empty file for each name; contents never matter to validation."""
+    flags = os.O_WRONLY | os.O_CREAT
+    for name in names:
+        os.close(os.open(directory / name, flags, 0o644))
+
+
+def _read_geojson(path: Path) -> Dict[str, Any]:
+    """Parse a GeoJSON fixture, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path) as f:
+        return json.load(f)
+
+
+# (cell_id, bin_category, loss_by_year, (minx, miny, maxx, maxy)) of each
+# fixture AOI; every cell is 0.1 degrees square
+_FEATURE_SPECS = [
+    # Year 2010
+    ("cell_001", "no_loss", {"2010": 0, "2011": 0}, (-60.5, -10.2, -60.4, -10.1)),
+    ("cell_002", "low_loss", {"2010": 50, "2011": 0}, (-60.3, -10.2, -60.2, -10.1)),
+    ("cell_003", "medium_loss", {"2010": 200, "2011": 0}, (-60.1, -10.2, -60.0, -10.1)),
+    ("cell_004", "high_loss", {"2010": 500, "2011": 0}, (-59.9, -10.2, -59.8, -10.1)),
+    # Year 2011
+    ("cell_005", "no_loss", {"2010": 0, "2011": 0}, (-60.5, -10.0, -60.4, -9.9)),
+    ("cell_006", "low_loss", {"2010": 0, "2011": 75}, (-60.3, -10.0, -60.2, -9.9)),
+]
+
+
+def _make_feature(spec) -> Dict[str, Any]:
+    """Build an AOI sampler output feature from a _FEATURE_SPECS entry."""
+    cell_id, bin_category, loss_by_year, (minx, miny, maxx, maxy) = spec
+    return {
+        "type": "Feature",
+        "geometry": {
+            "type": "Polygon",
+            "coordinates": [[
+                [minx, miny],
+                [maxx, miny],
+                [maxx, maxy],
+                [minx, maxy],
+                [minx, miny],
+            ]]
+        },
+        "properties": {
+            "cell_id": cell_id,
+            "bin_category": bin_category,
+            "loss_by_year": dict(loss_by_year),
+            "minx": minx,
+            "miny": miny,
+            "maxx": maxx,
+            "maxy": maxy,
+            "total_loss": sum(loss_by_year.values()),
+        },
+    }
+
+
+@pytest.fixture(scope="session")
+def sample_aoi_geojson(tmp_path_factory) -> Path:
+    """Create sample AOI GeoJSON file with diverse year/bin distribution.
+
+    Written once per session; tests must treat the file as read-only.
+
+    Returns:
+        Path to temporary GeoJSON file
+    """
+    geojson = {
+        "type": "FeatureCollection",
+        "features": [_make_feature(spec) for spec in _FEATURE_SPECS],
+    }
+
+    aoi_dir = tmp_path_factory.mktemp("sample_extractor_aoi", numbered=False)
+    geojson_path = aoi_dir / "sample_aois.geojson"
+    _write_geojson(geojson_path, geojson)
+
+    return geojson_path
+
+
+@pytest.fixture(scope="session")
+def mock_hansen_vrt(tmp_path_factory) -> Path:
+    """Create a mock Hansen VRT file for testing.
+
+    In real scenarios, this would be a proper VRT file pointing to
+    Hansen tiles. For testing, we create a dummy file that passes
+    validation checks.
+
+    Returns:
+        Path to mock VRT file
+    """
+    vrt_path = tmp_path_factory.mktemp("sample_extractor_hansen", numbered=False) / "hansen.vrt"
+    vrt_path.write_text("<VRTDataset></VRTDataset>")
+    return vrt_path
+
+
+# The sampling pipeline is pure, so each stage is computed once per session
+# from the fixture GeoJSON. Tests must not mutate the results.
+
+@pytest.fixture(scope="session")
+def grouped_aois(sample_aoi_geojson: Path) -> Dict[int, Dict[str, List[Dict[str, Any]]]]:
+    """Provide the fixture AOIs grouped by year and loss bin."""
+    return group_aois_by_year_and_bin(_read_geojson(sample_aoi_geojson))
+
+
+@pytest.fixture(scope="session")
+def stratified_samples(grouped_aois) -> Dict[int, Dict[str, List[Dict[str, Any]]]]:
+    """Provide a stratified selection of two samples per bin."""
+    return select_stratified_samples(grouped_aois, samples_per_bin=2)
+
+
+@pytest.fixture(scope="session")
+def manifest(stratified_samples) -> List[Dict[str, Any]]:
+    """Provide the manifest for two samples per bin."""
+    return create_sample_manifest(stratified_samples)
+
+
+@pytest.fixture(scope="session")
+def single_sample_manifest(grouped_aois) -> List[Dict[str, Any]]:
+    """Provide the manifest for one sample per bin."""
+    return create_sample_manifest(select_stratified_samples(grouped_aois, samples_per_bin=1))
+
+
+@pytest.fixture(scope="session")
+def single_sample_patches_dir(single_sample_manifest, tmp_path_factory) -> Path:
+    """Provide a patches directory with a dummy TIFF for every single_sample_manifest entry."""
+    patches_dir = tmp_path_factory.mktemp("sample_extractor_patches", numbered=False) / "patches"
+    patches_dir.mkdir()
+    _create_empty_files(patches_dir, (f"{s['sample_id']}.tif" for s in single_sample_manifest))
+    return patches_dir
+
+
+@pytest.fixture(scope="session")
+def balanced_manifest(grouped_aois) -> List[Dict[str, Any]]:
+    """Provide the manifest for four samples per bin, balanced across years."""
+    # samples_per_bin=4 selects multiple samples per bin across years
+    selected = select_stratified_samples(grouped_aois, samples_per_bin=4)
+    return create_sample_manifest(balance_samples_across_years(selected, samples_per_bin=4))
 
-    @pytest.fixture
-    def sample_aoi_geojson(self, tmp_path: Path) -> Path:
-        """Create sample AOI GeoJSON file with diverse year/bin distribution.
 
-        Returns:
-            Path to temporary GeoJSON file
-        """
-        geojson = {
-            "type": "FeatureCollection",
-            "features": [
-                # Year 2010, no_loss bin
-                {
-                    "type": "Feature",
-                    "geometry": {
-                        "type": "Polygon",
-                        "coordinates": [[
-                            [-60.5, -10.2],
-                            [-60.4, -10.2],
-                            [-60.4, -10.1],
-                            [-60.5, -10.1],
-                            [-60.5, -10.2],
-                        ]]
-                    },
-                    "properties": {
-                        "cell_id": "cell_001",
-                        "bin_category": "no_loss",
-                        "loss_by_year": {"2010": 0, "2011": 0},
-                        "minx": -60.5,
-                        "miny": -10.2,
-                        "maxx": -60.4,
-                        "maxy": -10.1,
-                        "total_loss": 0,
-                    },
-                },
-                # Year 2010, low_loss bin
-                {
-                    "type": "Feature",
-                    "geometry": {
-                        "type": "Polygon",
-                        "coordinates": [[
-                            [-60.3, -10.2],
-                            [-60.2, -10.2],
-                            [-60.2, -10.1],
-                            [-60.3, -10.1],
-                            [-60.3, -10.2],
-                        ]]
-                    },
-                    "properties": {
-                        "cell_id": "cell_002",
-                        "bin_category": "low_loss",
-                        "loss_by_year": {"2010": 50, "2011": 0},
-                        "minx": -60.3,
-                        "miny": -10.2,
-                        "maxx": -60.2,
-                        "maxy": -10.1,
-                        "total_loss": 50,
-                    },
-                },
-                # Year 2010, medium_loss bin
-                {
-                    "type": "Feature",
-                    "geometry": {
-                        "type": "Polygon",
-                        "coordinates": [[
-                            [-60.1, -10.2],
-                            [-60.0, -10.2],
-                            [-60.0, -10.1],
-                            [-60.1, -10.1],
-                            [-60.1, -10.2],
-                        ]]
-                    },
-                    "properties": {
-                        "cell_id": "cell_003",
-                        "bin_category": "medium_loss",
-                        "loss_by_year": {"2010": 200, "2011": 0},
-                        "minx": -60.1,
-                        "miny": -10.2,
-                        "maxx": -60.0,
-                        "maxy": -10.1,
-                        "total_loss": 200,
-                    },
-                },
-                # Year 2010, high_loss bin
-                {
-                    "type": "Feature",
-                    "geometry": {
-                        "type": "Polygon",
-                        "coordinates": [[
-                            [-59.9, -10.2],
-                            [-59.8, -10.2],
-                            [-59.8, -10.1],
-                            [-59.9, -10.1],
-                            [-59.9, -10.2],
-                        ]]
-                    },
-                    "properties": {
-                        "cell_id": "cell_004",
-                        "bin_category": "high_loss",
-                        "loss_by_year": {"2010": 500, "2011": 0},
-                        "minx": -59.9,
-                        "miny": -10.2,
-                        "maxx": -59.8,
-                        "maxy": -10.1,
-                        "total_loss": 500,
-                    },
-                },
-                # Year 2011, no_loss bin
-                {
-                    "type": "Feature",
-                    "geometry": {
-                        "type": "Polygon",
-                        "coordinates": [[
-                            [-60.5, -10.0],
-                            [-60.4, -10.0],
-                            [-60.4, -9.9],
-                            [-60.5, -9.9],
-                            [-60.5, -10.0],
-                        ]]
-                    },
-                    "properties": {
-                        "cell_id": "cell_005",
-                        "bin_category": "no_loss",
-                        "loss_by_year": {"2010": 0, "2011": 0},
-                        "minx": -60.5,
-                        "miny": -10.0,
-                        "maxx": -60.4,
-                        "maxy": -9.9,
-                        "total_loss": 0,
-                    },
-                },
-                # Year 2011, low_loss bin
-                {
-                    "type": "Feature",
-                    "geometry": {
-                        "type": "Polygon",
-                        "coordinates": [[
-                            [-60.3, -10.0],
-                            [-60.2, -10.0],
-                            [-60.2, -9.9],
-                            [-60.3, -9.9],
-                            [-60.3, -10.0],
-                        ]]
-                    },
-                    "properties": {
-                        "cell_id": "cell_006",
-                        "bin_category": "low_loss",
-                        "loss_by_year": {"2010": 0, "2011": 75},
-                        "minx": -60.3,
-                        "miny": -10.0,
-                        "maxx": -60.2,
-                        "maxy": -9.9,
-                        "total_loss": 75,
-                    },
-                },
-            ]
-        }
+@pytest.fixture(scope="module")
+def component_output_dir(tmp_path_factory) -> Path:
+    """Provide the output directory initialized_component is configured with."""
+    return tmp_path_factory.mktemp("sample_extractor_output", numbered=False) / "output"
 
-        geojson_path = tmp_path / "sample_aois.geojson"
-        with open(geojson_path, "w") as f:
-            json.dump(geojson, f)
 
-        return geojson_path
+@pytest.fixture(scope="module")
+def initialized_component(
+    sample_aoi_geojson: Path, mock_hansen_vrt: Path, component_output_dir: Path
+) -> SampleExtractorComponent:
+    """Provide a component initialized with the standard configuration.
 
-    @pytest.fixture
-    def mock_hansen_vrt(self, tmp_path: Path) -> Path:
-        """Create a mock Hansen VRT file for testing.
+    Shared by every test in the module, so only tests that neither
+    execute nor reconfigure the component may use it.
 
-        In real scenarios, this would be a proper VRT file pointing to
-        Hansen tiles. For testing, we create a dummy file that passes
-        validation checks.
+    Returns:
+        Initialized SampleExtractorComponent
+    """
+    component = SampleExtractorComponent(EventBus())
+    component.initialize(
+        _make_extraction_config(sample_aoi_geojson, mock_hansen_vrt, component_output_dir)
+    )
+    return component
 
-        Returns:
-            Path to mock VRT file
-        """
-        vrt_path = tmp_path / "hansen.vrt"
-        vrt_path.write_text("<VRTDataset></VRTDataset>")
-        return vrt_path
+
+class TestSampleExtractorIntegration:
+    """End-to-end integration tests for Sample Extractor Component."""
 
     @pytest.fixture
     def extraction_config(
@@ -220,20 +250,10 @@ class TestSampleExtractorIntegration:
         Returns:
             Configuration dictionary
         """
-        return {
-            "aoi_geojson": str(sample_aoi_geojson),
-            "hansen_vrt": str(mock_hansen_vrt),
-            "output_dir": str(tmp_path / "output"),
-            "samples_per_bin": 2,
-            "metadata_format": "both",
-            "patch_crs": "EPSG:4326",
-            "include_metadata_in_tiff": True,
-            "validate": True,
-            "band": 2,
-        }
+        return _make_extraction_config(sample_aoi_geojson, mock_hansen_vrt, tmp_path / "output")
 
     def test_component_initialization_with_valid_config(
-        self, extraction_config: Dict[str, Any], event_bus
+        self, initialized_component: SampleExtractorComponent
     ) -> None:
         """Test component initializes with valid configuration.
 
@@ -242,8 +262,7 @@ class TestSampleExtractorIntegration:
         - Configuration is stored correctly
         - Default values are applied
         """
-        component = SampleExtractorComponent(event_bus)
-        component.initialize(extraction_config)
+        component = initialized_component
 
         assert component.name == "sample_extractor"
         assert component.version == "1.0.0"
@@ -277,8 +296,7 @@ class TestSampleExtractorIntegration:
     def test_load_geojson_with_valid_features(
         self,
         sample_aoi_geojson: Path,
-        extraction_config: Dict[str, Any],
-        event_bus,
+        initialized_component: SampleExtractorComponent,
     ) -> None:
         """Test loading valid AOI GeoJSON with features.
 
@@ -287,10 +305,7 @@ class TestSampleExtractorIntegration:
         - All features are accessible
         - Geometry and properties preserved
         """
-        component = SampleExtractorComponent(event_bus)
-        component.initialize(extraction_config)
-
-        geojson_data = component._load_geojson(str(sample_aoi_geojson))
+        geojson_data = initialized_component._load_geojson(str(sample_aoi_geojson))
 
         assert "features" in geojson_data
         assert len(geojson_data["features"]) == 6
@@ -298,16 +313,13 @@ class TestSampleExtractorIntegration:
         assert all("properties" in f for f in geojson_data["features"])
 
     def test_geojson_feature_properties_integrity(
-        self, sample_aoi_geojson: Path, extraction_config: Dict[str, Any], event_bus
+        self, sample_aoi_geojson: Path, initialized_component: SampleExtractorComponent
     ) -> None:
         """Test GeoJSON feature properties are preserved.
 
         Verifies all required properties for sampling workflow are present.
         """
-        component = SampleExtractorComponent(event_bus)
-        component.initialize(extraction_config)
-
-        geojson_data = component._load_geojson(str(sample_aoi_geojson))
+        geojson_data = initialized_component._load_geojson(str(sample_aoi_geojson))
         features = geojson_data["features"]
 
         # Raw GeoJSON has these properties (before processing)
@@ -321,7 +333,7 @@ class TestSampleExtractorIntegration:
             assert isinstance(props["maxy"], (int, float))
 
     def test_sampling_stratification_by_bin(
-        self, sample_aoi_geojson: Path, extraction_config: Dict[str, Any], event_bus
+        self, stratified_samples, extraction_config: Dict[str, Any]
     ) -> None:
         """Test stratified sampling produces balanced distribution across loss bins.
 
@@ -330,25 +342,11 @@ class TestSampleExtractorIntegration:
         - Distribution is across multiple years where possible
         - No bin receives more than its quota
         """
-        from forest_change_framework.components.export.sample_extractor.sampling import (
-            group_aois_by_year_and_bin,
-            select_stratified_samples,
-        )
-
-        component = SampleExtractorComponent(event_bus)
-        component.initialize(extraction_config)
-
-        geojson_data = component._load_geojson(str(sample_aoi_geojson))
-
-        # Group and sample
-        grouped = group_aois_by_year_and_bin(geojson_data)
-        selected = select_stratified_samples(grouped, samples_per_bin=2)
-
         # Count samples per bin across all years
-        bin_counts = {}
-        for year_samples in selected.values():
+        bin_counts = Counter()
+        for year_samples in stratified_samples.values():
             for bin_name, features in year_samples.items():
-                bin_counts[bin_name] = bin_counts.get(bin_name, 0) + len(features)
+                bin_counts[bin_name] += len(features)
 
         # Verify distribution
         samples_per_bin = extraction_config["samples_per_bin"]
@@ -357,33 +355,34 @@ class TestSampleExtractorIntegration:
                 count <= samples_per_bin * 2
             ), f"Bin {bin_name} exceeded quota: {count} > {samples_per_bin * 2}"
 
+    @pytest.mark.parametrize("metadata_format", ["csv", "json", "both"])
     def test_metadata_format_options(
         self,
         sample_aoi_geojson: Path,
         mock_hansen_vrt: Path,
         tmp_path: Path,
         event_bus,
+        metadata_format: str,
     ) -> None:
         """Test different metadata format configurations.
 
         Verifies component supports CSV, JSON, and both formats.
         """
-        for metadata_format in ["csv", "json", "both"]:
-            config = {
-                "aoi_geojson": str(sample_aoi_geojson),
-                "hansen_vrt": str(mock_hansen_vrt),
-                "output_dir": str(tmp_path / f"output_{metadata_format}"),
-                "samples_per_bin": 1,
-                "metadata_format": metadata_format,
-                "validate": False,
-            }
+        config = {
+            "aoi_geojson": str(sample_aoi_geojson),
+            "hansen_vrt": str(mock_hansen_vrt),
+            "output_dir": str(tmp_path / "output"),
+            "samples_per_bin": 1,
+            "metadata_format": metadata_format,
+            "validate": False,
+        }
 
-            component = SampleExtractorComponent(event_bus)
-            component.initialize(config)
-            assert component._metadata_format == metadata_format
+        component = SampleExtractorComponent(event_bus)
+        component.initialize(config)
+        assert component._metadata_format == metadata_format
 
     def test_output_directory_structure_creation(
-        self, extraction_config: Dict[str, Any], event_bus
+        self, initialized_component: SampleExtractorComponent, component_output_dir: Path
     ) -> None:
         """Test component creates required output directory structure.
 
@@ -392,10 +391,7 @@ class TestSampleExtractorIntegration:
         - Patches subdirectory is created
         - Structure matches expected layout
         """
-        component = SampleExtractorComponent(event_bus)
-        component.initialize(extraction_config)
-
-        output_dir = Path(extraction_config["output_dir"])
+        output_dir = component_output_dir
         patches_dir = output_dir / "patches"
 
         # Verify directories will be created during execution
@@ -404,7 +400,7 @@ class TestSampleExtractorIntegration:
         assert not patches_dir.exists()
 
     def test_metadata_validation_report_structure(
-        self, sample_aoi_geojson: Path, tmp_path: Path
+        self, single_sample_manifest: List[Dict[str, Any]], single_sample_patches_dir: Path
     ) -> None:
         """Test validation report has expected structure.
 
@@ -413,26 +409,7 @@ class TestSampleExtractorIntegration:
         - Boolean flags are correct type
         - Error/warning lists exist
         """
-        from forest_change_framework.components.export.sample_extractor.sampling import (
-            create_sample_manifest,
-            group_aois_by_year_and_bin,
-            select_stratified_samples,
-        )
-
-        with open(sample_aoi_geojson) as f:
-            geojson_data = json.load(f)
-
-        grouped = group_aois_by_year_and_bin(geojson_data)
-        selected = select_stratified_samples(grouped, samples_per_bin=1)
-        manifest = create_sample_manifest(selected)
-
-        # Create dummy TIFF files for validation
-        patches_dir = tmp_path / "patches"
-        patches_dir.mkdir()
-        for sample in manifest:
-            (patches_dir / f"{sample['sample_id']}.tif").touch()
-
-        report = validate_metadata(manifest, str(patches_dir))
+        report = validate_metadata(single_sample_manifest, str(single_sample_patches_dir))
 
         # Check report structure
         required_keys = {
@@ -454,7 +431,7 @@ class TestSampleExtractorIntegration:
         assert isinstance(report["warnings"], list)
 
     def test_validation_detects_missing_files(
-        self, sample_aoi_geojson: Path, tmp_path: Path
+        self, single_sample_manifest: List[Dict[str, Any]], tmp_path: Path
     ) -> None:
         """Test validation correctly identifies missing TIFF files.
 
@@ -463,29 +440,49 @@ class TestSampleExtractorIntegration:
         - Validation fails appropriately
         - Error messages are informative
         """
-        from forest_change_framework.components.export.sample_extractor.sampling import (
-            create_sample_manifest,
-            group_aois_by_year_and_bin,
-            select_stratified_samples,
-        )
-
-        with open(sample_aoi_geojson) as f:
-            geojson_data = json.load(f)
-
-        grouped = group_aois_by_year_and_bin(geojson_data)
-        selected = select_stratified_samples(grouped, samples_per_bin=1)
-        manifest = create_sample_manifest(selected)
-
         # Create patches directory but no TIFF files
         patches_dir = tmp_path / "patches"
         patches_dir.mkdir()
 
-        report = validate_metadata(manifest, str(patches_dir))
+        report = validate_metadata(single_sample_manifest, str(patches_dir))
 
         assert not report["valid"], "Validation should fail with missing files"
         assert len(report["missing_files"]) > 0, "Should detect missing files"
         assert len(report["errors"]) > 0, "Should report errors"
 
+    @pytest.mark.slow
+    def test_validation_of_large_manifest(self, tmp_path: Path) -> None:
+        """Test validation of a production-sized manifest against one directory.
+
+        Verifies:
+        - Every present file is found and every absent one reported
+        - Files for other samples and subdirectories are not matched
+        """
+        manifest = [
+            {
+                "sample_id": f"{i:06d}",
+                "minx": 0.0,
+                "miny": 0.0,
+                "maxx": 1.0,
+                "maxy": 1.0,
+            }
+            for i in range(1, 10001)
+        ]
+
+        # Every other sample has a patch; a directory named like a patch
+        # does not count as one
+        patches_dir = tmp_path / "patches"
+        patches_dir.mkdir()
+        _create_empty_files(patches_dir, (f"{i:06d}.tif" for i in range(1, 10001, 2)))
+        (patches_dir / "000002.tif").mkdir()
+
+        report = validate_metadata(manifest, str(patches_dir))
+
+        assert not report["valid"]
+        assert len(report["missing_files"]) == 5000
+        assert report["missing_files"][0] == str(patches_dir / "000002.tif")
+        assert not report["invalid_bboxes"]
+
     def test_validation_detects_invalid_bbox(
         self, tmp_path: Path
     ) -> None:
@@ -514,7 +511,7 @@ class TestSampleExtractorIntegration:
         # Create patches directory with dummy file
         patches_dir = tmp_path / "patches"
         patches_dir.mkdir()
-        (patches_dir / "000001.tif").touch()
+        _create_empty_files(patches_dir, ["000001.tif"])
 
         report = validate_metadata(invalid_manifest, str(patches_dir))
 
@@ -560,7 +557,7 @@ class TestSampleExtractorIntegration:
         # Create patches directory with files
         patches_dir = tmp_path / "patches"
         patches_dir.mkdir()
-        (patches_dir / "000001.tif").touch()
+        _create_empty_files(patches_dir, ["000001.tif"])
 
         report = validate_metadata(duplicate_manifest, str(patches_dir))
 
@@ -572,7 +569,7 @@ class TestSampleExtractorIntegration:
 
     def test_metadata_csv_export_format(
         self,
-        sample_aoi_geojson: Path,
+        manifest: List[Dict[str, Any]],
         tmp_path: Path,
     ) -> None:
         """Test CSV metadata export has correct format and content.
@@ -583,23 +580,9 @@ class TestSampleExtractorIntegration:
         - Data is properly formatted
         - Path references are relative
         """
-        pytest.importorskip("pandas")
-
         from forest_change_framework.components.export.sample_extractor.metadata import (
             write_metadata_csv,
         )
-        from forest_change_framework.components.export.sample_extractor.sampling import (
-            create_sample_manifest,
-            group_aois_by_year_and_bin,
-            select_stratified_samples,
-        )
-
-        with open(sample_aoi_geojson) as f:
-            geojson_data = json.load(f)
-
-        grouped = group_aois_by_year_and_bin(geojson_data)
-        selected = select_stratified_samples(grouped, samples_per_bin=2)
-        manifest = create_sample_manifest(selected)
 
         csv_path = tmp_path / "metadata.csv"
         write_metadata_csv(manifest, str(csv_path))
@@ -637,7 +620,7 @@ class TestSampleExtractorIntegration:
 
     def test_metadata_json_export_format(
         self,
-        sample_aoi_geojson: Path,
+        manifest: List[Dict[str, Any]],
         tmp_path: Path,
     ) -> None:
         """Test JSON metadata export has correct structure.
@@ -651,18 +634,6 @@ class TestSampleExtractorIntegration:
         from forest_change_framework.components.export.sample_extractor.metadata import (
             write_metadata_json,
         )
-        from forest_change_framework.components.export.sample_extractor.sampling import (
-            create_sample_manifest,
-            group_aois_by_year_and_bin,
-            select_stratified_samples,
-        )
-
-        with open(sample_aoi_geojson) as f:
-            geojson_data = json.load(f)
-
-        grouped = group_aois_by_year_and_bin(geojson_data)
-        selected = select_stratified_samples(grouped, samples_per_bin=2)
-        manifest = create_sample_manifest(selected)
 
         json_path = tmp_path / "metadata.json"
         write_metadata_json(manifest, str(json_path), patches_dir="patches")
@@ -699,7 +670,7 @@ class TestSampleExtractorIntegration:
 
     def test_manifest_sample_id_uniqueness(
         self,
-        sample_aoi_geojson: Path,
+        manifest: List[Dict[str, Any]],
     ) -> None:
         """Test manifest generation creates unique sequential sample IDs.
 
@@ -708,19 +679,6 @@ class TestSampleExtractorIntegration:
         - IDs follow sequential pattern (000001, 000002, etc.)
         - No gaps in sequence
         """
-        from forest_change_framework.components.export.sample_extractor.sampling import (
-            create_sample_manifest,
-            group_aois_by_year_and_bin,
-            select_stratified_samples,
-        )
-
-        with open(sample_aoi_geojson) as f:
-            geojson_data = json.load(f)
-
-        grouped = group_aois_by_year_and_bin(geojson_data)
-        selected = select_stratified_samples(grouped, samples_per_bin=2)
-        manifest = create_sample_manifest(selected)
-
         sample_ids = [s["sample_id"] for s in manifest]
 
         # Check uniqueness
@@ -736,7 +694,7 @@ class TestSampleExtractorIntegration:
 
     def test_year_distribution_across_samples(
         self,
-        sample_aoi_geojson: Path,
+        balanced_manifest: List[Dict[str, Any]],
     ) -> None:
         """Test samples are distributed across years for balanced temporal coverage.
 
@@ -745,27 +703,10 @@ class TestSampleExtractorIntegration:
         - Distribution attempts to balance years
         - Year information is preserved in manifest
         """
-        from forest_change_framework.components.export.sample_extractor.sampling import (
-            balance_samples_across_years,
-            create_sample_manifest,
-            group_aois_by_year_and_bin,
-            select_stratified_samples,
-        )
-
-        with open(sample_aoi_geojson) as f:
-            geojson_data = json.load(f)
-
-        grouped = group_aois_by_year_and_bin(geojson_data)
-        # Use samples_per_bin=4 to ensure multiple samples selected per bin across years
-        selected = select_stratified_samples(grouped, samples_per_bin=4)
-        balanced = balance_samples_across_years(selected, samples_per_bin=4)
-        manifest = create_sample_manifest(balanced)
+        manifest = balanced_manifest
 
         # Count samples per year
-        year_counts = {}
-        for sample in manifest:
-            year = sample["year"]
-            year_counts[year] = year_counts.get(year, 0) + 1
+        year_counts = Counter(sample["year"] for sample in manifest)
 
         # With 6 features (3 per year) and samples_per_bin=4, we should get at least 2 years
         # after stratified sampling and balancing
@@ -778,7 +719,7 @@ class TestSampleExtractorIntegration:
 
     def test_loss_bin_distribution_in_manifest(
         self,
-        sample_aoi_geojson: Path,
+        manifest: List[Dict[str, Any]],
     ) -> None:
         """Test samples represent all loss bins (if available).
 
@@ -787,25 +728,8 @@ class TestSampleExtractorIntegration:
         - Bin information is preserved
         - Distribution is relatively balanced
         """
-        from forest_change_framework.components.export.sample_extractor.sampling import (
-            create_sample_manifest,
-            group_aois_by_year_and_bin,
-            select_stratified_samples,
-        )
-
-        with open(sample_aoi_geojson) as f:
-            geojson_data = json.load(f)
-
-        grouped = group_aois_by_year_and_bin(geojson_data)
-        # Use samples_per_bin=2 to ensure we get at least 2 bins represented
-        selected = select_stratified_samples(grouped, samples_per_bin=2)
-        manifest = create_sample_manifest(selected)
-
         # Count samples per bin
-        bin_counts = {}
-        for sample in manifest:
-            bin_name = sample["loss_bin"]
-            bin_counts[bin_name] = bin_counts.get(bin_name, 0) + 1
+        bin_counts = Counter(sample["loss_bin"] for sample in manifest)
 
         # Verify at least some bins are represented
         # With 4 bins and samples_per_bin=2, we should have at least 1 bin
@@ -28,9 +28,21 @@ from forest_change_framework.components.analysis.aoi_sampler.binning import (
     get_bin_summary,
     apply_binning_and_filtering,
 )
+from forest_change_framework.components.analysis.aoi_sampler import statistics
 from forest_change_framework.core import get_registry
 
 
+@pytest.fixture(params=["c", "numpy"])
+def mask_count_impl(request, monkeypatch):
+    """Run a test against both the C and NumPy mask counters."""
+    if request.param == "c":
+        if statistics._maskcount is None:
+            pytest.skip("_maskcount extension not built")
+    else:
+        monkeypatch.setattr(statistics, "_maskcount", None)
+    return request.param
+
+
 # ============================================================================
 # Grid Utilities Tests
 # ============================================================================
@@ -92,6 +104,25 @@ class TestGridUtils:
         assert len(set(cell_ids)) == len(cell_ids)  # All unique
         assert cell_ids == list(range(count))  # Sequential from 0
 
+    def test_create_grid_cells_tile_bbox(self):
+        """Test that cells tile the bbox row by row without gaps."""
+        bbox = {"minx": 10.0, "miny": -5.0, "maxx": 12.3, "maxy": -3.1}
+        cells, count = create_grid_cells(bbox, cell_size_km=50.0)
+
+        n_cols = max(c["col"] for c in cells) + 1
+        n_rows = max(c["row"] for c in cells) + 1
+        assert count == n_rows * n_cols
+
+        for cell in cells:
+            assert cell["cell_id"] == cell["row"] * n_cols + cell["col"]
+            if cell["col"] > 0:
+                assert cell["minx"] == cells[cell["cell_id"] - 1]["maxx"]
+            if cell["row"] > 0:
+                assert cell["miny"] == cells[cell["cell_id"] - n_cols]["maxy"]
+
+        assert cells[0]["minx"] == bbox["minx"] and cells[0]["miny"] == bbox["miny"]
+        assert cells[-1]["maxx"] == bbox["maxx"] and cells[-1]["maxy"] == bbox["maxy"]
+
     def test_create_grid_cells_invalid_bbox(self):
         """Test error on invalid bbox."""
         with pytest.raises(ValueError):
@@ -187,6 +218,7 @@ class TestGridUtils:
 # ============================================================================
 
 
+@pytest.mark.usefixtures("mask_count_impl")
 class TestStatistics:
     """Tests for statistics module."""
 
@@ -256,6 +288,25 @@ class TestStatistics:
         # All loss pixels are in valid area, so 100%
         assert abs(loss_pct - 100.0) < 0.1
 
+    def test_calculate_loss_percentage_ignores_water(self):
+        """Test that only datamask value 1 counts as valid (2 is water)."""
+        lossyear = np.zeros((10, 10), dtype=np.uint8)
+        lossyear[:, :5] = 3
+        datamask = np.full((10, 10), 2, dtype=np.uint8)
+        datamask[:4, :] = 1
+
+        assert calculate_validity(datamask) == 40.0
+        assert calculate_loss_percentage(lossyear, datamask) == 50.0
+
+    def test_calculate_loss_percentage_non_contiguous(self):
+        """Test counting strided and non-uint8 bands."""
+        lossyear = np.zeros((20, 20), dtype=np.uint8)
+        lossyear[:, ::2] = 7
+        datamask = np.ones((20, 20), dtype=np.int16)
+
+        assert calculate_loss_percentage(lossyear[:, ::2], datamask[:, ::2]) == 100.0
+        assert calculate_loss_percentage(lossyear, datamask) == 50.0
+
     def test_calculate_loss_by_year(self):
         """Test loss breakdown by year."""
         lossyear = np.zeros((100, 100), dtype=np.uint8)
@@ -271,12 +322,42 @@ class TestStatistics:
         assert abs(loss_by_year[2001] - 25.0) < 0.1
         assert abs(loss_by_year[2002] - 25.0) < 0.1
 
+    def test_calculate_loss_by_year_ignores_invalid(self):
+        """Test that loss years of invalid pixels are left out."""
+        lossyear = np.zeros((10, 10), dtype=np.uint8)
+        lossyear[:5, :] = 3
+        lossyear[5:, :] = 21
+        datamask = np.ones((10, 10), dtype=np.uint8)
+        datamask[5:, :] = 0
+        datamask[0, :] = 2  # Water
+
+        loss_by_year = calculate_loss_by_year(lossyear, datamask)
+
+        assert loss_by_year == {2003: 100.0}
+
+    @pytest.mark.parametrize("dtype", [np.int16, np.float32])
+    def test_calculate_loss_by_year_non_uint8(self, dtype):
+        """Test that negative and fractional loss years match no year."""
+        lossyear = np.zeros((10, 10), dtype=dtype)
+        lossyear[:2, :] = -1  # Signed nodata
+        lossyear[2:4, :] = 3
+        lossyear[4:5, :] = 21
+        if np.issubdtype(dtype, np.floating):
+            lossyear[5:6, :] = 2.5
+        datamask = np.ones((10, 10), dtype=np.uint8)
+
+        loss_by_year = calculate_loss_by_year(lossyear, datamask)
+
+        assert loss_by_year == {2003: 20.0, 2021: 10.0}
+
     def test_calculate_treecover_stats(self):
         """Test tree cover statistics calculation."""
         treecover = np.full((100, 100), 50, dtype=np.uint8)  # All 50%
         datamask = np.ones((100, 100), dtype=np.uint8)
 
-        stats = calculate_treecover_stats(treecover, datamask)
+        stats = calculate_treecover_stats(
+            treecover, datamask, stats=("mean", "median", "std", "min", "max")
+        )
 
         assert stats["mean"] == 50.0
         assert stats["median"] == 50.0
@@ -284,6 +365,29 @@ class TestStatistics:
         assert stats["min"] == 50
         assert stats["max"] == 50
 
+    def test_calculate_treecover_stats_default_skips_median(self):
+        """Test that the median is only computed on request."""
+        treecover = np.arange(100, dtype=np.uint8).reshape(10, 10)
+        datamask = np.ones((10, 10), dtype=np.uint8)
+        datamask[9, :] = 0
+
+        stats = calculate_treecover_stats(treecover, datamask)
+
+        assert set(stats) == {"mean", "std", "min", "max"}
+        assert stats["mean"] == 44.5
+        assert stats["max"] == 89.0
+        assert calculate_treecover_stats(treecover, datamask, stats=("median",)) == {
+            "median": 44.5
+        }
+
+    def test_calculate_treecover_stats_unknown_stat(self):
+        """Test that unknown statistic names are rejected."""
+        treecover = np.full((10, 10), 50, dtype=np.uint8)
+        datamask = np.ones((10, 10), dtype=np.uint8)
+
+        with pytest.raises(ValueError, match="mode"):
+            calculate_treecover_stats(treecover, datamask, stats=("mean", "mode"))
+
     def test_calculate_cell_statistics(self):
         """Test comprehensive statistics calculation."""
         treecover = np.full((100, 100), 60, dtype=np.uint8)
@@ -302,6 +406,40 @@ class TestStatistics:
         assert stats["data_validity"] == 100.0
         assert stats["treecover"]["mean"] == 60.0
 
+    @pytest.mark.parametrize("include_loss_by_year", [True, False])
+    @pytest.mark.parametrize("dtype", [np.uint8, np.int16, np.float32])
+    def test_calculate_cell_statistics_matches_separate_calls(self, include_loss_by_year, dtype):
+        """Test that the fused cell statistics match the standalone functions."""
+        rng = np.random.default_rng(0)
+        treecover = rng.integers(0, 101, (64, 64), dtype=np.uint8)
+        lossyear = rng.integers(0, 30, (64, 64), dtype=np.uint8)  # Includes values > 21
+        datamask = rng.integers(0, 3, (64, 64), dtype=np.uint8)
+        if dtype == np.int16:
+            lossyear = lossyear.astype(np.int16) - 1  # Includes -1 nodata
+        elif dtype == np.float32:
+            lossyear = lossyear.astype(np.float32) / 2  # Includes fractional years
+
+        stats = calculate_cell_statistics(
+            treecover, lossyear, datamask, include_loss_by_year=include_loss_by_year
+        )
+
+        assert stats["loss_percentage"] == calculate_loss_percentage(lossyear, datamask)
+        assert stats["data_validity"] == calculate_validity(datamask)
+        if include_loss_by_year:
+            assert stats["loss_by_year"] == calculate_loss_by_year(lossyear, datamask)
+        else:
+            assert "loss_by_year" not in stats
+
+    def test_calculate_cell_statistics_fractional_loss_year(self):
+        """Test that a fractional lossyear still counts as loss (lossyear > 0)."""
+        lossyear = np.full((10, 10), 0.5, dtype=np.float32)
+        datamask = np.ones((10, 10), dtype=np.uint8)
+
+        stats = calculate_cell_statistics(lossyear, lossyear, datamask)
+
+        assert stats["loss_percentage"] == 100.0
+        assert stats["loss_by_year"] == {}
+
     def test_aggregate_statistics(self):
         """Test aggregation of statistics from multiple cells."""
         all_stats = [
@@ -394,6 +532,42 @@ class TestBinning:
         assert binned[1]["bin_category"] == "high"
         assert binned[2]["bin_category"] == "high"
 
+    def test_bin_aois_matches_get_bin_for_value(self):
+        """Test that bin_aois agrees with get_bin_for_value on every boundary."""
+        values = [0, 4.99, 5, 9.99, 10, 19.99, 20, 40, 99.99, 100, -1, 100.5]
+        aois = [{"loss_percentage": v} for v in values]
+        bins = [
+            {"name": "low", "min": 0, "max": 5},
+            {"name": "medium", "min": 5, "max": 10},
+            {"name": "wide", "min": 20, "max": 100},
+            {"name": "shadowed", "min": 30, "max": 50},  # "wide" matches first
+        ]
+
+        binned = bin_aois(aois, bins)
+
+        assert [a["bin_category"] for a in binned] == [
+            get_bin_for_value(v, bins) or "unclassified" for v in values
+        ]
+        assert binned[7]["bin_category"] == "wide"
+        assert "bin_category" not in aois[0]
+
+    @pytest.mark.parametrize("value", [None, "5"])
+    def test_bin_aois_rejects_non_numeric_loss(self, value):
+        """Test that non-numeric loss values raise rather than being coerced."""
+        aois = [{"loss_percentage": 5}, {"loss_percentage": value}]
+        bins = [{"name": "any", "min": 0, "max": 100}]
+
+        with pytest.raises(TypeError, match="loss_percentage"):
+            bin_aois(aois, bins)
+
+    @pytest.mark.parametrize("value", [None, "90"])
+    def test_filter_by_validity_rejects_non_numeric_validity(self, value):
+        """Test that non-numeric validity values raise rather than being coerced."""
+        aois = [{"data_validity": 90}, {"data_validity": value}]
+
+        with pytest.raises(TypeError, match="data_validity"):
+            filter_by_validity(aois, validity_threshold=0.8)
+
     def test_filter_by_validity(self):
         """Test filtering AOIs by validity threshold."""
         aois = [
@@ -494,36 +494,48 @@ class TestWriteMetadataCsv:
             assert df.iloc[0]["sample_id"] == "000001"
             assert df.iloc[1]["sample_id"] == "000002"
 
-    def test_missing_pandas_raises_error(self):
-        """Test that ImportError is raised if pandas not available."""
-        manifest = []
+    def test_does_not_require_pandas(self):
+        """Test that CSV export works without pandas installed."""
+        manifest = [{"sample_id": "000001", "aoi_id": "cell_001", "year": 2010}]
 
         # Save the original pandas module
+        import csv
         import sys
 
         original_pandas = sys.modules.get("pandas")
         try:
-            # Temporarily remove pandas from sys.modules and set it to None in the metadata module
+            # Make pandas unimportable and reload the metadata module
             sys.modules["pandas"] = None
-            # Reload the metadata module to pick up the None pandas
             import importlib
 
             import forest_change_framework.components.export.sample_extractor.metadata as metadata_module
 
             importlib.reload(metadata_module)
-            with pytest.raises(ImportError, match="pandas required"):
-                metadata_module.write_metadata_csv(manifest, "dummy.csv")
+            with tempfile.TemporaryDirectory() as tmpdir:
+                output_path = Path(tmpdir) / "metadata.csv"
+                metadata_module.write_metadata_csv(manifest, str(output_path))
+
+                with open(output_path, newline="") as f:
+                    rows = list(csv.DictReader(f))
         finally:
             # Restore pandas
             if original_pandas is not None:
                 sys.modules["pandas"] = original_pandas
-            # Reload again to restore pandas
+            else:
+                sys.modules.pop("pandas", None)
+            # Reload again to restore the module
             import importlib
 
             import forest_change_framework.components.export.sample_extractor.metadata as metadata_module
 
             importlib.reload(metadata_module)
 
+        assert len(rows) == 1
+        assert rows[0]["sample_id"] == "000001"
+        assert rows[0]["year"] == "2010"
+        assert rows[0]["minx"] == ""
+        assert rows[0]["tiff_path"] == "patches/000001.tif"
+
 
 class TestValidateMetadata:
     """Tests for validate_metadata function."""
@@ -605,6 +617,29 @@ class TestValidateMetadata:
             assert report["valid"] is False
             assert len(report["duplicate_ids"]) == 1
 
+    def test_missing_patches_directory(self):
+        """Test that a missing patches directory reports every file as missing."""
+        manifest = [
+            {
+                "sample_id": "000001",
+                "aoi_id": "cell_001",
+                "year": 2010,
+                "loss_bin": "low_loss",
+                "minx": -60.5,
+                "miny": -10.2,
+                "maxx": -60.4,
+                "maxy": -10.1,
+                "loss_percentage": 5.0,
+            }
+        ]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            patches_dir = Path(tmpdir) / "patches"
+            report = validate_metadata(manifest, str(patches_dir))
+
+            assert report["valid"] is False
+            assert report["missing_files"] == [str(patches_dir / "000001.tif")]
+
     def test_valid_manifest_passes(self):
         """Test that valid manifest passes validation."""
         manifest = [
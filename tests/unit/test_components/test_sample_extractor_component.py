@@ -281,8 +281,6 @@ class TestSampleExtractorComponentMetadataFormats:
 
     def test_write_metadata_csv_only(self, event_bus):
         """Test writing CSV metadata only."""
-        pytest.importorskip("pandas")
-
         with tempfile.TemporaryDirectory() as tmpdir:
             aoi_path = Path(tmpdir) / "aoi.geojson"
             aoi_path.write_text('{"features": []}')
@@ -359,8 +357,6 @@ class TestSampleExtractorComponentMetadataFormats:
 
     def test_write_metadata_both(self, event_bus):
         """Test writing both CSV and JSON metadata."""
-        pytest.importorskip("pandas")
-
         with tempfile.TemporaryDirectory() as tmpdir:
             aoi_path = Path(tmpdir) / "aoi.geojson"
             aoi_path.write_text('{"features": []}')
@@ -420,8 +416,6 @@ class TestSampleExtractorComponentWorkflow:
     )
     def test_execute_workflow_with_mock(self, mock_validate, mock_extract, event_bus):
         """Test execute() workflow with mocked patch extraction."""
-        pytest.importorskip("pandas")
-
         with tempfile.TemporaryDirectory() as tmpdir:
             # Setup
             aoi_geojson = {
@@ -492,8 +486,6 @@ class TestSampleExtractorComponentWorkflow:
 
     def test_execute_with_empty_geojson(self, event_bus):
         """Test execute with empty GeoJSON (no samples selected)."""
-        pytest.importorskip("pandas")
-
         with tempfile.TemporaryDirectory() as tmpdir:
             aoi_path = Path(tmpdir) / "aoi.geojson"
             aoi_path.write_text('{"features": []}')
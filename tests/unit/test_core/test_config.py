@@ -177,6 +177,13 @@ class TestConfigManager:
         result = manager.validate(schema)
         assert result is True
 
+    def test_validate_optional_key_checks_type_when_present(self, sample_config):
+        """Test an optional key is still type checked when present."""
+        manager = ConfigManager.from_dict(sample_config)
+
+        with pytest.raises(ConfigError):
+            manager.validate({"database.host?": int})
+
     def test_empty_config(self):
         """Test working with empty configuration."""
         manager = ConfigManager()
@@ -142,6 +142,18 @@ class TestComponentRegistry:
         assert "comp1" in comps["analysis"]
         assert "comp2" in comps["analysis"]
 
+    def test_list_components_by_category_only_returns_that_category(
+        self, clean_registry, mock_component_class
+    ):
+        """Test that filtering by category excludes other categories."""
+        registry = clean_registry
+
+        registry.register(mock_component_class, "comp1", "analysis")
+        registry.register(mock_component_class, "comp2", "preprocessing")
+
+        assert registry.list_components("analysis") == {"analysis": ["comp1"]}
+        assert registry.list_components("missing") == {"missing": []}
+
     def test_list_categories(self, clean_registry, mock_component_class):
         """Test listing all categories."""
         registry = clean_registry
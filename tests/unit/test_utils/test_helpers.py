@@ -0,0 +1,287 @@
+"""
+Unit tests for helper utilities.
+
+Tests dictionary manipulation and file loading helpers.
+"""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from forest_change_framework.utils import (
+    deep_merge,
+    ensure_directory,
+    flatten_dict,
+    get_file_extension,
+    load_json,
+    load_yaml,
+    sanitize_path,
+)
+from forest_change_framework.utils import helpers
+
+
+@pytest.fixture(params=["c", "python"])
+def deep_merge_impl(request, monkeypatch):
+    """Run a test against both the C and pure-Python deep_merge."""
+    if request.param == "c":
+        if helpers._c_deep_merge is None:
+            pytest.skip("_deepops extension not built")
+    else:
+        monkeypatch.setattr(helpers, "_c_deep_merge", None)
+    return request.param
+
+
+@pytest.mark.unit
+@pytest.mark.usefixtures("deep_merge_impl")
+class TestDeepMerge:
+    """Test deep_merge functionality."""
+
+    def test_merges_nested_dicts(self):
+        """Test nested dictionaries are merged key by key."""
+        base = {"db": {"host": "localhost", "port": 5432}, "debug": False}
+        override = {"db": {"port": 3306}, "debug": True}
+
+        result = deep_merge(base, override)
+
+        assert result == {"db": {"host": "localhost", "port": 3306}, "debug": True}
+
+    def test_does_not_mutate_inputs(self):
+        """Test neither input dictionary is modified."""
+        base = {"a": {"b": {"c": 1}}}
+        override = {"a": {"b": {"d": 2}}}
+
+        result = deep_merge(base, override)
+
+        assert result == {"a": {"b": {"c": 1, "d": 2}}}
+        assert base == {"a": {"b": {"c": 1}}}
+        assert override == {"a": {"b": {"d": 2}}}
+
+    def test_non_dict_value_replaces_dict(self):
+        """Test a non-dict override replaces a nested dict."""
+        result = deep_merge({"a": {"b": 1}}, {"a": 5})
+        assert result == {"a": 5}
+
+    def test_empty_override_returns_copy(self):
+        """Test merging an empty dict returns an equal but distinct dict."""
+        base = {"a": 1}
+
+        result = deep_merge(base, {})
+
+        assert result == base
+        assert result is not base
+
+    def test_dict_subclass_not_merged(self):
+        """Test dict subclasses replace rather than merge, in both implementations."""
+        from collections import OrderedDict
+
+        result = deep_merge({"a": {"x": 1}}, {"a": OrderedDict(y=2)})
+
+        assert result == {"a": OrderedDict(y=2)}
+        assert type(result["a"]) is OrderedDict
+
+    def test_deeply_nested_merge(self):
+        """Test merging configs nested deeper than the recursion limit."""
+        depth = 2000
+        base = leaf_base = {}
+        override = leaf_override = {}
+        for _ in range(depth):
+            leaf_base["n"] = {}
+            leaf_override["n"] = {}
+            leaf_base = leaf_base["n"]
+            leaf_override = leaf_override["n"]
+        leaf_base["a"] = 1
+        leaf_override["b"] = 2
+
+        result = deep_merge(base, override)
+
+        node = result
+        for _ in range(depth):
+            node = node["n"]
+        assert node == {"a": 1, "b": 2}
+
+
+@pytest.mark.unit
+class TestFlattenDict:
+    """Test flatten_dict functionality."""
+
+    def test_flattens_with_dot_notation(self):
+        """Test nested keys are joined with dots in depth-first order."""
+        nested = {"db": {"host": "localhost", "port": 5432}, "debug": True}
+
+        result = flatten_dict(nested)
+
+        assert list(result.items()) == [
+            ("db.host", "localhost"),
+            ("db.port", 5432),
+            ("debug", True),
+        ]
+
+    def test_custom_separator_and_prefix(self):
+        """Test separator and parent key prefix are applied."""
+        result = flatten_dict({"a": {"b": {"c": 1}}}, parent_key="root", sep="/")
+        assert result == {"root/a/b/c": 1}
+
+    def test_empty_nested_dict_is_dropped(self):
+        """Test an empty nested dict produces no keys."""
+        assert flatten_dict({"a": {}, "b": 1}) == {"b": 1}
+
+
+@pytest.mark.unit
+class TestSanitizePath:
+    """Test sanitize_path functionality."""
+
+    def test_collapses_parent_references(self):
+        """Test .. components are removed."""
+        assert sanitize_path("/var/data/../log/app.log") == os.path.normpath("/var/log/app.log")
+
+    def test_relative_path_made_absolute(self, tmp_path, monkeypatch):
+        """Test a relative path is anchored at the working directory."""
+        monkeypatch.chdir(tmp_path)
+        assert sanitize_path("sub/../file.txt") == str(tmp_path / "file.txt")
+
+    def test_strict_resolves_symlinks(self, tmp_path):
+        """Test strict mode follows symlinks while the default does not."""
+        target = tmp_path / "target"
+        target.mkdir()
+        link = tmp_path / "link"
+        link.symlink_to(target)
+
+        assert sanitize_path(str(link)) == str(link)
+        assert sanitize_path(str(link), strict=True) == str(target.resolve())
+
+
+@pytest.mark.unit
+class TestLoadJson:
+    """Test load_json functionality."""
+
+    def test_loads_json(self, temp_json_config, sample_config):
+        """Test loading a JSON file."""
+        assert load_json(temp_json_config) == sample_config
+
+    def test_missing_file_raises_error(self, tmp_path):
+        """Test loading a nonexistent file raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError, match="File not found"):
+            load_json(str(tmp_path / "missing.json"))
+
+    def test_invalid_json_raises_error(self, tmp_path):
+        """Test loading invalid JSON raises JSONDecodeError."""
+        bad = tmp_path / "bad.json"
+        bad.write_text("{invalid")
+        with pytest.raises(json.JSONDecodeError):
+            load_json(str(bad))
+
+
+@pytest.mark.unit
+class TestLoadYaml:
+    """Test load_yaml functionality."""
+
+    def test_loads_yaml(self, temp_yaml_config, sample_config):
+        """Test loading a YAML file."""
+        assert load_yaml(temp_yaml_config) == sample_config
+
+    def test_missing_file_raises_error(self, tmp_path):
+        """Test loading a nonexistent file raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            load_yaml(str(tmp_path / "missing.yaml"))
+
+    def test_empty_file_returns_empty_dict(self, tmp_path):
+        """Test an empty YAML file loads as an empty dict."""
+        empty = tmp_path / "empty.yaml"
+        empty.write_text("")
+        assert load_yaml(str(empty)) == {}
+
+    def test_returns_independent_copies(self, temp_yaml_config):
+        """Test mutating a loaded config does not affect later loads."""
+        first = load_yaml(temp_yaml_config)
+        first["database"]["host"] = "changed"
+
+        second = load_yaml(temp_yaml_config)
+
+        assert second["database"]["host"] == "localhost"
+
+    def test_reloads_after_file_changes(self, tmp_path):
+        """Test a rewritten file is parsed again."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("value: 1\n")
+        assert load_yaml(str(config_file)) == {"value": 1}
+
+        config_file.write_text("value: 22\n")
+        assert load_yaml(str(config_file)) == {"value": 22}
+
+    def test_json_sidecar_is_written_and_used(self, tmp_path):
+        """Test the JSON sidecar is created and preferred while fresh."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("db:\n  host: localhost\n")
+        sidecar = tmp_path / "config.yaml.json"
+
+        assert load_yaml(str(config_file), json_sidecar=True) == {"db": {"host": "localhost"}}
+        assert json.loads(sidecar.read_text()) == {"db": {"host": "localhost"}}
+
+        # A sidecar newer than the YAML file is trusted as-is
+        sidecar.write_text('{"db": {"host": "from-sidecar"}}')
+        os.utime(sidecar, ns=(config_file.stat().st_mtime_ns + 10**9,) * 2)
+        config_file.write_text("db:\n  host: localhost\n\n")
+        os.utime(config_file, ns=(sidecar.stat().st_mtime_ns - 10**9,) * 2)
+
+        assert load_yaml(str(config_file), json_sidecar=True) == {"db": {"host": "from-sidecar"}}
+
+    def test_json_sidecar_skipped_for_non_json_content(self, tmp_path):
+        """Test YAML with non-JSON types is not written to a sidecar."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("1: one\n")
+
+        assert load_yaml(str(config_file), json_sidecar=True) == {1: "one"}
+        assert not (tmp_path / "config.yaml.json").exists()
+
+    def test_no_sidecar_by_default(self, temp_yaml_config):
+        """Test no sidecar is written unless requested."""
+        load_yaml(temp_yaml_config)
+        assert not os.path.exists(temp_yaml_config + ".json")
+
+
+@pytest.mark.unit
+class TestEnsureDirectory:
+    """Test ensure_directory functionality."""
+
+    def test_creates_nested_directory(self, tmp_path):
+        """Test missing parents are created."""
+        target = tmp_path / "a" / "b" / "c"
+
+        assert ensure_directory(str(target)) == str(target)
+        assert target.is_dir()
+
+    def test_repeated_calls_are_idempotent(self, tmp_path):
+        """Test ensuring the same directory twice succeeds."""
+        target = str(tmp_path / "logs")
+        ensure_directory(target)
+        assert ensure_directory(target) == target
+
+
+@pytest.mark.unit
+class TestGetFileExtension:
+    """Test get_file_extension functionality."""
+
+    @pytest.mark.parametrize(
+        "filepath, expected",
+        [
+            ("data.csv", ".csv"),
+            ("README", ""),
+            ("archive.tar.gz", ".gz"),
+            ("/var/data.d/file", ""),
+            (".bashrc", ""),
+            ("dir/.bashrc", ""),
+            ("file.", ""),
+            ("..", ""),
+            ("x.csv/", ".csv"),
+            ("dir.d/", ".d"),
+            ("/var/dir.d//", ".d"),
+            ("/", ""),
+            ("", ""),
+        ],
+    )
+    def test_matches_pathlib_suffix(self, filepath, expected):
+        """Test results agree with pathlib's suffix rules."""
+        assert get_file_extension(filepath) == expected
+        assert get_file_extension(filepath) == Path(filepath).suffix
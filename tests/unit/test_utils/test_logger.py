@@ -0,0 +1,64 @@
+"""
+Unit tests for logging utilities.
+"""
+
+import pytest
+
+from forest_change_framework.utils import LoggerMixin, setup_logging
+from forest_change_framework.utils.logger import ListenerQueueHandler
+
+
+@pytest.mark.unit
+class TestSetupLogging:
+    """Test setup_logging functionality."""
+
+    def test_file_logging_through_queue(self, tmp_path):
+        """Test file records are written by the queue listener."""
+        log_file = tmp_path / "logs" / "app.log"
+        logger = setup_logging("tests.setup_logging.file", log_file=str(log_file))
+        try:
+            queue_handlers = [h for h in logger.handlers if isinstance(h, ListenerQueueHandler)]
+            assert len(queue_handlers) == 1
+
+            logger.info("written in the background")
+            queue_handlers[0].stop()
+
+            content = log_file.read_text()
+            assert "INFO - written in the background" in content
+        finally:
+            for handler in list(logger.handlers):
+                logger.removeHandler(handler)
+                handler.close()
+
+
+@pytest.mark.unit
+class TestLoggerMixin:
+    """Test LoggerMixin functionality."""
+
+    def test_logger_named_after_class(self):
+        """Test the logger name is module plus class name."""
+
+        class Worker(LoggerMixin):
+            pass
+
+        assert Worker().logger.name == f"{__name__}.Worker"
+
+    def test_logger_shared_by_instances(self):
+        """Test instances of one class get the same logger."""
+
+        class Worker(LoggerMixin):
+            pass
+
+        assert Worker().logger is Worker().logger
+
+    def test_subclass_gets_own_logger(self):
+        """Test a subclass does not reuse its parent's cached logger."""
+
+        class Parent(LoggerMixin):
+            pass
+
+        class Child(Parent):
+            pass
+
+        assert Parent().logger.name.endswith(".Parent")
+        assert Child().logger.name.endswith(".Child")
@@ -0,0 +1,137 @@
+"""
+Unit tests for validation utilities.
+
+Tests path, configuration, component and value validators.
+"""
+
+import pytest
+
+from forest_change_framework.core import ValidationError
+from forest_change_framework.utils import (
+    validate_component_interface,
+    validate_config,
+    validate_email,
+    validate_path,
+)
+
+
+@pytest.mark.unit
+class TestValidatePath:
+    """Test validate_path functionality."""
+
+    def test_existing_file(self, tmp_path):
+        """Test an existing file passes the file check."""
+        data = tmp_path / "data.csv"
+        data.write_text("a,b\n")
+        assert validate_path(str(data), must_exist=True, is_file=True) == str(data)
+
+    def test_existing_directory(self, tmp_path):
+        """Test an existing directory passes the directory check."""
+        assert validate_path(str(tmp_path), must_exist=True, is_dir=True) == str(tmp_path)
+
+    def test_missing_path_raises_error(self, tmp_path):
+        """Test a missing path raises ValidationError when required."""
+        with pytest.raises(ValidationError, match="does not exist"):
+            validate_path(str(tmp_path / "missing"), must_exist=True)
+
+    def test_directory_is_not_a_file(self, tmp_path):
+        """Test a directory fails the file check."""
+        with pytest.raises(ValidationError, match="not a file"):
+            validate_path(str(tmp_path), must_exist=True, is_file=True)
+
+    def test_file_is_not_a_directory(self, tmp_path):
+        """Test a file fails the directory check."""
+        data = tmp_path / "data.csv"
+        data.write_text("")
+        with pytest.raises(ValidationError, match="not a directory"):
+            validate_path(str(data), must_exist=True, is_dir=True)
+
+    def test_returns_normalized_path(self, tmp_path):
+        """Test the returned path is normalized."""
+        (tmp_path / "sub").mkdir()
+        raw = f"{tmp_path}/sub/../sub/./"
+        assert validate_path(raw, must_exist=True, is_dir=True) == str(tmp_path / "sub")
+
+    def test_missing_path_allowed_without_must_exist(self, tmp_path):
+        """Test existence is not checked unless requested."""
+        missing = str(tmp_path / "missing")
+        assert validate_path(missing) == missing
+
+
+@pytest.mark.unit
+class TestValidateEmail:
+    """Test validate_email functionality."""
+
+    def test_valid_email(self):
+        """Test a well-formed address passes."""
+        assert validate_email("user.name+tag@example.co.uk") is True
+
+    @pytest.mark.parametrize("email", ["user@", "user@example", "@example.com", "user example.com"])
+    def test_invalid_email_raises_error(self, email):
+        """Test malformed addresses raise ValidationError."""
+        with pytest.raises(ValidationError):
+            validate_email(email)
+
+    def test_trailing_newline_rejected(self):
+        """Test an address with a trailing newline is rejected."""
+        with pytest.raises(ValidationError):
+            validate_email("user@example.com\n")
+
+
+@pytest.mark.unit
+class TestValidateConfig:
+    """Test validate_config functionality."""
+
+    def test_valid_config(self):
+        """Test a config matching the schema passes."""
+        schema = {"host": str, "port": int, "debug?": bool}
+        assert validate_config({"host": "localhost", "port": 5432}, schema) is True
+
+    def test_missing_required_key_raises_error(self):
+        """Test a missing required key raises ValidationError."""
+        with pytest.raises(ValidationError, match="host"):
+            validate_config({"port": 5432}, {"host": str, "port": int})
+
+    def test_optional_key_type_checked_when_present(self):
+        """Test an optional key is type checked if present."""
+        with pytest.raises(ValidationError, match="debug"):
+            validate_config({"debug": "yes"}, {"debug?": bool})
+
+    def test_only_one_question_mark_stripped(self):
+        """Test only a single trailing ? marks a key optional."""
+        assert validate_config({"what?": 1}, {"what??": int}) is True
+        with pytest.raises(ValidationError, match="what"):
+            validate_config({"what?": "x"}, {"what??": int})
+
+    def test_schema_reused_across_calls(self):
+        """Test the same schema validates many configs consistently."""
+        schema = {"port": int, "debug?": bool}
+        for port in range(5):
+            assert validate_config({"port": port}, schema) is True
+        with pytest.raises(ValidationError):
+            validate_config({"port": "80"}, schema)
+
+    def test_mutated_schema_is_renormalized(self):
+        """Test changes to a previously used schema take effect."""
+        schema = {"port": int}
+        assert validate_config({"port": 80}, schema) is True
+
+        schema["host"] = str
+
+        with pytest.raises(ValidationError, match="host"):
+            validate_config({"port": 80}, schema)
+
+
+@pytest.mark.unit
+class TestValidateComponentInterface:
+    """Test validate_component_interface functionality."""
+
+    def test_valid_component(self, mock_component_class, event_bus):
+        """Test a BaseComponent subclass passes, repeatedly."""
+        assert validate_component_interface(mock_component_class(event_bus)) is True
+        assert validate_component_interface(mock_component_class(event_bus)) is True
+
+    def test_non_component_raises_error(self):
+        """Test an object not derived from BaseComponent is rejected."""
+        with pytest.raises(ValidationError, match="BaseComponent"):
+            validate_component_interface(object())